@@ -616,6 +616,112 @@ static PyTypeObject DecimalResultProcessorType = {
     0,                                          /* tp_new */
 };
 
+/* Apply a sequence of processors, one per column, to a sequence of rows,
+   returning a list of tuples of processed values.  Processors implemented
+   in C as METH_O functions or methods, such as those of this module, are
+   invoked directly rather than through the generic call machinery. */
+static PyObject *
+process_rows(PyObject *self, PyObject *args)
+{
+    PyObject *rows, *processors, *processor, *row, *value;
+    PyObject *procs_fast = NULL, *rows_fast = NULL, *row_fast = NULL;
+    PyObject *result = NULL, *new_row;
+    PyCFunction *funcs = NULL;
+    PyObject **targets = NULL;
+    Py_ssize_t num_procs, num_rows, i, j;
+
+    if (!PyArg_UnpackTuple(args, "process_rows", 2, 2, &rows, &processors))
+        return NULL;
+
+    procs_fast = PySequence_Fast(processors, "processors must be a sequence");
+    if (procs_fast == NULL)
+        return NULL;
+    num_procs = PySequence_Fast_GET_SIZE(procs_fast);
+
+    funcs = PyMem_New(PyCFunction, num_procs + 1);
+    targets = PyMem_New(PyObject *, num_procs + 1);
+    if (funcs == NULL || targets == NULL) {
+        PyErr_NoMemory();
+        goto error;
+    }
+
+    /* resolve each processor once: a C function pointer with its "self"
+       argument, a callable to be called generically, or NULL for no
+       processing */
+    for (i = 0; i < num_procs; i++) {
+        processor = PySequence_Fast_GET_ITEM(procs_fast, i);
+        if (processor == Py_None) {
+            funcs[i] = NULL;
+            targets[i] = NULL;
+        } else if (PyCFunction_Check(processor) &&
+                   PyCFunction_GET_FLAGS(processor) == METH_O) {
+            funcs[i] = PyCFunction_GET_FUNCTION(processor);
+            targets[i] = PyCFunction_GET_SELF(processor);
+        } else {
+            funcs[i] = NULL;
+            targets[i] = processor;
+        }
+    }
+
+    rows_fast = PySequence_Fast(rows, "rows must be a sequence");
+    if (rows_fast == NULL)
+        goto error;
+    num_rows = PySequence_Fast_GET_SIZE(rows_fast);
+
+    result = PyList_New(num_rows);
+    if (result == NULL)
+        goto error;
+
+    for (i = 0; i < num_rows; i++) {
+        row = PySequence_Fast_GET_ITEM(rows_fast, i);
+        row_fast = PySequence_Fast(row, "row must be a sequence");
+        if (row_fast == NULL)
+            goto error;
+        if (PySequence_Fast_GET_SIZE(row_fast) != num_procs) {
+            PyErr_Format(PyExc_ValueError,
+                         "row has %d columns; %d processors were given",
+                         (int)PySequence_Fast_GET_SIZE(row_fast),
+                         (int)num_procs);
+            goto error;
+        }
+
+        new_row = PyTuple_New(num_procs);
+        if (new_row == NULL)
+            goto error;
+        PyList_SET_ITEM(result, i, new_row);
+
+        for (j = 0; j < num_procs; j++) {
+            value = PySequence_Fast_GET_ITEM(row_fast, j);
+            if (funcs[j] != NULL) {
+                value = funcs[j](targets[j], value);
+            } else if (targets[j] != NULL) {
+                value = PyObject_CallFunctionObjArgs(targets[j], value, NULL);
+            } else {
+                Py_INCREF(value);
+            }
+            if (value == NULL)
+                goto error;
+            PyTuple_SET_ITEM(new_row, j, value);
+        }
+        Py_CLEAR(row_fast);
+    }
+
+    PyMem_Free(funcs);
+    PyMem_Free(targets);
+    Py_DECREF(procs_fast);
+    Py_DECREF(rows_fast);
+    return result;
+
+ error:
+    PyMem_Free(funcs);
+    PyMem_Free(targets);
+    Py_DECREF(procs_fast);
+    Py_XDECREF(rows_fast);
+    Py_XDECREF(row_fast);
+    Py_XDECREF(result);
+    return NULL;
+}
+
 static PyMethodDef module_methods[] = {
     {"int_to_boolean", int_to_boolean, METH_O,
      "Convert an integer to a boolean."},
@@ -629,6 +735,8 @@ static PyMethodDef module_methods[] = {
      "Convert an ISO string to a datetime.time object."},
     {"str_to_date", str_to_date, METH_O,
      "Convert an ISO string to a datetime.date object."},
+    {"process_rows", process_rows, METH_VARARGS,
+     "Apply a list of column processors to a list of rows."},
     {NULL, NULL, 0, NULL}        /* Sentinel */
 };
 
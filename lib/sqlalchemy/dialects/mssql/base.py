@@ -1064,7 +1064,7 @@ class MSExecutionContext(default.DefaultExecutionContext):
         if self._result_proxy:
             return self._result_proxy
         else:
-            return engine.ResultProxy(self)
+            return super(MSExecutionContext, self).get_result_proxy()
 
 
 class MSSQLCompiler(compiler.SQLCompiler):
@@ -1593,6 +1593,7 @@ class MSDialect(default.DefaultDialect):
     supports_native_boolean = False
     supports_unicode_binds = True
     postfetch_lastrowid = True
+    max_bind_parameters = 2100
 
     server_version_info = ()
 
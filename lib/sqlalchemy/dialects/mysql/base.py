@@ -1450,12 +1450,13 @@ class MySQLDialect(default.DefaultDialect):
     ]
 
     def __init__(self, isolation_level=None, json_serializer=None,
-                 json_deserializer=None, **kwargs):
+                 json_deserializer=None, json_deferred=False, **kwargs):
         kwargs.pop('use_ansiquotes', None)   # legacy
         default.DefaultDialect.__init__(self, **kwargs)
         self.isolation_level = isolation_level
         self._json_serializer = json_serializer
         self._json_deserializer = json_deserializer
+        self._json_deferred = json_deferred
 
     def on_connect(self):
         if self.isolation_level is not None:
@@ -46,7 +46,10 @@ class JSON(sqltypes.JSON):
             ):
                 return None
 
-            serialized = json_serializer(value)
+            if isinstance(value, sqltypes.DeferredJSON):
+                serialized = value.raw
+            else:
+                serialized = json_serializer(value)
             if string_process:
                 serialized = string_process(serialized)
             return serialized
@@ -57,12 +60,20 @@ class JSON(sqltypes.JSON):
         string_process = self._str_impl.result_processor(dialect, coltype)
         json_deserializer = dialect._json_deserializer or json.loads
 
-        def process(value):
-            if value is None:
-                return None
-            if string_process:
-                value = string_process(value)
-            return json_deserializer(value)
+        if dialect._json_deferred:
+            def process(value):
+                if value is None:
+                    return None
+                if string_process:
+                    value = string_process(value)
+                return sqltypes.DeferredJSON(value, json_deserializer)
+        else:
+            def process(value):
+                if value is None:
+                    return None
+                if string_process:
+                    value = string_process(value)
+                return json_deserializer(value)
         return process
 
 
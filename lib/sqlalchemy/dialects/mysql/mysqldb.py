@@ -38,6 +38,37 @@ using a URL like the following::
 
     mysql+mysqldb://root@/<dbname>?unix_socket=/cloudsql/<projectid>:<instancename>
 
+.. _mysqldb_server_side_cursors:
+
+Server Side Cursors
+-------------------
+
+By default, MySQLdb reads the full set of rows returned by a statement
+into memory when the statement is executed.  The ``stream_results=True``
+execution option instead uses MySQLdb's ``SSCursor``, which leaves rows on
+the server and reads them as they're fetched, in batches determined by
+the :class:`.BufferedRowResultProxy`::
+
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True).\
+            execute(table.select())
+        for row in result:
+            process(row)
+
+The ``server_side_cursors=True`` flag passed to :func:`.create_engine`
+uses server side cursors for all SELECT statements, unless the
+``stream_results=False`` execution option is given.
+
+MySQL can't process another statement on a connection until all the rows
+of a server side cursor have been read; while a streamed result is
+pending, executing another statement on the same :class:`.Connection`
+raises an error, and the result must first be fully fetched or closed.
+A pending server side cursor is closed when the connection is rolled
+back, including when it's returned to the connection pool.  The same
+applies to the PyMySQL dialect.
+
+.. versionadded:: 1.1
+
 """
 
 from .base import (MySQLDialect, MySQLExecutionContext,
@@ -45,17 +76,35 @@ from .base import (MySQLDialect, MySQLExecutionContext,
 from .base import TEXT
 from ... import sql
 from ... import util
+from ... import exc
+from ...engine import result as _result
 import re
+import weakref
 
 
 class MySQLExecutionContext_mysqldb(MySQLExecutionContext):
 
-    @property
-    def rowcount(self):
-        if hasattr(self, '_rowcount'):
-            return self._rowcount
+    _is_server_side = False
+
+    def create_cursor(self):
+        self._is_server_side = self._use_server_side_cursor()
+        if self._is_server_side:
+            cursor = self._dbapi_connection.cursor(
+                self.dialect._sscursor)
+            self._dbapi_connection.info['mysqldb_server_side_cursor'] = \
+                weakref.ref(cursor)
+        else:
+            cursor = self._dbapi_connection.cursor()
+        if self.execution_options or self.dialect._sets_cursor_options:
+            self._set_cursor_options(cursor)
+        return cursor
+
+    def get_result_proxy(self):
+        if self._is_server_side:
+            return _result.BufferedRowResultProxy(self)
         else:
-            return self.cursor.rowcount
+            return super(MySQLExecutionContext_mysqldb, self).\
+                get_result_proxy()
 
 
 class MySQLCompiler_mysqldb(MySQLCompiler):
@@ -87,10 +136,48 @@ class MySQLDialect_mysqldb(MySQLDialect):
     statement_compiler = MySQLCompiler_mysqldb
     preparer = MySQLIdentifierPreparer_mysqldb
 
+    def __init__(self, server_side_cursors=False, **kwargs):
+        super(MySQLDialect_mysqldb, self).__init__(**kwargs)
+        self.server_side_cursors = server_side_cursors
+
     @classmethod
     def dbapi(cls):
         return __import__('MySQLdb')
 
+    @util.memoized_property
+    def _sscursor(self):
+        return self.dbapi.cursors.SSCursor
+
+    def _pending_server_side_cursor(self, info):
+        """Return the server side cursor of a connection, given its
+        ``info`` dictionary, if its rows haven't been fully read."""
+
+        ref = info.get('mysqldb_server_side_cursor')
+        if ref is not None:
+            cursor = ref()
+            # the driver's cursor.close() reads any remaining rows
+            # and sets cursor.connection to None
+            if cursor is not None and cursor.connection is not None:
+                return cursor
+            del info['mysqldb_server_side_cursor']
+        return None
+
+    def _pre_execute_check(self, connection):
+        # checked ahead of the execution, as an error raised from within
+        # it would roll back the connection, closing the pending cursor
+        if self._pending_server_side_cursor(
+                connection.connection.info) is not None:
+            raise exc.InvalidRequestError(
+                "Can't execute a statement on this connection while the "
+                "rows of a server side cursor are pending; fetch all rows "
+                "from the streamed result or close it first.")
+
+    def do_rollback(self, dbapi_connection):
+        cursor = self._pending_server_side_cursor(dbapi_connection.info)
+        if cursor is not None:
+            cursor.close()
+        super(MySQLDialect_mysqldb, self).do_rollback(dbapi_connection)
+
     def do_executemany(self, cursor, statement, parameters, context=None):
         rowcount = cursor.executemany(statement, parameters)
         if context is not None:
@@ -30,7 +30,8 @@ on the URL, or as keyword arguments to :func:`.create_engine()` are:
 * ``arraysize`` - set the cx_oracle.arraysize value on cursors, defaulted
   to 50.  This setting is significant with cx_Oracle as the contents of LOB
   objects are only readable within a "live" row (e.g. within a batch of
-  50 rows).
+  50 rows).  May also be set for a particular statement using the
+  ``arraysize`` execution option.
 
 * ``auto_convert_lobs`` - defaults to True; See :ref:`cx_oracle_lob`.
 
@@ -57,6 +58,12 @@ on the URL, or as keyword arguments to :func:`.create_engine()` are:
   alternatively an integer value.  This value is only available as a URL query
   string argument.
 
+* ``prefetch_rows`` - set the cx_oracle.prefetchrows value on cursors,
+  available with cx_Oracle 8 and above.  May also be set for a particular
+  statement using the ``prefetch_rows`` execution option.
+
+  .. versionadded:: 1.1
+
 * ``threaded`` - enable multithreaded access to cx_oracle connections.
   Defaults to ``True``.  Note that this is the opposite default of the
   cx_Oracle DBAPI itself.
@@ -182,6 +189,24 @@ unconditionally by SQLAlchemy, and the linkage to a live cursor is broken.
 To disable this processing, pass ``auto_convert_lobs=False`` to
 :func:`.create_engine()`.
 
+A BLOB may instead be read in chunks using the ``as_stream`` flag of
+:class:`.LargeBinary`, in which case the value of the column is a
+read-only, file-like object that reads from the LOB as it's consumed::
+
+    Column('data', LargeBinary(as_stream=True))
+
+    for row in conn.execute(select([table.c.data])):
+        while True:
+            chunk = row.data.read(65536)
+            if not chunk:
+                break
+            out.write(chunk)
+
+As the LOB is linked to the cursor, each stream must be read before
+further rows are fetched.
+
+.. versionadded:: 1.1 Added the ``as_stream`` flag of :class:`.LargeBinary`.
+
 Two Phase Transaction Support
 -----------------------------
 
@@ -294,6 +319,7 @@ from . import base as oracle
 from ...engine import result as _result
 from sqlalchemy import types as sqltypes, util, exc, processors
 from sqlalchemy import util
+import io
 import random
 import collections
 import decimal
@@ -461,6 +487,32 @@ class _OracleInteger(sqltypes.Integer):
         return to_int
 
 
+class _LOBStream(io.RawIOBase):
+    """A file-like object which reads from a cx_Oracle LOB in chunks;
+    returned for :class:`.LargeBinary` columns using the ``as_stream``
+    flag."""
+
+    def __init__(self, lob):
+        self._lob = lob
+        # LOB offsets start at 1
+        self._offset = 1
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        data = self._lob.read(self._offset, len(b))
+        length = len(data)
+        b[0:length] = data
+        self._offset += length
+        return length
+
+    def readall(self):
+        data = self._lob.read(self._offset)
+        self._offset += len(data)
+        return data
+
+
 class _OracleBinary(_LOBMixin, sqltypes.LargeBinary):
     def get_dbapi_type(self, dbapi):
         return dbapi.BLOB
@@ -468,6 +520,16 @@ class _OracleBinary(_LOBMixin, sqltypes.LargeBinary):
     def bind_processor(self, dialect):
         return None
 
+    def result_processor(self, dialect, coltype):
+        if self.as_stream:
+            def process(value):
+                if value is not None:
+                    value = _LOBStream(value)
+                return value
+            return process
+        else:
+            return _LOBMixin.result_processor(self, dialect, coltype)
+
 
 class _OracleInterval(oracle.INTERVAL):
     def get_dbapi_type(self, dbapi):
@@ -548,11 +610,10 @@ class OracleExecutionContext_cx_oracle(OracleExecutionContext):
                         self.out_parameters[name]
 
     def create_cursor(self):
-        c = self._dbapi_connection.cursor()
-        if self.dialect.arraysize:
-            c.arraysize = self.dialect.arraysize
-
-        return c
+        cursor = self._dbapi_connection.cursor()
+        if self.execution_options or self.dialect._sets_cursor_options:
+            self._set_cursor_options(cursor)
+        return cursor
 
     def get_result_proxy(self):
         if hasattr(self, 'out_parameters') and self.compiled.returning:
@@ -732,6 +793,9 @@ class OracleDialect_cx_oracle(OracleDialect):
 
         self._cx_oracle_native_nvarchar = self.cx_oracle_ver >= (5, 0)
 
+        if self.cx_oracle_ver >= (8, ):
+            self._prefetch_rows_attribute = 'prefetchrows'
+
         if self.cx_oracle_ver is None:
             # this occurs in tests with mock DBAPIs
             self._cx_oracle_string_types = set()
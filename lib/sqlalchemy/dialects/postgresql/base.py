@@ -1970,11 +1970,12 @@ class PGDialect(default.DefaultDialect):
     _supports_drop_index_concurrently = True
 
     def __init__(self, isolation_level=None, json_serializer=None,
-                 json_deserializer=None, **kwargs):
+                 json_deserializer=None, json_deferred=False, **kwargs):
         default.DefaultDialect.__init__(self, **kwargs)
         self.isolation_level = isolation_level
         self._json_deserializer = json_deserializer
         self._json_serializer = json_serializer
+        self._json_deferred = json_deferred
 
     def initialize(self, connection):
         super(PGDialect, self).initialize(connection)
@@ -1042,6 +1042,9 @@ class SQLiteDialect(default.DefaultDialect):
     supports_cast = True
     supports_multivalues_insert = True
 
+    # SQLITE_MAX_VARIABLE_NUMBER
+    max_bind_parameters = 999
+
     default_paramstyle = 'qmark'
     execution_ctx_cls = SQLiteExecutionContext
     statement_compiler = SQLiteCompiler
@@ -1070,6 +1073,7 @@ class SQLiteDialect(default.DefaultDialect):
     def __init__(self, isolation_level=None, native_datetime=False, **kwargs):
         default.DefaultDialect.__init__(self, **kwargs)
         self.isolation_level = isolation_level
+        self._explicit_max_bind_parameters = 'max_bind_parameters' in kwargs
 
         # this flag used by pysqlite dialect, and perhaps others in the
         # future, to indicate the driver is handling date/timestamp
@@ -1090,6 +1094,10 @@ class SQLiteDialect(default.DefaultDialect):
             self.supports_multivalues_insert = (
                 # http://www.sqlite.org/releaselog/3_7_11.html
                 self.dbapi.sqlite_version_info >= (3, 7, 11))
+            if not self._explicit_max_bind_parameters and \
+                    self.dbapi.sqlite_version_info >= (3, 32, 0):
+                # http://www.sqlite.org/releaselog/3_32_0.html
+                self.max_bind_parameters = 32766
             # see http://www.sqlalchemy.org/trac/ticket/2568
             # as well as http://www.sqlite.org/src/info/600482d161
             self._broken_fk_pragma_quotes = (
@@ -349,6 +349,17 @@ class SQLiteDialect_pysqlite(SQLiteDialect):
     def _get_server_version_info(self, connection):
         return self.dbapi.sqlite_version_info
 
+    def initialize(self, connection):
+        super(SQLiteDialect_pysqlite, self).initialize(connection)
+
+        # the compile-time SQLITE_MAX_VARIABLE_NUMBER of the library
+        # in use, where the driver makes it available
+        dbapi_connection = connection.connection
+        if not self._explicit_max_bind_parameters and \
+                hasattr(self.dbapi, 'SQLITE_LIMIT_VARIABLE_NUMBER'):
+            self.max_bind_parameters = dbapi_connection.getlimit(
+                self.dbapi.SQLITE_LIMIT_VARIABLE_NUMBER)
+
     def create_connect_args(self, url):
         if url.username or url.password or url.host or url.port:
             raise exc.ArgumentError(
@@ -77,6 +77,7 @@ from .result import (
     BufferedColumnResultProxy,
     BufferedColumnRow,
     BufferedRowResultProxy,
+    CompactRow,
     FullyBufferedResultProxy,
     ResultProxy,
     RowProxy,
@@ -143,6 +144,16 @@ def create_engine(*args, **kwargs):
 
         :ref:`connections_toplevel`
 
+    :param arraysize=None: value assigned to ``cursor.arraysize`` on each
+        DBAPI cursor, which for many DBAPIs determines the number of rows
+        retrieved with each round trip to the database; also the number of
+        rows returned by :meth:`.ResultProxy.fetchmany` when no size is
+        given.  May also be set per connection or statement using the
+        ``arraysize`` execution option.  Dialects may establish their own
+        default, such as cx_Oracle's default of 50.
+
+        .. versionadded:: 1.1
+
     :param case_sensitive=True: if False, result column names
        will match in a case-insensitive fashion, that is,
        ``row['SomeColumn']``.
@@ -241,6 +252,14 @@ def create_engine(*args, **kwargs):
         be applied to all connections.  See
         :meth:`~sqlalchemy.engine.Connection.execution_options`
 
+    :param executemany_chunk_size=1000: when an iterator of parameter
+        sets, such as a generator, is passed to :meth:`.Connection.execute`,
+        the number of parameter sets consumed from it for each
+        "executemany" execution.  May also be set per connection using the
+        ``executemany_chunk_size`` execution option.
+
+        .. versionadded:: 1.1
+
     :param implicit_returning=True: When ``True``, a RETURNING-
         compatible construct, if available, will be used to
         fetch newly generated primary key values when a single row
@@ -250,6 +269,13 @@ def create_engine(*args, **kwargs):
         Microsoft SQL Server.   Set this to ``False`` to disable
         the automatic usage of RETURNING.
 
+    :param insertmanyvalues_page_size=1000: number of rows rendered into
+        each multi-row INSERT statement when ``use_insertmanyvalues`` is
+        in effect.  May also be set per execution using the
+        ``insertmanyvalues_page_size`` execution option.
+
+        .. versionadded:: 1.1
+
     :param isolation_level: this string parameter is interpreted by various
         dialects in order to affect the transaction isolation level of the
         database connection.   The parameter essentially accepts some subset of
@@ -298,6 +324,19 @@ def create_engine(*args, **kwargs):
         opened above and beyond the pool_size setting, which defaults
         to five. this is only used with :class:`~sqlalchemy.pool.QueuePool`.
 
+    :param max_bind_parameters: maximum number of bound parameters
+        rendered into a single statement, overriding the limit the dialect
+        establishes for its database, if any.  Multi-row INSERT statements
+        produced by ``use_insertmanyvalues`` are sized to fit within this
+        limit, and IN lists of numeric, string or boolean values which
+        would exceed it are rendered inline as literal values.  Other
+        statements are sent as is, leaving the database to report an
+        overflow; they're never split into several statements.  The
+        number of statements sent for an
+        execution is available from :attr:`.ExecutionContext.statement_count`.
+
+        .. versionadded:: 1.1
+
     :param module=None: reference to a Python module object (the module
         itself, not its string name).  Specifies an alternate DBAPI module to
         be used by the engine's dialect.  Each sub-dialect references a
@@ -317,6 +356,14 @@ def create_engine(*args, **kwargs):
         ``"pyformat"``, and should correspond to a parameter style known
         to be supported by the DBAPI in use.
 
+    :param prefetch_rows=None: number of rows retrieved by the DBAPI
+        cursor along with the execution of a statement, for those DBAPIs
+        which allow this to be set, currently cx_Oracle 8 and above.  May
+        also be set per connection or statement using the ``prefetch_rows``
+        execution option.
+
+        .. versionadded:: 1.1
+
     :param pool=None: an already-constructed instance of
         :class:`~sqlalchemy.pool.Pool`, such as a
         :class:`~sqlalchemy.pool.QueuePool` instance. If non-None, this
@@ -345,6 +392,40 @@ def create_engine(*args, **kwargs):
         of 0 indicates no limit; to disable pooling, set ``poolclass`` to
         :class:`~sqlalchemy.pool.NullPool` instead.
 
+    :param pool_maintenance_interval=None: number of seconds between runs
+        of a background thread which recycles and reconnects connections
+        held in the :class:`~sqlalchemy.pool.QueuePool`, and opens
+        connections up to ``pool_min_size``, so that this work doesn't
+        take place when a connection is checked out.  See
+        :paramref:`.QueuePool.maintenance_interval`.
+
+        .. versionadded:: 1.1
+
+    :param pool_min_size=0: number of connections the
+        :class:`~sqlalchemy.pool.QueuePool` opens when the :class:`.Engine`
+        is created, rather than when they're first requested.  Errors
+        connecting at this point are logged, and the connections are
+        then made as usual when requested.  See
+        :paramref:`.QueuePool.min_size`.
+
+        .. versionadded:: 1.1
+
+    :param pool_pre_ping=False: test connections for liveness upon
+        checkout, using the dialect's "ping" operation, which is typically
+        a "SELECT 1".  A connection found to be disconnected is
+        transparently reconnected, and all other pooled connections
+        made before that point are invalidated.  See
+        :paramref:`.Pool.pre_ping` and :ref:`pool_disconnects_pessimistic`.
+
+        .. versionadded:: 1.1
+
+    :param pool_pre_ping_window=0: when ``pool_pre_ping`` is set, the
+        number of seconds after a connection was last returned to the pool
+        during which it's not tested again upon checkout.  See
+        :paramref:`.Pool.pre_ping_window`.
+
+        .. versionadded:: 1.1
+
     :param pool_recycle=-1: this setting causes the pool to recycle
         connections after the given number of seconds has passed. It
         defaults to -1, or no timeout. For example, setting to 3600
@@ -362,10 +443,52 @@ def create_engine(*args, **kwargs):
 
         .. versionadded:: 0.7.6
 
+    :param pool_skip_unused_reset=False: skip the "reset on return"
+        step for connections which were not used since they were last
+        reset, such as those checked out by :meth:`.Engine.connect` and
+        closed again without executing a statement.  See
+        :paramref:`.Pool.skip_unused_reset` for details.
+
+        .. versionadded:: 1.1
+
+    :param pool_stats=False: if True, the pool counts checkouts,
+        connections and other events, and keeps histograms of their
+        timings, which are available from :meth:`.Pool.stats`.  See
+        :paramref:`.Pool.stats`.
+
+        .. versionadded:: 1.1
+
     :param pool_timeout=30: number of seconds to wait before giving
         up on getting a connection from the pool. This is only used
         with :class:`~sqlalchemy.pool.QueuePool`.
 
+    :param pool_use_lifo=False: use LIFO (last-in-first-out) when retrieving
+        connections from :class:`.QueuePool` instead of FIFO
+        (first-in-first-out).  With LIFO, connections beyond those needed
+        for the current load remain idle, so that they may be closed by
+        ``pool_recycle`` or by server-side timeouts.
+
+        .. versionadded:: 1.1
+
+    :param statement_cache_size=500: the number of :class:`.Compiled`
+        objects held in the :class:`.Engine`-wide statement cache, keyed
+        on the structure of each statement executed, such that an
+        equivalent statement constructed anew for each execution is
+        compiled only once.  The cache is used by statements which don't
+        specify their own ``compiled_cache``.  The cache is bounded using
+        least-recently-used eviction.  Counts of cache hits, misses and
+        evictions are available via :meth:`.Engine.get_statement_cache_stats`.
+        Set to zero to disable; see also the ``compiled_cache`` option of
+        :meth:`.Connection.execution_options`.
+
+        .. note:: The INSERT, UPDATE and DELETE statements emitted by the
+           ORM's flush process continue to use the compiled cache local to
+           each :class:`.Mapper`, and not the :class:`.Engine`-wide cache;
+           these statements aren't limited by ``statement_cache_size``
+           and aren't counted by :meth:`.Engine.get_statement_cache_stats`.
+
+        .. versionadded:: 1.1
+
     :param strategy='plain': selects alternate engine implementations.
         Currently available are:
 
@@ -376,6 +499,31 @@ def create_engine(*args, **kwargs):
           See `example in the FAQ
           <http://docs.sqlalchemy.org/en/latest/faq/metadata_schema.html#how-can-i-get-the-create-table-drop-table-output-as-a-string>`_.
 
+    :param use_insertmanyvalues=False: when ``True``, an INSERT statement
+        executed with a list of parameter sets ("executemany") is sent to
+        the database as a series of multi-row ``INSERT..VALUES (...),
+        (...)`` statements, each containing up to
+        ``insertmanyvalues_page_size`` rows, rather than passing the
+        parameter sets to the DBAPI ``cursor.executemany()`` method, which
+        for most DBAPIs runs one round trip per row.  Rows returned by an
+        explicit :meth:`.UpdateBase.returning` clause are accumulated from
+        each statement.   Only takes effect for backends which support
+        multi-row VALUES, and not when implicit returning of primary keys
+        is in use.  The number of rows per statement is further reduced
+        to fit within the dialect's ``max_bind_parameters``, if any.
+
+        .. note::
+
+            As is the case for "executemany" in general,
+            :attr:`.ResultProxy.inserted_primary_key` is not populated
+            for the rows of each statement; only the rows of an explicit
+            :meth:`.UpdateBase.returning` clause are collected.  To
+            retrieve newly generated primary key values, include the
+            primary key columns in :meth:`.UpdateBase.returning` on
+            backends which support it.
+
+        .. versionadded:: 1.1
+
     :param executor=None: a function taking arguments
         ``(sql, *multiparams, **params)``, to which the ``mock`` strategy will
         dispatch all statement execution. Used only by ``strategy='mock'``.
@@ -16,8 +16,10 @@ from .. import exc, util, log, interfaces
 from ..sql import util as sql_util
 from ..sql import schema
 from .interfaces import Connectable, ExceptionContext
-from .util import _distill_params
+from .util import _distill_params, StatementCache
+from .result import ResultProxy
 import contextlib
+import itertools
 
 
 class Connection(Connectable):
@@ -188,6 +190,16 @@ class Connection(Connectable):
         include all those listed under :meth:`.Executable.execution_options`,
         as well as others that are specific to :class:`.Connection`.
 
+        :param arraysize: Available on: Connection, statement.
+          The value assigned to ``cursor.arraysize`` on each DBAPI cursor
+          used for execution, which for many DBAPIs such as cx_Oracle
+          determines the number of rows retrieved with each round trip to
+          the database.  It is also the number of rows returned by
+          :meth:`.ResultProxy.fetchmany` when no size is given.  Overrides
+          the :paramref:`.create_engine.arraysize` setting.
+
+          .. versionadded:: 1.1
+
         :param autocommit: Available on: Connection, statement.
           When True, a COMMIT will be invoked after execution
           when executed in 'autocommit' mode, i.e. when an explicit
@@ -202,6 +214,17 @@ class Connection(Connectable):
           calling stored procedures and such), and an explicit
           transaction is not in progress.
 
+        :param compact_rows: Available on: Connection, statement.
+          When ``True``, the rows of a result are delivered as
+          :class:`.CompactRow` objects, which are plain tuples of fully
+          processed values sharing a per-result index of keys, rather
+          than as :class:`.RowProxy` objects.  This reduces the memory
+          used by large lists of rows.  Type processors are applied to
+          all columns as each row is fetched, so this option takes
+          precedence over ``lazy_row_processing``.
+
+          .. versionadded:: 1.1
+
         :param compiled_cache: Available on: Connection.
           A dictionary where :class:`.Compiled` objects
           will be cached when the :class:`.Connection` compiles a clause
@@ -214,11 +237,47 @@ class Connection(Connectable):
           The format of this dictionary is not guaranteed to stay the
           same in future releases.
 
-          Note that the ORM makes use of its own "compiled" caches for
+          The clause element portion of the key is derived from the
+          structure of the statement, not including the values of bound
+          parameters, so that a statement which is constructed anew
+          for each execution will locate the :class:`.Compiled` object
+          of a previous, equivalent statement; the bound parameter values
+          are then taken from the statement being executed.  Constructs
+          which don't support this form of key, such as those with
+          :meth:`.Select.with_hint` applied, are keyed on identity.
+
+          .. versionchanged:: 1.1 the compiled cache is keyed on the
+             structure of the statement rather than its identity.
+
+          When not specified, the :class:`.Engine`-wide cache configured
+          by :paramref:`.create_engine.statement_cache_size` is used,
+          which is shared by the ORM's flush operations; pass ``None`` to
+          disable caching of compiled forms for a particular
+          :class:`.Connection`.
+
+          Note that when the :class:`.Engine`-wide cache is disabled,
+          the ORM makes use of its own "compiled" caches for
           some operations, including flush operations.  The caching
           used by the ORM internally supersedes a cache dictionary
           specified here.
 
+        :param executemany_chunk_size: Available on: Connection.
+          When an iterator of parameter sets is passed to
+          :meth:`.Connection.execute`, the number of parameter sets
+          consumed from it for each "executemany" execution; overrides
+          the :paramref:`.create_engine.executemany_chunk_size` setting.
+
+          .. versionadded:: 1.1
+
+        :param insertmanyvalues_page_size: Available on: Connection,
+          statement.  When the
+          :paramref:`.create_engine.use_insertmanyvalues` feature is in
+          effect, the maximum number of rows rendered into each multi-row
+          INSERT statement; overrides the
+          :paramref:`.create_engine.insertmanyvalues_page_size` setting.
+
+          .. versionadded:: 1.1
+
         :param isolation_level: Available on: :class:`.Connection`.
           Set the transaction isolation level for
           the lifespan of this :class:`.Connection` object (*not* the
@@ -277,6 +336,17 @@ class Connection(Connectable):
 
                 :ref:`session_transaction_isolation` - for the ORM
 
+        :param lazy_row_processing: Available on: Connection, statement.
+          When ``True``, the type processors of a result row, which
+          convert values such as date strings or JSON documents received
+          from the DBAPI, are applied to each column the first time that
+          column is accessed on the :class:`.RowProxy`, and the converted
+          value is retained for subsequent access; columns which are never
+          accessed are not converted.  By default, the processor of a
+          column is applied each time that column is accessed.
+
+          .. versionadded:: 1.1
+
         :param no_parameters: When ``True``, if the final parameter
           list or dictionary is totally empty, will invoke the
           statement on the cursor as ``cursor.execute(statement)``,
@@ -291,6 +361,26 @@ class Connection(Connectable):
 
           .. versionadded:: 0.7.6
 
+        :param prefetch_rows: Available on: Connection, statement.
+          The number of rows the DBAPI cursor retrieves from the database
+          along with the execution of the statement, for those DBAPIs
+          which allow this to be set, currently cx_Oracle 8 and above;
+          it is otherwise ignored.  Overrides the
+          :paramref:`.create_engine.prefetch_rows` setting.
+
+          .. versionadded:: 1.1
+
+        :param spool_threshold: Available on: Connection, statement.
+          When set, rows are fetched in full from the cursor as soon as
+          the statement is executed, and the result is delivered from a
+          :class:`.FullyBufferedResultProxy`.  Rows are held in memory
+          until their approximate size reaches this many bytes; the
+          remaining rows are written to a memory-mapped temporary file,
+          and read back from it as they're fetched.  Not used when
+          ``stream_results`` is in effect.
+
+          .. versionadded:: 1.1
+
         :param stream_results: Available on: Connection, statement.
           Indicate to the dialect that results should be
           "streamed" and not pre-buffered, if possible.  This is a limitation
@@ -934,7 +1024,32 @@ class Connection(Connectable):
          To execute a textual SQL statement which uses bound parameters in a
          DBAPI-agnostic way, use the :func:`~.expression.text` construct.
 
+         An iterator of parameter sets, such as a generator, may be passed
+         as the single positional argument in place of a list::
+
+             conn.execute(
+                 table.insert(),
+                 ({"id": i, "value": "v%d" % i} for i in range(1000000))
+             )
+
+         The iterator is consumed in chunks of
+         :paramref:`.create_engine.executemany_chunk_size` parameter sets,
+         with one "executemany" execution invoked per chunk, so that the
+         full series of parameter sets need not be present in memory at
+         once.  The executions take place within a single transaction,
+         which is begun if the :class:`.Connection` isn't already in one.
+         The :class:`.ResultProxy` of the last execution is returned, with
+         :attr:`.ResultProxy.rowcount` reporting the total for all
+         executions.  If the iterator is empty, no statement is executed
+         and a closed :class:`.ResultProxy` with a rowcount of zero is
+         returned.
+
+         .. versionadded:: 1.1
+
         """
+        if len(multiparams) == 1 and not params and \
+                _is_iterator(multiparams[0]):
+            return self._execute_parameter_iterator(object, multiparams[0])
         if isinstance(object, util.string_types[0]):
             return self._execute_text(object, multiparams, params)
         try:
@@ -946,6 +1061,85 @@ class Connection(Connectable):
         else:
             return meth(self, multiparams, params)
 
+    def _execute_parameter_iterator(self, object, parameters):
+        """Execute a statement for each chunk of parameter sets taken
+        from an iterator, returning the :class:`.ResultProxy` of the
+        last execution with the total rowcount applied."""
+
+        chunk_size = self._execution_options.get(
+            'executemany_chunk_size', self.dialect.executemany_chunk_size)
+
+        chunk = list(itertools.islice(parameters, chunk_size))
+        if not chunk:
+            return self._empty_result()
+
+        # the connection must stay open across executions, even for
+        # "connectionless" execution; it's closed here at the end
+        close_with_result = self.should_close_with_result
+        self.should_close_with_result = False
+
+        if self.in_transaction():
+            trans = None
+        else:
+            trans = self.begin()
+        try:
+            rowcount = statement_count = 0
+            result = None
+            while chunk:
+                if result is not None:
+                    result.close()
+                result = self.execute(object, chunk)
+                statement_count += result.context.statement_count
+                if rowcount >= 0:
+                    chunk_rowcount = result.rowcount
+                    if chunk_rowcount >= 0:
+                        rowcount += chunk_rowcount
+                    else:
+                        rowcount = -1
+                if len(chunk) < chunk_size:
+                    break
+                chunk = list(itertools.islice(parameters, chunk_size))
+            if trans is not None:
+                trans.commit()
+        except:
+            with util.safe_reraise():
+                if trans is not None:
+                    trans.rollback()
+                if close_with_result:
+                    self.close()
+
+        self.should_close_with_result = close_with_result
+        if result._soft_closed and close_with_result:
+            self.close()
+
+        result.context._rowcount = rowcount
+        result.context.statement_count = statement_count
+        util.memoized_property.reset(result, 'rowcount')
+        return result
+
+    def _empty_result(self):
+        """Return a closed :class:`.ResultProxy` with a rowcount of zero,
+        for an execution with no parameter sets; no statement is
+        executed."""
+
+        try:
+            try:
+                conn = self.__connection
+            except AttributeError:
+                conn = self._revalidate_connection()
+
+            dialect = self.dialect
+            context = dialect.execution_ctx_cls._init_default(
+                dialect, self, conn)
+        except Exception as e:
+            self._handle_dbapi_exception(e, None, None, None, None)
+
+        context._rowcount = 0
+        context.statement_count = 0
+        result = ResultProxy(context)
+        result.close()
+        return result
+
     def _execute_function(self, func, multiparams, params):
         """Execute a sql.FunctionElement object."""
 
@@ -960,6 +1154,9 @@ class Connection(Connectable):
                 default, multiparams, params = \
                     fn(self, default, multiparams, params)
 
+        if self.dialect._pre_execute_check is not None:
+            self.dialect._pre_execute_check(self)
+
         try:
             try:
                 conn = self.__connection
@@ -1025,13 +1222,63 @@ class Connection(Connectable):
             keys = []
 
         dialect = self.dialect
-        if 'compiled_cache' in self._execution_options:
+        extracted_params = None
+        compiled_cache = self._execution_options.get(
+            'compiled_cache', self.engine._compiled_cache)
+
+        if compiled_cache is not None:
+            # key on the structure of the statement where possible, so
+            # that an equivalent statement constructed separately will
+            # locate the same compiled form; parameter values are then
+            # taken from the bindparams extracted from "elem".
+            if 'compiled_cache' in self._execution_options:
+                # a cache passed explicitly has always relied on a
+                # statement not being modified in place once executed,
+                # so the key is held on to by the statement
+                elem_cache_key = elem._memoized_cache_key
+            else:
+                # the engine-wide cache can't assume this of the
+                # statement, nor of the elements within it
+                elem_cache_key = elem._generate_cache_key()
+            if elem_cache_key is not None:
+                elem_key, extracted_params = elem_cache_key
+            elif 'compiled_cache' in self._execution_options:
+                # a cache passed explicitly may also be keyed on
+                # the identity of the statement
+                elem_key = elem
+            else:
+                compiled_cache = None
+
+        if compiled_cache is not None:
+            if keys and extracted_params:
+                # parameter keys which name a bound parameter may be
+                # anonymous, and therefore specific to "elem"; refer to
+                # those by position
+                bind_positions = dict(
+                    (bind.key, idx)
+                    for idx, bind in enumerate(extracted_params))
+                keys_key = tuple(sorted(
+                    (0, bind_positions[k]) if k in bind_positions
+                    else (1, k) for k in keys))
+            else:
+                keys_key = tuple(sorted(keys))
+
             key = (
-                dialect, elem, tuple(sorted(keys)),
+                dialect, elem_key, keys_key,
                 self.schema_for_object.hash_key,
                 len(distilled_params) > 1
             )
-            compiled_sql = self._execution_options['compiled_cache'].get(key)
+            compiled_sql = compiled_cache.get(key)
+            if compiled_sql is not None and \
+                    extracted_params is not None and \
+                    compiled_sql._extracted_bind_positions is None and \
+                    compiled_sql.statement is not elem:
+                # the compiled form has parameter values rendered
+                # inline, so is only usable for the original statement
+                compiled_sql = None
+                if isinstance(compiled_cache, StatementCache):
+                    compiled_cache._record_unusable()
+
             if compiled_sql is None:
                 compiled_sql = elem.compile(
                     dialect=dialect, column_keys=keys,
@@ -1039,7 +1286,16 @@ class Connection(Connectable):
                     schema_translate_map=self.schema_for_object
                     if not self.schema_for_object.is_default else None
                 )
-                self._execution_options['compiled_cache'][key] = compiled_sql
+                if extracted_params is not None:
+                    compiled_sql._cache_key_bindparams = extracted_params
+                compiled_cache[key] = compiled_sql
+
+            if extracted_params is not None and (
+                    compiled_sql.statement is elem or
+                    compiled_sql._extracted_bind_positions is None):
+                # values are taken from the compiled statement's own
+                # bindparams
+                extracted_params = None
         else:
             compiled_sql = elem.compile(
                 dialect=dialect, column_keys=keys,
@@ -1052,7 +1308,8 @@ class Connection(Connectable):
             dialect.execution_ctx_cls._init_compiled,
             compiled_sql,
             distilled_params,
-            compiled_sql, distilled_params
+            compiled_sql, distilled_params,
+            elem, extracted_params
         )
         if self._has_events or self.engine._has_events:
             self.dispatch.after_execute(self,
@@ -1109,6 +1366,9 @@ class Connection(Connectable):
         """Create an :class:`.ExecutionContext` and execute, returning
         a :class:`.ResultProxy`."""
 
+        if dialect._pre_execute_check is not None:
+            dialect._pre_execute_check(self)
+
         try:
             try:
                 conn = self.__connection
@@ -1125,77 +1385,80 @@ class Connection(Connectable):
         if context.compiled:
             context.pre_exec()
 
-        cursor, statement, parameters = context.cursor, \
-            context.statement, \
-            context.parameters
+        if context._use_insertmanyvalues:
+            self._execute_insertmanyvalues(context)
+        else:
+            cursor, statement, parameters = context.cursor, \
+                context.statement, \
+                context.parameters
 
-        if not context.executemany:
-            parameters = parameters[0]
+            if not context.executemany:
+                parameters = parameters[0]
 
-        if self._has_events or self.engine._has_events:
-            for fn in self.dispatch.before_cursor_execute:
-                statement, parameters = \
-                    fn(self, cursor, statement, parameters,
-                       context, context.executemany)
+            if self._has_events or self.engine._has_events:
+                for fn in self.dispatch.before_cursor_execute:
+                    statement, parameters = \
+                        fn(self, cursor, statement, parameters,
+                           context, context.executemany)
 
-        if self._echo:
-            self.engine.logger.info(statement)
-            self.engine.logger.info(
-                "%r",
-                sql_util._repr_params(parameters, batches=10)
-            )
+            if self._echo:
+                self.engine.logger.info(statement)
+                self.engine.logger.info(
+                    "%r",
+                    sql_util._repr_params(parameters, batches=10)
+                )
 
-        evt_handled = False
-        try:
-            if context.executemany:
-                if self.dialect._has_events:
-                    for fn in self.dialect.dispatch.do_executemany:
-                        if fn(cursor, statement, parameters, context):
-                            evt_handled = True
-                            break
-                if not evt_handled:
-                    self.dialect.do_executemany(
-                        cursor,
-                        statement,
-                        parameters,
-                        context)
-            elif not parameters and context.no_parameters:
-                if self.dialect._has_events:
-                    for fn in self.dialect.dispatch.do_execute_no_params:
-                        if fn(cursor, statement, context):
-                            evt_handled = True
-                            break
-                if not evt_handled:
-                    self.dialect.do_execute_no_params(
-                        cursor,
-                        statement,
-                        context)
-            else:
-                if self.dialect._has_events:
-                    for fn in self.dialect.dispatch.do_execute:
-                        if fn(cursor, statement, parameters, context):
-                            evt_handled = True
-                            break
-                if not evt_handled:
-                    self.dialect.do_execute(
-                        cursor,
-                        statement,
-                        parameters,
-                        context)
-        except Exception as e:
-            self._handle_dbapi_exception(
-                e,
-                statement,
-                parameters,
-                cursor,
-                context)
+            evt_handled = False
+            try:
+                if context.executemany:
+                    if self.dialect._has_events:
+                        for fn in self.dialect.dispatch.do_executemany:
+                            if fn(cursor, statement, parameters, context):
+                                evt_handled = True
+                                break
+                    if not evt_handled:
+                        self.dialect.do_executemany(
+                            cursor,
+                            statement,
+                            parameters,
+                            context)
+                elif not parameters and context.no_parameters:
+                    if self.dialect._has_events:
+                        for fn in self.dialect.dispatch.do_execute_no_params:
+                            if fn(cursor, statement, context):
+                                evt_handled = True
+                                break
+                    if not evt_handled:
+                        self.dialect.do_execute_no_params(
+                            cursor,
+                            statement,
+                            context)
+                else:
+                    if self.dialect._has_events:
+                        for fn in self.dialect.dispatch.do_execute:
+                            if fn(cursor, statement, parameters, context):
+                                evt_handled = True
+                                break
+                    if not evt_handled:
+                        self.dialect.do_execute(
+                            cursor,
+                            statement,
+                            parameters,
+                            context)
+            except Exception as e:
+                self._handle_dbapi_exception(
+                    e,
+                    statement,
+                    parameters,
+                    cursor,
+                    context)
 
-        if self._has_events or self.engine._has_events:
-            self.dispatch.after_cursor_execute(self, cursor,
-                                               statement,
-                                               parameters,
-                                               context,
-                                               context.executemany)
+            if self._has_events or self.engine._has_events:
+                self.dispatch.after_cursor_execute(self, cursor,
+                                                   statement,
+                                                   parameters,
+                                                   context,
+                                                   context.executemany)
 
         if context.compiled:
             context.post_exec()
@@ -1215,6 +1478,76 @@ class Connection(Connectable):
 
         return result
 
+    def _execute_insertmanyvalues(self, context):
+        """Execute an executemany() INSERT as a series of multi-row
+        INSERT statements, as produced by the execution context.
+
+        Statement events are emitted for each individual statement; rows
+        returned by an explicit RETURNING clause are accumulated across
+        all statements.
+
+        """
+        cursor = context.cursor
+        returning = context._is_explicit_returning
+        if returning:
+            rows = []
+        rowcount = 0
+        statement_count = 0
+
+        for statement, parameters in context._insertmanyvalues_batches():
+            statement_count += 1
+            if self._has_events or self.engine._has_events:
+                for fn in self.dispatch.before_cursor_execute:
+                    statement, parameters = \
+                        fn(self, cursor, statement, parameters,
+                           context, False)
+
+            if self._echo:
+                self.engine.logger.info(statement)
+                self.engine.logger.info(
+                    "%r",
+                    sql_util._repr_params(parameters, batches=10)
+                )
+
+            try:
+                for fn in () if not self.dialect._has_events \
+                        else self.dialect.dispatch.do_execute:
+                    if fn(cursor, statement, parameters, context):
+                        break
+                else:
+                    self.dialect.do_execute(
+                        cursor,
+                        statement,
+                        parameters,
+                        context)
+
+                if rowcount >= 0:
+                    if cursor.rowcount >= 0:
+                        rowcount += cursor.rowcount
+                    else:
+                        rowcount = -1
+                if returning:
+                    rows.extend(cursor.fetchall())
+            except Exception as e:
+                self._handle_dbapi_exception(
+                    e,
+                    statement,
+                    parameters,
+                    cursor,
+                    context)
+
+            if self._has_events or self.engine._has_events:
+                self.dispatch.after_cursor_execute(self, cursor,
+                                                   statement,
+                                                   parameters,
+                                                   context,
+                                                   False)
+
+        context._rowcount = rowcount
+        context.statement_count = statement_count
+        if returning:
+            context._insertmanyvalues_rows = rows
+
     def _cursor_execute(self, cursor, statement, parameters, context=None):
         """Execute a statement + params on the given cursor.
 
@@ -1749,7 +2082,7 @@ class Engine(Connectable, log.Identified):
 
     def __init__(self, pool, dialect, url,
                  logging_name=None, echo=None, proxy=None,
-                 execution_options=None
+                 execution_options=None, statement_cache_size=500
                  ):
         self.pool = pool
         self.url = url
@@ -1759,6 +2092,10 @@ class Engine(Connectable, log.Identified):
             self.logging_name = logging_name
         self.echo = echo
         self.engine = self
+        if statement_cache_size:
+            self._compiled_cache = StatementCache(statement_cache_size)
+        else:
+            self._compiled_cache = None
         log.instance_logger(self, echoflag=echo)
         if proxy:
             interfaces.ConnectionProxy._adapt_listener(self, proxy)
@@ -1888,7 +2225,8 @@ class Engine(Connectable, log.Identified):
         been disposed.   This new pool, like all SQLAlchemy connection pools,
         does not make any actual connections to the database until one is
         first requested, so as long as the :class:`.Engine` isn't used again,
-        no new connections will be made.
+        no new connections will be made, unless the pool's maintenance
+        thread is configured to open connections up to a minimum size.
 
         .. seealso::
 
@@ -1899,6 +2237,42 @@ class Engine(Connectable, log.Identified):
         self.pool = self.pool.recreate()
         self.dispatch.engine_disposed(self)
 
+    def get_statement_cache_stats(self):
+        """Return statistics for the statement cache of this
+        :class:`.Engine`.
+
+        Returns a dictionary with the keys ``hits``, ``misses``,
+        ``evictions``, ``size`` and ``capacity``, or ``None`` if the
+        engine was created with ``statement_cache_size=0``.  A lookup
+        which locates a compiled form that can't be used for the
+        statement given, such as one with parameter values rendered
+        inline, is counted as a miss.
+
+        .. versionadded:: 1.1
+
+        .. seealso::
+
+            :paramref:`.create_engine.statement_cache_size`
+
+            :meth:`.Engine.reset_statement_cache_stats`
+
+        """
+        if self._compiled_cache is None:
+            return None
+        return self._compiled_cache.stats()
+
+    def reset_statement_cache_stats(self):
+        """Reset the counts of hits, misses and evictions reported by
+        :meth:`.Engine.get_statement_cache_stats` to zero.
+
+        The cache itself is unaffected.
+
+        .. versionadded:: 1.1
+
+        """
+        if self._compiled_cache is not None:
+            self._compiled_cache.reset_stats()
+
     def _execute_default(self, default):
         with self.contextual_connect() as conn:
             return conn._execute_default(default, (), {})
@@ -2172,6 +2546,7 @@ class OptionEngine(Engine):
         self.dialect = proxied.dialect
         self.logging_name = proxied.logging_name
         self.echo = proxied.echo
+        self._compiled_cache = proxied._compiled_cache
         log.instance_logger(self, echoflag=self.echo)
         self.dispatch = self.dispatch._join(proxied.dispatch)
         self._execution_options = proxied._execution_options
@@ -2193,3 +2568,11 @@ class OptionEngine(Engine):
         self.__dict__['_has_events'] = value
 
     _has_events = property(_get_has_events, _set_has_events)
+
+
+def _is_iterator(obj):
+    """Return True if the given object is an iterator, as opposed to
+    a sequence, mapping or other re-iterable collection."""
+
+    return hasattr(obj, '__next__' if util.py3k else 'next') and \
+        iter(obj) is obj
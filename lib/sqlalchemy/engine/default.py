@@ -15,6 +15,7 @@ as the base class for their own corresponding classes.
 
 import re
 import random
+import itertools
 from . import reflection, interfaces, result
 from ..sql import compiler, expression, schema
 from .. import types as sqltypes
@@ -27,6 +28,11 @@ AUTOCOMMIT_REGEXP = re.compile(
     r'\s*(?:UPDATE|INSERT|CREATE|DELETE|DROP|ALTER)',
     re.I | re.UNICODE)
 
+# When we're handed literal SQL, ensure it's a SELECT query
+SERVER_SIDE_CURSOR_RE = re.compile(
+    r'\s*SELECT',
+    re.I | re.UNICODE)
+
 
 class DefaultDialect(interfaces.Dialect):
     """Default implementation of Dialect"""
@@ -67,7 +73,20 @@ class DefaultDialect(interfaces.Dialect):
         ('pool_recycle', util.asint),
         ('pool_size', util.asint),
         ('max_overflow', util.asint),
+        ('statement_cache_size', util.asint),
         ('pool_threadlocal', util.asbool),
+        ('pool_use_lifo', util.asbool),
+        ('pool_skip_unused_reset', util.asbool),
+        ('pool_min_size', util.asint),
+        ('pool_maintenance_interval', float),
+        ('pool_pre_ping', util.asbool),
+        ('pool_pre_ping_window', float),
+        ('use_insertmanyvalues', util.asbool),
+        ('insertmanyvalues_page_size', util.asint),
+        ('max_bind_parameters', util.asint),
+        ('executemany_chunk_size', util.asint),
+        ('arraysize', util.asint),
+        ('prefetch_rows', util.asint),
     ])
 
     # if the NUMERIC type
@@ -99,6 +118,11 @@ class DefaultDialect(interfaces.Dialect):
     # thanks to MySQL, sigh
     max_index_name_length = None
 
+    server_side_cursors = False
+    """if True, statements which return rows use server side cursors
+    unless the ``stream_results`` execution option is False, for those
+    dialects that support server side cursors."""
+
     supports_sane_rowcount = True
     supports_sane_multi_rowcount = True
     dbapi_type_map = {}
@@ -108,6 +132,88 @@ class DefaultDialect(interfaces.Dialect):
     supports_empty_insert = True
     supports_multivalues_insert = False
 
+    use_insertmanyvalues = False
+    """if True, an executemany() of a single-row INSERT statement is
+    instead sent to the database as a series of multi-row
+    ``INSERT..VALUES (...), (...), ...`` statements, for those dialects that
+    also report ``supports_multivalues_insert``.
+
+    .. versionadded:: 1.1
+
+    """
+
+    insertmanyvalues_page_size = 1000
+    """maximum number of rows rendered into each multi-row INSERT statement
+    when ``use_insertmanyvalues`` is in effect.
+
+    .. versionadded:: 1.1
+
+    """
+
+    executemany_chunk_size = 1000
+    """number of parameter sets consumed for each "executemany" execution
+    when an iterator of parameter sets is passed to
+    :meth:`.Connection.execute`.
+
+    .. versionadded:: 1.1
+
+    """
+
+    max_bind_parameters = None
+    """maximum number of bound parameters the database accepts within
+    a single statement, or ``None`` if there's no practical limit.
+
+    Multi-row INSERT statements produced by ``use_insertmanyvalues`` are
+    sized to stay within this limit.  An IN list of literal values longer
+    than the limit, as well as "expanding" IN parameters which would
+    exceed it, are rendered inline as literal values, using the quoting
+    rules of the dialect's compiler, where the type is one whose literals
+    compare exactly as its bound values do, i.e. numeric, string and
+    boolean types; other values remain bound.  The limit is not otherwise
+    enforced; a statement which still exceeds it is sent as is, leaving
+    the database to report the error.  Such a statement is never split
+    into several statements, as doing so would change the results of
+    those using ORDER BY, LIMIT, DISTINCT or aggregate functions.
+
+    .. versionadded:: 1.1
+
+    """
+
+    arraysize = None
+    """value assigned to the ``arraysize`` attribute of each DBAPI cursor,
+    which establishes the number of rows fetched by ``cursor.fetchmany()``
+    and, for many DBAPIs, the number of rows retrieved with each round
+    trip to the database; ``None`` leaves the DBAPI's default in place.
+
+    .. versionadded:: 1.1
+
+    """
+
+    prefetch_rows = None
+    """number of rows the DBAPI cursor should retrieve from the database
+    along with the execution of a statement, for those DBAPIs which allow
+    this to be set; ``None`` leaves the DBAPI's default in place.
+
+    .. versionadded:: 1.1
+
+    """
+
+    _prefetch_rows_attribute = None
+
+    # a callable(connection) run ahead of each execution, outside of
+    # the error handling which rolls back the connection
+    _pre_execute_check = None
+
+    textual_result_cache_size = 500
+    """number of :class:`.ResultMetaData` objects retained for results of
+    statements which have no compiled column information, such as plain
+    SQL strings and :func:`.text` constructs without
+    :meth:`.TextClause.columns`, keyed on ``cursor.description``.
+
+    .. versionadded:: 1.1
+
+    """
+
     server_version_info = None
 
     construct_arguments = None
@@ -171,7 +277,13 @@ class DefaultDialect(interfaces.Dialect):
                  supports_right_nested_joins=None,
                  case_sensitive=True,
                  supports_native_boolean=None,
-                 label_length=None, **kwargs):
+                 label_length=None,
+                 use_insertmanyvalues=None,
+                 insertmanyvalues_page_size=None,
+                 max_bind_parameters=None,
+                 executemany_chunk_size=None,
+                 arraysize=None,
+                 prefetch_rows=None, **kwargs):
 
         if not getattr(self, 'ported_sqla_06', True):
             util.warn(
@@ -199,6 +311,18 @@ class DefaultDialect(interfaces.Dialect):
         if supports_native_boolean is not None:
             self.supports_native_boolean = supports_native_boolean
         self.case_sensitive = case_sensitive
+        if use_insertmanyvalues is not None:
+            self.use_insertmanyvalues = use_insertmanyvalues
+        if insertmanyvalues_page_size is not None:
+            self.insertmanyvalues_page_size = insertmanyvalues_page_size
+        if max_bind_parameters is not None:
+            self.max_bind_parameters = max_bind_parameters
+        if executemany_chunk_size is not None:
+            self.executemany_chunk_size = executemany_chunk_size
+        if arraysize is not None:
+            self.arraysize = arraysize
+        if prefetch_rows is not None:
+            self.prefetch_rows = prefetch_rows
 
         if label_length and label_length > self.max_identifier_length:
             raise exc.ArgumentError(
@@ -220,6 +344,22 @@ class DefaultDialect(interfaces.Dialect):
         self._encoder = codecs.getencoder(self.encoding)
         self._decoder = processors.to_unicode_processor_factory(self.encoding)
 
+    @util.memoized_property
+    def _textual_result_cache(self):
+        if self.textual_result_cache_size:
+            return util.LRUCache(self.textual_result_cache_size)
+        else:
+            return None
+
+    @util.memoized_property
+    def _sets_cursor_options(self):
+        # whether cursors are given an arraysize or prefetch_rows
+        # setting regardless of execution options; determined once,
+        # after the dialect's constructor has established both
+        return self.arraysize is not None or (
+            self.prefetch_rows is not None and
+            self._prefetch_rows_attribute is not None)
+
     @util.memoized_property
     def _type_memos(self):
         return weakref.WeakKeyDictionary()
@@ -467,6 +607,26 @@ class DefaultDialect(interfaces.Dialect):
     def is_disconnect(self, e, connection, cursor):
         return False
 
+    @util.memoized_property
+    def _dialect_specific_select_one(self):
+        return str(expression.select([1]).compile(dialect=self))
+
+    def do_ping(self, dbapi_connection):
+        cursor = None
+        try:
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute(self._dialect_specific_select_one)
+            finally:
+                cursor.close()
+        except self.dbapi.Error as err:
+            if self.is_disconnect(err, dbapi_connection, cursor):
+                return False
+            else:
+                raise
+        else:
+            return True
+
     def reset_isolation_level(self, dbapi_conn):
         # default_isolation_level is read from the first connection
         # after the initial set of 'isolation_level', if any, so is
@@ -501,9 +661,13 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
     executemany = False
     compiled = None
     statement = None
+    invoked_statement = None
     result_column_struct = None
     _is_implicit_returning = False
     _is_explicit_returning = False
+    _use_insertmanyvalues = False
+    _insertmanyvalues_rows = None
+    _rowcount = None
 
     # a hook for SQLite's translation of
     # result column names
@@ -544,8 +708,17 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
     @classmethod
     def _init_compiled(cls, dialect, connection, dbapi_connection,
-                       compiled, parameters):
-        """Initialize execution context for a Compiled construct."""
+                       compiled, parameters, invoked_statement=None,
+                       extracted_parameters=None):
+        """Initialize execution context for a Compiled construct.
+
+        ``invoked_statement`` is the statement passed to
+        :meth:`.Connection.execute`, which may be a different, equivalent
+        object to ``compiled.statement`` when the compiled form came from
+        the compiled cache; ``extracted_parameters`` are its bindparams,
+        from which parameter values are taken.
+
+        """
 
         self = cls.__new__(cls)
         self.root_connection = connection
@@ -557,7 +730,11 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         if not compiled.can_execute:
             raise exc.ArgumentError("Not an executable clause")
 
-        self.execution_options = compiled.statement._execution_options.union(
+        if invoked_statement is None:
+            invoked_statement = compiled.statement
+        self.invoked_statement = invoked_statement
+
+        self.execution_options = invoked_statement._execution_options.union(
             connection._execution_options)
 
         self.result_column_struct = (
@@ -577,10 +754,14 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         self.is_text = compiled.isplaintext
 
         if not parameters:
-            self.compiled_parameters = [compiled.construct_params()]
+            self.compiled_parameters = [
+                compiled.construct_params(
+                    _extracted_parameters=extracted_parameters)]
         else:
             self.compiled_parameters = \
-                [compiled.construct_params(m, _group_number=grp) for
+                [compiled.construct_params(
+                    m, _group_number=grp,
+                    _extracted_parameters=extracted_parameters) for
                  grp, m in enumerate(parameters)]
 
             self.executemany = len(parameters) > 1
@@ -600,8 +781,21 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
                     else:
                         self._process_executesingle_defaults()
 
+            if self.executemany and \
+                    compiled._insertmanyvalues is not None and \
+                    dialect.use_insertmanyvalues and \
+                    dialect.supports_multivalues_insert and \
+                    not self._is_implicit_returning:
+                self._use_insertmanyvalues = True
+
         processors = compiled._bind_processors
 
+        if compiled.contains_expanding_parameters:
+            positiontup, processors = self._expand_in_parameters(
+                compiled, processors)
+        elif compiled.positional:
+            positiontup = compiled.positiontup
+
         # Convert the dictionary of bind parameter values
         # into a dict or list to be sent to the DBAPI's
         # execute() or executemany() method.
@@ -609,7 +803,7 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         if dialect.positional:
             for compiled_params in self.compiled_parameters:
                 param = []
-                for key in self.compiled.positiontup:
+                for key in positiontup:
                     if key in processors:
                         param.append(processors[key](compiled_params[key]))
                     else:
@@ -645,6 +839,111 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
         return self
 
+    def _expand_in_parameters(self, compiled, processors):
+        """handle special 'expanding' parameters, IN lists that are rendered
+        on a per-execution basis for an otherwise fixed SQL statement string.
+
+        Returns the positional names to be used in place of
+        ``compiled.positiontup`` along with the bind processors, extended
+        to include the names generated for each element.
+
+        If expanding the lists would exceed the dialect's
+        ``max_bind_parameters``, the longest lists are rendered inline as
+        literal values using the compiler's ``render_literal_value()``,
+        where their type renders literals which compare exactly, until
+        the statement fits.
+
+        """
+        if self.executemany:
+            raise exc.InvalidRequestError(
+                "'expanding' parameters can't be used with "
+                "executemany()")
+
+        if compiled.positional and self.dialect.paramstyle == 'numeric':
+            raise exc.InvalidRequestError(
+                "'expanding' parameters can't be used with the "
+                "'numeric' paramstyle")
+
+        compiled_params = self.compiled_parameters[0]
+        processors = dict(processors)
+        if compiled.positional:
+            names = [
+                (name, compiled.binds[name]) for name in compiled.positiontup]
+            positiontup = []
+        else:
+            names = [
+                (name, bindparam)
+                for bindparam, name in compiled.bind_names.items()]
+            positiontup = None
+
+        expanding = {}
+        for name, bindparam in names:
+            if bindparam.expanding and name not in expanding:
+                values = compiled_params.pop(name)
+                if not values:
+                    raise exc.InvalidRequestError(
+                        "'expanding' parameters can't be used with an "
+                        "empty list")
+                expanding[name] = (bindparam, values)
+
+        literals = {}
+        limit = self.dialect.max_bind_parameters
+        if limit is not None:
+            num_params = len(names) + sum(
+                len(values) - 1 for bindparam, values in expanding.values())
+            for name in sorted(
+                    expanding, key=lambda name: -len(expanding[name][1])):
+                if num_params <= limit:
+                    break
+                bindparam, values = expanding[name]
+                if not compiled._renders_exact_literal(bindparam.type):
+                    continue
+                # render using the compiler, which applies the quoting
+                # and escaping rules of the dialect
+                try:
+                    literals[name] = ", ".join(
+                        compiled.render_literal_value(value, bindparam.type)
+                        for value in values)
+                except NotImplementedError:
+                    continue
+                num_params -= len(values)
+
+        replacement_expressions = {}
+        for name, bindparam in names:
+            if name in expanding:
+                bindparam, values = expanding[name]
+                if name in literals:
+                    replacement_expressions[name] = literals[name]
+                    continue
+                to_update = [
+                    ("%s_%s" % (name, i), value)
+                    for i, value in enumerate(values, 1)
+                ]
+                compiled_params.update(to_update)
+                if name in processors:
+                    processor = processors[name]
+                    processors.update(
+                        (key, processor) for key, value in to_update)
+                if compiled.positional:
+                    positiontup.extend(key for key, value in to_update)
+                replacement_expressions[name] = ", ".join(
+                    compiled.bindtemplate % {'name': key}
+                    for key, value in to_update)
+            elif compiled.positional:
+                positiontup.append(name)
+
+        self.unicode_statement = re.sub(
+            r"\[EXPANDING_(.+?)\]",
+            lambda m: replacement_expressions[m.group(1)],
+            self.unicode_statement)
+        if not self.dialect.supports_unicode_statements:
+            self.statement = self.unicode_statement.encode(
+                self.dialect.encoding)
+        else:
+            self.statement = self.unicode_statement
+
+        return positiontup, processors
+
     @classmethod
     def _init_statement(cls, dialect, connection, dbapi_connection,
                         statement, parameters):
@@ -775,7 +1074,59 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         return AUTOCOMMIT_REGEXP.match(statement)
 
     def create_cursor(self):
-        return self._dbapi_connection.cursor()
+        cursor = self._dbapi_connection.cursor()
+        if self.execution_options or self.dialect._sets_cursor_options:
+            self._set_cursor_options(cursor)
+        return cursor
+
+    def _set_cursor_options(self, cursor):
+        """Apply the ``arraysize`` and ``prefetch_rows`` settings of the
+        execution options, falling back to those of the dialect, to a
+        newly created DBAPI cursor.
+
+        Callers skip this when there are no execution options and
+        the dialect's ``_sets_cursor_options`` is False, since there's
+        nothing to apply.
+
+        """
+        arraysize = self.execution_options.get(
+            'arraysize', self.dialect.arraysize)
+        if arraysize is not None:
+            cursor.arraysize = arraysize
+
+        prefetch_rows = self.execution_options.get(
+            'prefetch_rows', self.dialect.prefetch_rows)
+        if prefetch_rows is not None and \
+                self.dialect._prefetch_rows_attribute is not None:
+            setattr(cursor, self.dialect._prefetch_rows_attribute,
+                    prefetch_rows)
+        return cursor
+
+    def _use_server_side_cursor(self):
+        """Return True if the statement should use a server side cursor,
+        for dialects which support them.
+
+        This is the case when the ``stream_results`` execution option is
+        set, or when the dialect's ``server_side_cursors`` flag is set
+        and the statement is a SELECT, unless ``stream_results`` is
+        False.
+
+        """
+        if self.dialect.server_side_cursors:
+            return self.execution_options.get('stream_results', True) and (
+                (self.compiled and isinstance(self.compiled.statement,
+                                              expression.Selectable)
+                 or
+                 (
+                    (not self.compiled or
+                     isinstance(self.compiled.statement,
+                                expression.TextClause))
+                    and self.statement and SERVER_SIDE_CURSOR_RE.match(
+                        self.statement))
+                 )
+            )
+        else:
+            return self.execution_options.get('stream_results', False)
 
     def pre_exec(self):
         pass
@@ -825,11 +1176,17 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         pass
 
     def get_result_proxy(self):
-        return result.ResultProxy(self)
+        if self.execution_options.get('spool_threshold') is not None:
+            return result.FullyBufferedResultProxy(self)
+        else:
+            return result.ResultProxy(self)
 
     @property
     def rowcount(self):
-        return self.cursor.rowcount
+        if self._rowcount is not None:
+            return self._rowcount
+        else:
+            return self.cursor.rowcount
 
     def supports_sane_rowcount(self):
         return self.dialect.supports_sane_rowcount
@@ -849,7 +1206,10 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
             elif not self._is_implicit_returning:
                 self._setup_ins_pk_from_empty()
 
-        result = self.get_result_proxy()
+        if self._insertmanyvalues_rows is not None:
+            result = self._get_insertmanyvalues_result_proxy()
+        else:
+            result = self.get_result_proxy()
 
         if self.isinsert:
             if self._is_implicit_returning:
@@ -875,6 +1235,78 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
             result._soft_close(_autoclose_connection=False)
         return result
 
+    def _get_insertmanyvalues_result_proxy(self):
+        return result.FullyBufferedResultProxy(
+            self, initial_buffer=self._insertmanyvalues_rows)
+
+    def _insertmanyvalues_batches(self):
+        """Yield (statement, parameters) pairs which execute the parameter
+        sets of an executemany() INSERT as a series of multi-row
+        INSERT..VALUES statements.
+
+        """
+        dialect = self.dialect
+        compiled = self.compiled
+        parameters = self.parameters
+        prefix, values_clause, suffix, bind_names = compiled._insertmanyvalues
+
+        page_size = self.execution_options.get(
+            'insertmanyvalues_page_size',
+            dialect.insertmanyvalues_page_size)
+        if bind_names:
+            max_parameters = dialect.max_bind_parameters
+            if max_parameters is not None:
+                if dialect.positional:
+                    row_parameters = len(bind_names)
+                else:
+                    row_parameters = len(set(bind_names))
+                # parameters outside of the VALUES clause are sent once
+                # per statement
+                max_parameters -= len(parameters[0]) - row_parameters
+                page_size = max(1, min(
+                    page_size, max_parameters // row_parameters))
+
+        if dialect.positional:
+            num_values = len(bind_names)
+        else:
+            row_template = compiled._insertmanyvalues_row_template
+            bind_names = set(bind_names)
+            if not dialect.supports_unicode_statements:
+                bind_names = set(
+                    dialect._encoder(name)[0] for name in bind_names)
+            extra_keys = [
+                key for key in parameters[0] if key not in bind_names]
+
+        for start in range(0, len(parameters), page_size):
+            batch = parameters[start:start + page_size]
+
+            if dialect.positional:
+                values = ", ".join([values_clause] * len(batch))
+                batch_params = []
+                for param in batch:
+                    batch_params.extend(param[0:num_values])
+                batch_params.extend(batch[0][num_values:])
+                batch_params = dialect.execute_sequence_format(batch_params)
+            else:
+                values = ", ".join(
+                    row_template.format(idx) for idx in range(len(batch)))
+                batch_params = dict(
+                    (key, batch[0][key]) for key in extra_keys)
+                for idx, param in enumerate(batch):
+                    for name in bind_names:
+                        batch_params["%s__%d" % (name, idx)] = param[name]
+
+            statement = prefix + values + suffix
+            if dialect.paramstyle == 'numeric':
+                poscount = itertools.count(1)
+                statement = re.sub(
+                    r'\[_POSITION\]',
+                    lambda m: str(util.next(poscount)), statement)
+            if not dialect.supports_unicode_statements:
+                statement = dialect._encoder(statement)[0]
+
+            yield statement, batch_params
+
     def _setup_ins_pk_from_lastrowid(self):
         key_getter = self.compiled._key_getters_for_crud_column[2]
         table = self.compiled.statement.table
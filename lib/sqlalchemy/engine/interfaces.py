@@ -150,6 +150,12 @@ class Dialect(object):
       This will prevent types.Boolean from generating a CHECK
       constraint when that type is used.
 
+    max_bind_parameters
+      The maximum number of bound parameters accepted within a single
+      statement, or ``None`` if there's no practical limit.
+
+      .. versionadded:: 1.1
+
     dbapi_exception_translation_map
        A dictionary of names that will contain as values the names of
        pep-249 exceptions ("IntegrityError", "OperationalError", etc)
@@ -671,6 +677,21 @@ class Dialect(object):
 
         raise NotImplementedError()
 
+    def do_ping(self, dbapi_connection):
+        """ping the DBAPI connection and return True if the connection is
+        usable, or False if the database reports that it has been
+        disconnected.
+
+        This hook is called by the :class:`.Pool` upon checkout of a
+        connection when the :paramref:`.Pool.pre_ping` flag is set.
+        Errors which don't indicate a disconnect are raised.
+
+        .. versionadded:: 1.1
+
+        """
+
+        raise NotImplementedError()
+
     def connect(self):
         """return a callable which sets up a newly created DBAPI connection.
 
@@ -1001,6 +1022,21 @@ class ExecutionContext(object):
 
     """
 
+    statement_count = 1
+    """The number of statements sent to the DBAPI cursor in order to
+    invoke this execution.
+
+    This is greater than one when a statement is split into several
+    statements, as when an "executemany" INSERT is sent as a series of
+    multi-row INSERT statements sized to the dialect's
+    ``max_bind_parameters`` and ``insertmanyvalues_page_size``.  An
+    "executemany" sent to the DBAPI ``cursor.executemany()`` method
+    counts as one statement.
+
+    .. versionadded:: 1.1
+
+    """
+
     def create_cursor(self):
         """Return a new cursor generated from this ExecutionContext's
         connection.
@@ -9,10 +9,16 @@
 and :class:`.RowProxy."""
 
 
-from .. import exc, util
+from .. import exc, util, processors as _processors
 from ..sql import expression, sqltypes, util as sql_util
+import array
 import collections
+import mmap
 import operator
+import struct
+import sys
+import tempfile
+import types
 
 # This reconstructor is necessary so that pickles with the C extension or
 # without use the same Binary format.
@@ -33,6 +39,10 @@ except ImportError:
         obj.__setstate__(state)
         return obj
 
+# whether processors.process_rows() is the C implementation
+_c_process_rows = isinstance(
+    _processors.process_rows, types.BuiltinFunctionType)
+
 try:
     from sqlalchemy.cresultproxy import BaseRowProxy
     _baserowproxy_usecext = True
@@ -185,13 +195,146 @@ except ImportError:
     pass
 
 
+def compactrow_reconstructor(parent, values):
+    return parent._compact_row_class()(values)
+
+
+class CompactRow(tuple):
+    """A result row which is a plain ``tuple`` of fully processed values.
+
+    Rows of this type are produced when the ``compact_rows`` execution
+    option is used.  Each result gets a subclass of :class:`.CompactRow`
+    whose class-level index maps the string names, integer positions
+    and column expressions of the result to positions in the tuple, so
+    that rows themselves carry no state other than their values.
+
+    Values may be accessed by integer position, slice, string name,
+    or by ``schema.Column`` object, as with :class:`.RowProxy`, as well
+    as by attribute.  Otherwise the row behaves as a tuple; in
+    particular, comparison, hashing and the ``in`` operator apply to
+    the values in the row, rather than to its keys.
+
+    .. versionadded:: 1.1
+
+    """
+
+    __slots__ = ()
+
+    _parent = None
+    _index = util.immutabledict()
+
+    def __getitem__(self, key):
+        try:
+            index = self._index[key]
+        except KeyError:
+            index = self._key_fallback(key)
+        except TypeError:
+            # slices
+            return tuple.__getitem__(self, key)
+        return tuple.__getitem__(self, index)
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError as e:
+            raise AttributeError(e.args[0])
+
+    @classmethod
+    def _key_fallback(cls, key):
+        # the index is shared by all results of the metadata and
+        # isn't added to; keys located here are memoized in the
+        # keymap of the parent, which belongs to this class
+        parent = cls._parent
+        if key in parent._keymap:
+            processor, obj, index = parent._keymap[key]
+        else:
+            processor, obj, index = parent._key_fallback(key)
+        if index is None:
+            raise exc.InvalidRequestError(
+                "Ambiguous column name '%s' in "
+                "result set column descriptions" % obj)
+        return index
+
+    def __reduce__(self):
+        return (compactrow_reconstructor, (self._parent, tuple(self)))
+
+    def __repr__(self):
+        return repr(sql_util._repr_row(self))
+
+    def has_key(self, key):
+        """Return True if this row contains the given key."""
+
+        return key in self._index or self._parent._has_key(key)
+
+    def items(self):
+        """Return a list of tuples, each tuple containing a key/value pair."""
+
+        return [(key, self[key]) for key in self.keys()]
+
+    def keys(self):
+        """Return the list of keys as strings represented by this row."""
+
+        return self._parent.keys
+
+
+_UNPROCESSED = util.symbol('UNPROCESSED')
+
+
+def _row_size(row):
+    """Return the approximate size in bytes of a DBAPI row."""
+
+    return sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row)
+
+
+class _LazyProcessedRow(object):
+    """A sequence which applies the type processor of each column of a
+    DBAPI row when that column is first accessed, memoizing the result.
+
+    Stands in for the DBAPI row within a :class:`.RowProxy` when the
+    ``lazy_row_processing`` execution option is used.
+
+    """
+
+    __slots__ = ('_raw', '_processors', '_values')
+
+    def __init__(self, raw, processors):
+        self._raw = raw
+        self._processors = processors
+        self._values = None
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(
+                self[idx] for idx in range(*index.indices(len(self._raw))))
+        values = self._values
+        if values is None:
+            values = self._values = [_UNPROCESSED] * len(self._raw)
+        value = values[index]
+        if value is _UNPROCESSED:
+            value = self._raw[index]
+            processor = self._processors[index]
+            if processor is not None:
+                value = processor(value)
+            values[index] = value
+        return value
+
+    def __iter__(self):
+        for index in range(len(self._raw)):
+            yield self[index]
+
+
 class ResultMetaData(object):
     """Handle cursor.description, applying additional info from an execution
     context."""
 
     __slots__ = (
         '_keymap', 'case_sensitive', 'matched_on_name',
-        '_processors', 'keys', '_orig_processors')
+        '_processors', 'keys', '_orig_processors', '_types',
+        '_compact_row_cls', '_adapted', '_without_processors',
+        '_batch')
 
     def __init__(self, parent, cursor_description):
         context = parent.context
@@ -199,6 +342,8 @@ class ResultMetaData(object):
         self.case_sensitive = dialect.case_sensitive
         self.matched_on_name = False
         self._orig_processors = None
+        self._compact_row_cls = self._adapted = \
+            self._without_processors = self._batch = None
 
         if context.result_column_struct:
             result_columns, cols_are_ordered, textual_ordered = \
@@ -236,6 +381,9 @@ class ResultMetaData(object):
         # views like __iter__ and slices
         self._processors = [elem[3] for elem in raw]
 
+        # types in key order, used by columnar fetches
+        self._types = [elem[6] for elem in raw]
+
         # keymap by primary string...
         by_key = dict([
             (elem[2], (elem[3], elem[4], elem[0]))
@@ -374,7 +522,8 @@ class ResultMetaData(object):
                         type_, key, cursor_description[idx][1]
                     ),
                     obj,
-                    None
+                    None,
+                    type_
                 ) for idx, (key, name, obj, type_)
                 in enumerate(result_columns)
             ]
@@ -400,7 +549,7 @@ class ResultMetaData(object):
                     idx, colname, colname,
                     context.get_result_processor(
                         mapped_type, colname, coltype),
-                    obj, untranslated)
+                    obj, untranslated, mapped_type)
 
                 for idx, colname, mapped_type, coltype, obj, untranslated
                 in raw_iterator
@@ -567,6 +716,148 @@ class ResultMetaData(object):
             map[key] = result
         return result
 
+    def _adapt_to_statement(self, compiled_statement, invoked_statement):
+        """Return a copy of this :class:`.ResultMetaData` which also targets
+        the column expressions of ``invoked_statement``, an equivalent
+        statement to the ``compiled_statement`` from which the result
+        columns were compiled, as occurs when using the compiled cache.
+
+        """
+        keymap = self._keymap
+        invoked_elements = tuple(invoked_statement._result_column_elements())
+
+        # the adapted copies are retained, keyed on the column
+        # expressions they target, so that a statement executed
+        # repeatedly doesn't copy the keymap each time
+        if self._adapted is not None:
+            md = self._adapted.get(invoked_elements)
+            if md is not None:
+                return md
+
+        adapted = []
+        for compiled, invoked in zip(
+                compiled_statement._result_column_elements(),
+                invoked_elements):
+            if compiled is invoked or compiled not in keymap:
+                continue
+            rec = processor, objects, index = keymap[compiled]
+            if index is not None:
+                rec = (processor, objects + (invoked, ), index)
+            adapted.append((invoked, rec))
+
+            # anonymous names, which are used for targeting by name,
+            # are specific to each statement
+            name = getattr(compiled, 'name', None)
+            if isinstance(name, util.string_types) and \
+                    name != invoked.name:
+                adapted.append((
+                    invoked.name if self.case_sensitive
+                    else invoked.name.lower(), rec))
+        if not adapted:
+            return self
+
+        md = self._copy()
+        md._compact_row_cls = None
+        md._keymap = dict(keymap)
+        md._keymap.update(adapted)
+
+        if self._adapted is None:
+            self._adapted = util.LRUCache(20)
+        self._adapted[invoked_elements] = md
+        return md
+
+    def _copy(self):
+        md = self.__class__.__new__(self.__class__)
+        md._keymap = self._keymap
+        md.case_sensitive = self.case_sensitive
+        md.matched_on_name = self.matched_on_name
+        md._processors = self._processors
+        md.keys = self.keys
+        md._orig_processors = self._orig_processors
+        md._types = self._types
+        md._compact_row_cls = self._compact_row_cls
+        md._adapted = md._without_processors = md._batch = None
+        return md
+
+    def _compact_row_class(self):
+        """Return the :class:`.CompactRow` subclass for rows of this
+        result, creating it on first use.
+
+        The class is retained by copies of this :class:`.ResultMetaData`
+        which keep its keymap.  Its parent has a keymap of its own, so
+        that keys located by its rows don't add to the keymap of
+        metadata which is shared, as with the textual result cache.
+
+        """
+
+        if self._compact_row_cls is None:
+            index = dict(
+                (key, index)
+                for key, (processor, obj, index) in self._keymap.items()
+                if index is not None
+            )
+            for idx in range(len(self.keys)):
+                index[idx] = idx
+                index[idx - len(self.keys)] = idx
+            parent = self._copy()
+            parent._keymap = dict(self._keymap)
+            self._compact_row_cls = parent._compact_row_cls = type(
+                'CompactRow', (CompactRow, ),
+                {'__slots__': (), '_parent': parent, '_index': index})
+        return self._compact_row_cls
+
+    def _copy_without_processors(self):
+        """Return a copy of this :class:`.ResultMetaData` where rows
+        apply no type processors; the original processors are
+        retained as ``_orig_processors``, so that the result can apply
+        them on its own terms.  The copy is retained for subsequent
+        results of this metadata."""
+
+        md = self._without_processors
+        if md is not None:
+            return md
+
+        md = self._copy()
+        md._compact_row_cls = None
+        md._orig_processors = self._processors
+        md._processors = [None for _ in range(len(self.keys))]
+        md._keymap = dict(
+            (key, (None, obj, index))
+            for key, (processor, obj, index) in self._keymap.items()
+        )
+        self._without_processors = md
+        return md
+
+    def _batch_processing(self):
+        """Return the processors to be applied to a whole block of rows
+        using :func:`.processors.process_rows`, along with the
+        :class:`.ResultMetaData` for rows of the processed values, or
+        None if rows are to be processed individually.
+
+        Blocks are processed only when the C extension is present and
+        every processor is implemented in C, so that the batch call
+        doesn't do more work than processing each value on access.
+
+        """
+
+        batch = self._batch
+        if batch is None:
+            if self._orig_processors is not None:
+                processors, md = self._orig_processors, self
+            else:
+                processors, md = self._processors, None
+            if _c_process_rows and \
+                    processors.count(None) != len(processors) and \
+                    all(processor is None or
+                        isinstance(processor, types.BuiltinFunctionType)
+                        for processor in processors):
+                batch = (
+                    processors, md or self._copy_without_processors())
+            else:
+                batch = ()
+            self._batch = batch
+        return batch or None
+
     def _has_key(self, key):
         if key in self._keymap:
             return True
@@ -605,6 +896,9 @@ class ResultMetaData(object):
         # the row has been processed at pickling time so we don't need any
         # processor anymore
         self._processors = [None for _ in range(len(state['keys']))]
+        self._orig_processors = self._compact_row_cls = self._adapted = \
+            self._without_processors = self._batch = None
+        self._types = [sqltypes.NULLTYPE for _ in range(len(state['keys']))]
         self._keymap = keymap = {}
         for key, index in state['_pickled_keymap'].items():
             # not preserving "obj" here, unfortunately our
@@ -637,10 +931,12 @@ class ResultProxy(object):
     """
 
     _process_row = RowProxy
+    _compact_row_cls = None
     out_parameters = None
     _can_close_connection = False
     _metadata = None
     _soft_closed = False
+    _lazy_processors = None
     closed = False
 
     def __init__(self, context):
@@ -651,6 +947,12 @@ class ResultProxy(object):
         self._echo = self.connection._echo and \
             context.engine._should_log_debug()
         self._init_metadata()
+        if self._metadata is not None and context.execution_options:
+            if context.execution_options.get('compact_rows', False):
+                self._compact_row_cls = self._metadata._compact_row_class()
+            elif context.execution_options.get(
+                    'lazy_row_processing', False):
+                self._init_lazy_processing()
 
     def _getter(self, key, raiseerr=True):
         try:
@@ -671,19 +973,81 @@ class ResultProxy(object):
     def _init_metadata(self):
         cursor_description = self._cursor_description()
         if cursor_description is not None:
-            if self.context.compiled and \
-                    'compiled_cache' in self.context.execution_options:
-                if self.context.compiled._cached_metadata:
-                    self._metadata = self.context.compiled._cached_metadata
-                else:
-                    self._metadata = self.context.compiled._cached_metadata = \
-                        ResultMetaData(self, cursor_description)
+            compiled = self.context.compiled
+            if not self.context.result_column_struct or \
+                    not self.context.result_column_struct[0]:
+                self._metadata = self._textual_metadata(cursor_description)
             else:
-                self._metadata = ResultMetaData(self, cursor_description)
+                # a Compiled object that's executed repeatedly, such as
+                # one retrieved from the compiled cache, reuses the
+                # ResultMetaData of its previous execution as long as
+                # the names and types in cursor.description are the same
+                description_key = tuple(
+                    (rec[0], rec[1]) for rec in cursor_description)
+                cached = compiled._cached_metadata
+                if cached is not None and cached[0] == description_key:
+                    self._metadata = cached[1]
+                else:
+                    self._metadata = ResultMetaData(self, cursor_description)
+                    compiled._cached_metadata = (
+                        description_key, self._metadata)
+            if self.context.invoked_statement is not None and \
+                    self.context.invoked_statement is not \
+                    self.context.compiled.statement:
+                self._metadata = self._metadata._adapt_to_statement(
+                    self.context.compiled.statement,
+                    self.context.invoked_statement)
             if self._echo:
                 self.context.engine.logger.debug(
                     "Col %r", tuple(x[0] for x in cursor_description))
 
+    def _init_lazy_processing(self):
+        processors = self._metadata._processors
+        if processors.count(None) != len(processors):
+            # rows are given a _LazyProcessedRow in process_rows(),
+            # which applies the processors itself
+            self._lazy_processors = processors
+            self._metadata = self._metadata._copy_without_processors()
+
+    def _textual_metadata(self, cursor_description):
+        """Return a :class:`.ResultMetaData` for a statement without
+        compiled column information, such as a plain string or a
+        :func:`.text` construct.
+
+        As the names and types in ``cursor.description`` determine the
+        result entirely in this case, the metadata is built once for all
+        such results of the dialect having the same description; each
+        result receives a copy of its keymap, which is added to when
+        keys are located by name.
+
+        """
+        context = self.context
+        cache = context.dialect._textual_result_cache
+        if cache is None:
+            return ResultMetaData(self, cursor_description)
+
+        translate_colname = context._translate_colname
+        if translate_colname:
+            description_key = tuple(
+                (translate_colname(rec[0]), rec[1])
+                for rec in cursor_description)
+        else:
+            description_key = tuple(
+                (rec[0], rec[1]) for rec in cursor_description)
+
+        metadata = cache.get(description_key)
+        if metadata is None:
+            metadata = cache[description_key] = ResultMetaData(
+                self, cursor_description)
+        if context.execution_options and \
+                context.execution_options.get('compact_rows', False):
+            # create the row class on the cached metadata, so that
+            # the copy below and those of later results share it
+            metadata._compact_row_class()
+        metadata = metadata._copy()
+        metadata._keymap = dict(metadata._keymap)
+        return metadata
+
     def keys(self):
         """Return the current set of string keys for rows."""
         if self._metadata:
@@ -1090,15 +1454,42 @@ class ResultProxy(object):
         processors = metadata._processors
         if self._echo:
             log = self.context.engine.logger.debug
-            l = []
             for row in rows:
                 log("Row %r", sql_util._repr_row(row))
-                l.append(process_row(metadata, row, processors, keymap))
-            return l
+        row_cls = self._compact_row_cls
+        if row_cls is not None:
+            processors = metadata._orig_processors or processors
+            if processors.count(None) != len(processors):
+                rows = _processors.process_rows(rows, processors)
+            return [row_cls(row) for row in rows]
+        lazy_processors = self._lazy_processors
+        if lazy_processors is not None:
+            return [process_row(metadata,
+                                _LazyProcessedRow(row, lazy_processors),
+                                processors, keymap)
+                    for row in rows]
         else:
             return [process_row(metadata, row, processors, keymap)
                     for row in rows]
 
+    def _process_block(self, rows):
+        """Process the rows given by :meth:`.fetchall` or
+        :meth:`.fetchmany`, applying the processors to the whole block
+        at once where :meth:`.ResultMetaData._batch_processing` allows."""
+
+        if rows and self._compact_row_cls is None and \
+                self._lazy_processors is None and not self._echo:
+            batch = self._metadata._batch_processing()
+            if batch is not None:
+                batch_processors, metadata = batch
+                processors = metadata._processors
+                keymap = metadata._keymap
+                return [
+                    RowProxy(metadata, row, processors, keymap)
+                    for row in _processors.process_rows(
+                        rows, batch_processors)]
+        return self.process_rows(rows)
+
     def fetchall(self):
         """Fetch all rows, just like DB-API ``cursor.fetchall()``.
 
@@ -1117,7 +1508,7 @@ class ResultProxy(object):
         """
 
         try:
-            l = self.process_rows(self._fetchall_impl())
+            l = self._process_block(self._fetchall_impl())
             self._soft_close()
             return l
         except Exception as e:
@@ -1138,14 +1529,24 @@ class ResultProxy(object):
         an empty list.   After the :meth:`.ResultProxy.close` method is
         called, the method will raise :class:`.ResourceClosedError`.
 
+        When ``size`` is not given, the ``arraysize`` execution option,
+        or failing that the ``arraysize`` of the dialect, if set,
+        determines the number of rows returned.
+
         .. versionchanged:: 1.0.0 - Added "soft close" behavior which
            allows the result to be used in an "exhausted" state prior to
            calling the :meth:`.ResultProxy.close` method.
 
+        .. versionchanged:: 1.1 - the ``arraysize`` execution option and
+           dialect setting are used when ``size`` is not given.
+
         """
 
+        if size is None:
+            size = self._arraysize()
+
         try:
-            l = self.process_rows(self._fetchmany_impl(size))
+            l = self._process_block(self._fetchmany_impl(size))
             if len(l) == 0:
                 self._soft_close()
             return l
@@ -1154,6 +1555,31 @@ class ResultProxy(object):
                 e, None, None,
                 self.cursor, self.context)
 
+    def _arraysize(self):
+        return self.context.execution_options.get(
+            'arraysize', self.dialect.arraysize)
+
+    def partitions(self, size=None):
+        """Iterate through lists of rows, each as returned by
+        :meth:`.ResultProxy.fetchmany`, until all rows are exhausted::
+
+            for partition in result.partitions(100):
+                for row in partition:
+                    process(row)
+
+        :param size: number of rows in each list; passed to
+         :meth:`.ResultProxy.fetchmany`.
+
+        .. versionadded:: 1.1
+
+        """
+
+        while True:
+            partition = self.fetchmany(size)
+            if not partition:
+                break
+            yield partition
+
     def fetchone(self):
         """Fetch one row, just like DB-API ``cursor.fetchone()``.
 
@@ -1225,6 +1651,127 @@ class ResultProxy(object):
         else:
             return None
 
+    def fetch_columns(self, size=None):
+        """Fetch rows into a mapping of column key to an array of
+        values per column.
+
+        Rows are fetched as with :meth:`.ResultProxy.fetchall`, or as with
+        :meth:`.ResultProxy.fetchmany` when ``size`` is given, however no
+        :class:`.RowProxy` is created for each row; instead the values of
+        each column are gathered into a single array, keyed in
+        :meth:`.ResultProxy.keys` order.  Result processors are applied
+        to the whole batch of rows at once.
+
+        When NumPy is installed, each array is a ``numpy.ndarray``.
+        Otherwise, an ``array.array`` is used for integer and floating
+        point columns, and a list for all others.  The element type is
+        derived from the :attr:`.TypeEngine.python_type` of each column's
+        type; columns of other types, or which contain NULL values or
+        integers out of 64-bit range, use an ndarray of ``object`` dtype
+        or a list::
+
+            result = conn.execute(select([table.c.id, table.c.price]))
+            columns = result.fetch_columns()
+            total = columns['price'].sum()
+
+        :param size: maximum number of rows to fetch; if omitted, all
+         remaining rows are fetched.  The result set is exhausted once a
+         fetch returns no rows.
+
+        .. versionadded:: 1.1
+
+        """
+        try:
+            rows = self._fetch_column_rows(size)
+        except Exception as e:
+            self.connection._handle_dbapi_exception(
+                e, None, None,
+                self.cursor, self.context)
+
+        if self._echo:
+            log = self.context.engine.logger.debug
+            for row in rows:
+                log("Row %r", sql_util._repr_row(row))
+
+        metadata = self._metadata
+        processors = self._lazy_processors or metadata._processors
+        if rows:
+            if processors.count(None) != len(processors):
+                rows = _processors.process_rows(rows, processors)
+            columns = zip(*rows)
+        else:
+            columns = [() for key in metadata.keys]
+
+        return util.OrderedDict(
+            (key, _column_array(type_, values))
+            for key, type_, values in zip(
+                metadata.keys, metadata._types, columns)
+        )
+
+    def _fetch_column_rows(self, size):
+        if size is None:
+            rows = self._fetchall_impl()
+        else:
+            rows = self._fetchmany_impl(size)
+        if size is None or not rows:
+            self._soft_close()
+        return rows
+
+
+def _column_array(type_, values):
+    """Build the array returned by :meth:`.ResultProxy.fetch_columns`
+    for the processed values of a single column."""
+
+    try:
+        python_type = type_.python_type
+    except NotImplementedError:
+        python_type = None
+
+    numpy = _numpy()
+    typecodes = _numpy_dtypes if numpy is not None else _array_typecodes
+    typecode = typecodes.get(python_type)
+
+    if typecode is not None and None not in values:
+        try:
+            if numpy is not None:
+                # only casts which preserve values are allowed, so that
+                # floats aren't truncated nor numeric strings parsed
+                return numpy.array(values).astype(
+                    typecode, casting='safe', copy=False)
+            else:
+                return array.array(typecode, values)
+        except (TypeError, ValueError, OverflowError):
+            pass
+
+    if numpy is not None:
+        arr = numpy.empty(len(values), dtype=object)
+        arr[:] = values
+        return arr
+    else:
+        return list(values)
+
+
+_numpy_dtypes = {int: 'int64', float: 'float64', bool: 'bool'}
+
+_array_typecodes = {int: 'q' if util.py3k else 'l', float: 'd'}
+
+
+_NO_NUMPY = object()
+_numpy_module = _NO_NUMPY
+
+
+def _numpy():
+    """Return the numpy module if it can be imported, else None."""
+
+    global _numpy_module
+    if _numpy_module is _NO_NUMPY:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy_module = numpy
+    return _numpy_module
+
 
 class BufferedRowResultProxy(ResultProxy):
     """A ResultProxy with row buffering behavior.
@@ -1249,16 +1796,41 @@ class BufferedRowResultProxy(ResultProxy):
                 stream_results=True, max_row_buffer=50
                 ).execute("select * from table")
 
+    The number of rows fetched at a time may otherwise be determined
+    using these execution options:
+
+    * ``row_buffer_size`` - fetch this fixed number of rows each time,
+      including the first.
+
+    * ``row_buffer_latency`` - adapt the number of rows fetched each time
+      so that each fetch takes approximately this many seconds, growing
+      the number by no more than a factor of two each time.
+
+    * ``max_row_buffer_bytes`` - limit the number of rows fetched each
+      time such that the buffer holds approximately no more than this
+      many bytes, based on the average size of the rows fetched
+      previously.  This may be combined with either of the above, and
+      with ``max_row_buffer``.
+
     .. versionadded:: 1.0.6 Added the ``max_row_buffer`` option.
 
+    .. versionadded:: 1.1 Added the ``row_buffer_size``,
+       ``row_buffer_latency`` and ``max_row_buffer_bytes`` options.
+
     .. seealso::
 
         :ref:`psycopg2_execution_options`
     """
 
     def _init_metadata(self):
-        self._max_row_buffer = self.context.execution_options.get(
-            'max_row_buffer', None)
+        options = self.context.execution_options
+        self._max_row_buffer = options.get('max_row_buffer', None)
+        self._max_row_buffer_bytes = options.get(
+            'max_row_buffer_bytes', None)
+        self._row_buffer_size = options.get('row_buffer_size', None)
+        self._row_buffer_latency = options.get('row_buffer_latency', None)
+        if self._row_buffer_size is not None:
+            self._bufsize = self._row_buffer_size
         self.__buffer_rows()
         super(BufferedRowResultProxy, self)._init_metadata()
 
@@ -1281,10 +1853,35 @@ class BufferedRowResultProxy(ResultProxy):
         if self.cursor is None:
             return
         size = getattr(self, '_bufsize', 1)
-        self.__rowbuffer = collections.deque(self.cursor.fetchmany(size))
-        self._bufsize = self.size_growth.get(size, size)
+        if self._row_buffer_latency is not None:
+            start = util.compat.time_func()
+            rows = self.cursor.fetchmany(size)
+            elapsed = util.compat.time_func() - start
+        else:
+            rows = self.cursor.fetchmany(size)
+        self.__rowbuffer = collections.deque(rows)
+
+        if self._row_buffer_size is not None:
+            size = self._row_buffer_size
+        elif self._row_buffer_latency is not None:
+            # a fetch which returned fewer rows than requested says
+            # nothing about the time needed for more
+            if len(rows) == size:
+                if elapsed > 0:
+                    size = max(1, min(
+                        size * 2,
+                        int(size * self._row_buffer_latency / elapsed)))
+                else:
+                    size *= 2
+        else:
+            size = self.size_growth.get(size, size)
+
         if self._max_row_buffer is not None:
-            self._bufsize = min(self._max_row_buffer, self._bufsize)
+            size = min(self._max_row_buffer, size)
+        if self._max_row_buffer_bytes is not None and rows:
+            row_size = sum(_row_size(row) for row in rows) / len(rows)
+            size = max(1, min(size, self._max_row_buffer_bytes // row_size))
+        self._bufsize = int(size)
 
     def _soft_close(self, **kw):
         self.__rowbuffer.clear()
@@ -1319,6 +1916,95 @@ class BufferedRowResultProxy(ResultProxy):
         return ret
 
 
+class _RowSpool(object):
+    """A first-in, first-out buffer of rows which holds rows in memory
+    up to a threshold of bytes, beyond which further rows are written
+    to a memory-mapped temporary file.
+
+    Rows written to the file are pickled in blocks, each of which is
+    decoded only when the rows preceding it have been consumed.
+
+    """
+
+    _header = struct.Struct('<Q')
+
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self._memory = collections.deque()
+        self._size = 0
+        self._file = None
+        self._mmap = None
+        self._offset = self._end = 0
+        self._block = collections.deque()
+
+    def extend(self, rows):
+        if self._file is None:
+            self._memory.extend(rows)
+            for row in rows:
+                self._size += _row_size(row)
+            if self._size > self.threshold:
+                self._file = tempfile.TemporaryFile()
+        elif rows:
+            data = util.pickle.dumps(
+                [tuple(row) for row in rows], util.pickle.HIGHEST_PROTOCOL)
+            self._file.write(self._header.pack(len(data)))
+            self._file.write(data)
+
+    def seal(self):
+        """Complete the writing of rows, making those which were
+        written to the file available for reading."""
+
+        if self._file is not None:
+            self._file.flush()
+            self._end = self._file.tell()
+            if self._end:
+                self._mmap = mmap.mmap(
+                    self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _read_block(self):
+        header = self._header
+        length, = header.unpack_from(self._mmap, self._offset)
+        start = self._offset + header.size
+        self._offset = start + length
+        self._block = collections.deque(
+            util.pickle.loads(self._mmap[start:self._offset]))
+
+    def popleft(self):
+        if self._memory:
+            return self._memory.popleft()
+        if not self._block:
+            self._read_block()
+        return self._block.popleft()
+
+    def __bool__(self):
+        return bool(
+            self._memory or self._block or self._offset < self._end)
+
+    __nonzero__ = __bool__
+
+    def drain(self):
+        """Return all remaining rows as a list and release the file."""
+
+        rows = list(self._memory)
+        rows.extend(self._block)
+        while self._offset < self._end:
+            self._read_block()
+            rows.extend(self._block)
+        self.clear()
+        return rows
+
+    def clear(self):
+        self._memory.clear()
+        self._block.clear()
+        self._offset = self._end = 0
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
 class FullyBufferedResultProxy(ResultProxy):
     """A result proxy that buffers rows fully upon creation.
 
@@ -1326,14 +2012,54 @@ class FullyBufferedResultProxy(ResultProxy):
     after the database conversation can not be continued,
     such as MSSQL INSERT...OUTPUT after an autocommit.
 
+    Rows which were already fetched from the cursor may be passed
+    as ``initial_buffer``, in which case the cursor itself is not
+    consulted for rows.
+
+    When the ``spool_threshold`` execution option is given, rows are
+    held in memory only until their approximate size reaches that many
+    bytes; the remaining rows are pickled into a memory-mapped temporary
+    file, from which they're read back as they are fetched::
+
+        result = conn.execution_options(
+            spool_threshold=50 * 1024 * 1024).execute(stmt)
+
+    Values in the spooled rows must be picklable.
+
+    .. versionadded:: 1.1 Added the ``spool_threshold`` option.
+
     """
 
+    _spool_fetch_size = 1000
+
+    def __init__(self, context, initial_buffer=None):
+        self._initial_buffer = initial_buffer
+        super(FullyBufferedResultProxy, self).__init__(context)
+
     def _init_metadata(self):
         super(FullyBufferedResultProxy, self)._init_metadata()
         self.__rowbuffer = self._buffer_rows()
 
     def _buffer_rows(self):
-        return collections.deque(self.cursor.fetchall())
+        if self._initial_buffer is not None:
+            return collections.deque(self._initial_buffer)
+        threshold = self.context.execution_options.get(
+            'spool_threshold', None)
+        if threshold is None:
+            return collections.deque(self.cursor.fetchall())
+
+        spool = _RowSpool(threshold)
+        try:
+            while True:
+                rows = self.cursor.fetchmany(self._spool_fetch_size)
+                if not rows:
+                    break
+                spool.extend(rows)
+            spool.seal()
+        except Exception:
+            with util.safe_reraise():
+                spool.clear()
+        return spool
 
     def _soft_close(self, **kw):
         self.__rowbuffer.clear()
@@ -1361,6 +2087,8 @@ class FullyBufferedResultProxy(ResultProxy):
             return self._non_result([])
         ret = self.__rowbuffer
         self.__rowbuffer = collections.deque()
+        if isinstance(ret, _RowSpool):
+            ret = ret.drain()
         return ret
 
 
@@ -1396,22 +2124,32 @@ class BufferedColumnResultProxy(ResultProxy):
     def _init_metadata(self):
         super(BufferedColumnResultProxy, self)._init_metadata()
 
-        metadata = self._metadata
+        # orig_processors will be used to preprocess each row when
+        # they are constructed; the ResultMetaData may be shared with
+        # other results of the same Compiled object, so a copy is used.
+        self._metadata = self._metadata._copy_without_processors()
+
+    def _fetch_column_rows(self, size):
+        # rows are processed as they're fetched; the column
+        # processors are all None
+        if size is None:
+            rows = self.fetchall()
+        else:
+            rows = self.fetchmany(size)
+        return [row._row for row in rows]
 
-        # don't double-replace the processors, in the case
-        # of a cached ResultMetaData
-        if metadata._orig_processors is None:
-            # orig_processors will be used to preprocess each row when
-            # they are constructed.
-            metadata._orig_processors = metadata._processors
-            # replace the all type processors by None processors.
-            metadata._processors = [None for _ in range(len(metadata.keys))]
-            keymap = {}
-            for k, (func, obj, index) in metadata._keymap.items():
-                keymap[k] = (None, obj, index)
-            metadata._keymap = keymap
+    def _processes_blocks(self):
+        # processors implemented in C don't read LOBs, so rows needn't
+        # be processed one at a time when those are all there are
+        return self._metadata is not None and \
+            self._lazy_processors is None and \
+            self._compact_row_cls is None and not self._echo and \
+            self._metadata._batch_processing() is not None
 
     def fetchall(self):
+        if self._processes_blocks():
+            return super(BufferedColumnResultProxy, self).fetchall()
+
         # can't call cursor.fetchall(), since rows must be
         # fully processed before requesting more from the DBAPI.
         l = []
@@ -1423,10 +2161,15 @@ class BufferedColumnResultProxy(ResultProxy):
         return l
 
     def fetchmany(self, size=None):
+        if self._processes_blocks():
+            return super(BufferedColumnResultProxy, self).fetchmany(size)
+
         # can't call cursor.fetchmany(), since rows must be
         # fully processed before requesting more from the DBAPI.
         if size is None:
-            return self.fetchall()
+            size = self._arraysize()
+            if size is None:
+                return self.fetchall()
         l = []
         for i in range(size):
             row = self.fetchone()
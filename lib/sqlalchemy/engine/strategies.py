@@ -116,7 +116,14 @@ class DefaultEngineStrategy(EngineStrategy):
                          'recycle': 'pool_recycle',
                          'events': 'pool_events',
                          'use_threadlocal': 'pool_threadlocal',
-                         'reset_on_return': 'pool_reset_on_return'}
+                         'reset_on_return': 'pool_reset_on_return',
+                         'use_lifo': 'pool_use_lifo',
+                         'skip_unused_reset': 'pool_skip_unused_reset',
+                         'min_size': 'pool_min_size',
+                         'maintenance_interval': 'pool_maintenance_interval',
+                         'pre_ping': 'pool_pre_ping',
+                         'pre_ping_window': 'pool_pre_ping_window',
+                         'stats': 'pool_stats'}
             for k in util.get_cls_kwargs(poolclass):
                 tk = translate.get(k, k)
                 if tk in kwargs:
@@ -177,6 +184,15 @@ class DefaultEngineStrategy(EngineStrategy):
         for plugin in plugins:
             plugin.engine_created(engine)
 
+        # connect ahead of time only once all connect handlers are set up
+        if isinstance(pool, poollib.QueuePool) and pool._min_size:
+            try:
+                pool.prewarm()
+            except Exception:
+                pool.logger.error(
+                    "Exception opening connections to pre-fill pool",
+                    exc_info=True)
+
         return engine
 
 
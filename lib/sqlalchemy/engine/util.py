@@ -8,6 +8,61 @@
 from .. import util
 
 
+class StatementCache(util.LRUCache):
+    """A bounded cache of :class:`.Compiled` objects, which records
+    the number of lookups which succeeded and failed, as well as the
+    number of entries evicted.
+
+    An instance is created for each :class:`.Engine` given a nonzero
+    :paramref:`.create_engine.statement_cache_size`; its statistics are
+    available via :meth:`.Engine.get_statement_cache_stats`.
+
+    """
+
+    def __init__(self, capacity):
+        super(StatementCache, self).__init__(capacity)
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key, default=None):
+        with self._mutex:
+            item = dict.get(self, key)
+            if item is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._unlink(item)
+            self._link_last(item)
+            return item[3]
+
+    def _record_unusable(self):
+        """Count the preceding hit as a miss, as the entry located
+        couldn't be used and is to be replaced."""
+
+        with self._mutex:
+            self.hits -= 1
+            self.misses += 1
+
+    def _manage_size(self):
+        # called with the mutex held
+        size = len(self)
+        super(StatementCache, self)._manage_size()
+        self.evictions += max(size - len(self), 0)
+
+    def stats(self):
+        with self._mutex:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self),
+                "capacity": self.capacity
+            }
+
+    def reset_stats(self):
+        with self._mutex:
+            self.hits = self.misses = self.evictions = 0
+
+
 def connection_memoize(key):
     """Decorator, memoize a function in a connection.info stash.
 
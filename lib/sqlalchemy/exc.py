@@ -105,6 +105,26 @@ class DisconnectionError(SQLAlchemyError):
 
     """
 
+    invalidate_pool = False
+
+
+class InvalidatePoolError(DisconnectionError):
+    """Raised when the connection pool should invalidate all stale connections.
+
+    A subclass of :class:`.DisconnectionError` that indicates that the
+    disconnect situation encountered on the connection probably means the
+    entire pool should be invalidated, as the database has been restarted.
+
+    When raised by a "checkout" handler, this exception is otherwise
+    handled the same way as :class:`.DisconnectionError`, in that the
+    connection is reconnected and the checkout is retried.
+
+    .. versionadded:: 1.1
+
+    """
+
+    invalidate_pool = True
+
 
 class TimeoutError(SQLAlchemyError):
     """Raised when a connection pool times out on getting a connection."""
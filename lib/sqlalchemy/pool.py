@@ -17,6 +17,7 @@ regular DB-API connect() methods to be transparently managed by a
 SQLAlchemy connection pool.
 """
 
+import bisect
 import time
 import traceback
 import weakref
@@ -88,6 +89,81 @@ class _ConnDialect(object):
     def do_close(self, dbapi_connection):
         dbapi_connection.close()
 
+    def do_ping(self, dbapi_connection):
+        raise NotImplementedError(
+            "The ping feature requires that a dialect is "
+            "passed to the connection pool.")
+
+
+class _Histogram(object):
+    """Count observed durations within fixed bucket boundaries."""
+
+    __slots__ = ('bounds', 'counts', 'count', 'sum')
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0
+
+    def add(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self):
+        buckets = []
+        total = 0
+        for bound, count in zip(self.bounds, self.counts):
+            total += count
+            buckets.append((bound, total))
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'buckets': buckets
+        }
+
+
+class _PoolStats(object):
+    """Counters and latency histograms maintained by a :class:`.Pool`."""
+
+    counters = (
+        'checkouts', 'checkins', 'connects', 'invalidations',
+        'overflow_created', 'timeouts')
+
+    histograms = ('checkout_wait', 'connect_time', 'hold_time')
+
+    # upper bounds in seconds of the histogram buckets
+    bounds = (.001, .0025, .005, .01, .025, .05, .1, .25, .5,
+              1, 2.5, 5, 10, 30)
+
+    def __init__(self):
+        self._mutex = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._mutex:
+            self._counts = dict((name, 0) for name in self.counters)
+            self._histograms = dict(
+                (name, _Histogram(self.bounds)) for name in self.histograms)
+
+    def incr(self, name):
+        with self._mutex:
+            self._counts[name] += 1
+
+    def observe(self, name, value, counter=None):
+        with self._mutex:
+            self._histograms[name].add(value)
+            if counter is not None:
+                self._counts[counter] += 1
+
+    def snapshot(self):
+        with self._mutex:
+            stats = dict(self._counts)
+            for name, histogram in self._histograms.items():
+                stats[name] = histogram.snapshot()
+        return stats
+
 
 class Pool(log.Identified):
 
@@ -100,6 +176,10 @@ class Pool(log.Identified):
                  use_threadlocal=False,
                  logging_name=None,
                  reset_on_return=True,
+                 skip_unused_reset=False,
+                 pre_ping=False,
+                 pre_ping_window=0,
+                 stats=False,
                  listeners=None,
                  events=None,
                  _dispatch=None,
@@ -197,6 +277,55 @@ class Pool(log.Identified):
               :paramref:`.Pool.reset_on_return` accepts ``"rollback"``
               and ``"commit"`` arguments.
 
+        :param skip_unused_reset: if True, the "reset on return" step is
+          skipped for a connection which has not been used since it was
+          last reset, i.e. for which no cursor was acquired, no
+          transaction was begun, and no other method of the DBAPI
+          connection was called through the :class:`._ConnectionFairy`.
+          This saves a round trip to the database for each checkout
+          which does no work.  Connections which are newly connected,
+          or which were passed to :meth:`.PoolEvents.checkout` listeners,
+          are always reset.  Defaults to False.
+
+          .. warning:: Work done using the DBAPI connection directly,
+             such as through the :attr:`._ConnectionFairy.connection`
+             attribute, can't be detected, and leaves the connection
+             in an unknown state when returned to the pool if this flag
+             is set.
+
+          .. versionadded:: 1.1
+
+        :param pre_ping: if True, the pool will test each connection upon
+          checkout, using the ``do_ping()`` method of the dialect, which
+          by default emits a "SELECT 1".  If the database reports that the
+          connection is disconnected, the connection is reconnected, and
+          all other connections in the pool made before that point are
+          invalidated as well, as if the database had been restarted,
+          so that they're reconnected upon their next checkout.  Requires
+          a dialect, as is the case for the pool of an :class:`.Engine`.
+
+          .. versionadded:: 1.1
+
+          .. seealso::
+
+            :ref:`pool_disconnects_pessimistic`
+
+        :param pre_ping_window: when ``pre_ping`` is set, the number of
+          seconds after a connection was last returned to the pool during
+          which it is assumed to still be usable, and isn't tested upon
+          checkout; busy connections are therefore not tested at all.
+          Defaults to 0, meaning connections are tested upon every
+          checkout.
+
+          .. versionadded:: 1.1
+
+        :param stats: if True, the pool counts checkouts, connections and
+          other events, and keeps histograms of the time taken by them,
+          which are reported by :meth:`.Pool.stats`.  Defaults to False,
+          as this adds a small overhead to each checkout and checkin.
+
+          .. versionadded:: 1.1
+
         :param events: a list of 2-tuples, each of the form
          ``(callable, target)`` which will be passed to :func:`.event.listen`
          upon construction.   Provided here so that event listeners
@@ -221,6 +350,7 @@ class Pool(log.Identified):
         self._creator = creator
         self._recycle = recycle
         self._invalidate_time = 0
+        self._stats = _PoolStats() if stats else None
         self._use_threadlocal = use_threadlocal
         if reset_on_return in ('rollback', True, reset_rollback):
             self._reset_on_return = reset_rollback
@@ -232,6 +362,9 @@ class Pool(log.Identified):
             raise exc.ArgumentError(
                 "Invalid value for 'reset_on_return': %r"
                 % reset_on_return)
+        self._skip_unused_reset = skip_unused_reset
+        self._pre_ping = pre_ping
+        self._pre_ping_window = pre_ping_window
 
         self.echo = echo
 
@@ -323,7 +456,7 @@ class Pool(log.Identified):
 
         return _ConnectionRecord(self)
 
-    def _invalidate(self, connection, exception=None):
+    def _invalidate(self, connection, exception=None, _checkin=True):
         """Mark all connections established within the generation
         of the given connection as invalidated.
 
@@ -337,7 +470,7 @@ class Pool(log.Identified):
         rec = getattr(connection, "_connection_record", None)
         if not rec or self._invalidate_time < rec.starttime:
             self._invalidate_time = time.time()
-        if getattr(connection, 'is_valid', False):
+        if _checkin and getattr(connection, 'is_valid', False):
             connection.invalidate(exception)
 
     def recreate(self):
@@ -413,6 +546,67 @@ class Pool(log.Identified):
     def status(self):
         raise NotImplementedError()
 
+    def stats(self):
+        """Return a dictionary of statistics collected by this
+        :class:`.Pool` since it was created or since
+        :meth:`.Pool.reset_stats` was last called.
+
+        Statistics are collected only when the pool is created with
+        the :paramref:`.Pool.stats` flag, or by :func:`.create_engine`
+        with ``pool_stats=True``; otherwise the dictionary is empty,
+        apart from the current figures reported by :class:`.QueuePool`.
+
+        The dictionary includes these counts:
+
+        * ``checkouts`` - connections checked out from the pool
+        * ``checkins`` - connections returned to the pool
+        * ``connects`` - new DBAPI connections made
+        * ``invalidations`` - connections invalidated, including soft
+          invalidations
+        * ``overflow_created`` - connections made by :class:`.QueuePool`
+          in excess of its ``pool_size``
+        * ``timeouts`` - checkouts which raised :class:`.TimeoutError`
+          as no connection became available in time
+
+        as well as these histograms of durations in seconds:
+
+        * ``checkout_wait`` - time taken to get a connection record from
+          the pool, including time spent waiting for one to become
+          available, and time taken to connect if a new connection is
+          made; checkouts which time out are included, so that the
+          count of this histogram is that of ``checkouts`` plus
+          ``timeouts``
+        * ``connect_time`` - time taken to make each new DBAPI connection
+        * ``hold_time`` - time from the checkout of each connection
+          until its return to the pool
+
+        Each histogram is a dictionary with the number of durations
+        observed as ``count``, their total as ``sum``, and a list of
+        ``(upper bound, count)`` tuples as ``buckets``, where each count
+        is the cumulative number of durations at or below the bound;
+        durations beyond the last bound are counted only within
+        ``count``.
+
+        :class:`.QueuePool` additionally reports its current
+        ``pool_size``, ``checkedin``, ``checkedout`` and ``overflow``.
+
+        .. versionadded:: 1.1
+
+        """
+        if self._stats is None:
+            return {}
+        return self._stats.snapshot()
+
+    def reset_stats(self):
+        """Reset the counts and histograms reported by
+        :meth:`.Pool.stats`.
+
+        .. versionadded:: 1.1
+
+        """
+        if self._stats is not None:
+            self._stats.reset()
+
 
 class _ConnectionRecord(object):
 
@@ -461,6 +655,14 @@ class _ConnectionRecord(object):
 
     _soft_invalidate_time = 0
 
+    _checkout_time = None
+
+    _last_used = 0
+
+    _reset_needed = True
+    """True if the DBAPI connection may have been used since it was
+    last reset, as is the case for a newly made connection."""
+
     @util.memoized_property
     def info(self):
         """The ``.info`` dictionary associated with the DBAPI connection.
@@ -473,7 +675,19 @@ class _ConnectionRecord(object):
 
     @classmethod
     def checkout(cls, pool):
-        rec = pool._do_get()
+        stats = pool._stats
+        if stats is None:
+            rec = pool._do_get()
+        else:
+            start = time.time()
+            try:
+                rec = pool._do_get()
+            except exc.TimeoutError:
+                with util.safe_reraise():
+                    stats.observe(
+                        'checkout_wait', time.time() - start, 'timeouts')
+            rec._checkout_time = now = time.time()
+            stats.observe('checkout_wait', now - start, 'checkouts')
         try:
             dbapi_connection = rec.get_connection()
         except:
@@ -498,6 +712,12 @@ class _ConnectionRecord(object):
         self.fairy_ref = None
         connection = self.connection
         pool = self.__pool
+        if pool._stats is not None or pool._pre_ping_window:
+            self._last_used = now = time.time()
+            if self._checkout_time is not None:
+                pool._stats.observe(
+                    'hold_time', now - self._checkout_time, 'checkins')
+                self._checkout_time = None
         while self.finalize_callback:
             finalizer = self.finalize_callback.pop()
             finalizer(connection)
@@ -546,12 +766,24 @@ class _ConnectionRecord(object):
                 "%sInvalidate connection %r",
                 "Soft " if soft else "",
                 self.connection)
+        if self.__pool._stats is not None:
+            self.__pool._stats.incr('invalidations')
         if soft:
             self._soft_invalidate_time = time.time()
         else:
             self.__close()
             self.connection = None
 
+    def _is_stale(self):
+        """Return True if :meth:`.get_connection` would connect anew."""
+
+        pool = self.__pool
+        return self.connection is None or \
+            (pool._recycle > -1 and
+             time.time() - self.starttime > pool._recycle) or \
+            pool._invalidate_time > self.starttime or \
+            self._soft_invalidate_time > self.starttime
+
     def get_connection(self):
         recycle = False
         if self.connection is None:
@@ -600,8 +832,14 @@ class _ConnectionRecord(object):
         try:
             self.starttime = time.time()
             connection = pool._invoke_creator(self)
+            if pool._stats is not None or pool._pre_ping_window:
+                self._last_used = now = time.time()
+                if pool._stats is not None:
+                    pool._stats.observe(
+                        'connect_time', now - self.starttime, 'connects')
             pool.logger.debug("Created new connection %r", connection)
             self.connection = connection
+            self._reset_needed = True
         except Exception as e:
             pool.logger.debug("Error on connect(): %s", e)
             raise
@@ -726,20 +964,39 @@ class _ConnectionFairy(object):
             raise exc.InvalidRequestError("This connection is closed")
         fairy._counter += 1
 
-        if not pool.dispatch.checkout or fairy._counter != 1:
+        if not pool.dispatch.checkout and not pool._pre_ping or \
+                fairy._counter != 1:
             return fairy
 
-        # Pool listeners can trigger a reconnection on checkout
+        # Pool listeners can trigger a reconnection on checkout, as
+        # can a failed ping.  Both use the DBAPI connection itself, so
+        # that it's reset when returned; a ping skipped within the
+        # pre-ping window leaves it unused.
         attempts = 2
         while attempts > 0:
             try:
-                pool.dispatch.checkout(fairy.connection,
-                                       fairy._connection_record,
-                                       fairy)
+                if pool._pre_ping and \
+                        time.time() - fairy._connection_record._last_used \
+                        >= pool._pre_ping_window:
+                    if fairy._echo:
+                        pool.logger.debug(
+                            "Pool pre-ping on connection %s",
+                            fairy.connection)
+                    fairy._mark_used()
+                    if not pool._dialect.do_ping(fairy.connection):
+                        raise exc.InvalidatePoolError(
+                            "Pool pre-ping failed")
+                if pool.dispatch.checkout:
+                    fairy._mark_used()
+                    pool.dispatch.checkout(fairy.connection,
+                                           fairy._connection_record,
+                                           fairy)
                 return fairy
             except exc.DisconnectionError as e:
                 pool.logger.info(
                     "Disconnection detected on checkout: %s", e)
+                if e.invalidate_pool:
+                    pool._invalidate(fairy, e, _checkin=False)
                 fairy._connection_record.invalidate(e)
                 try:
                     fairy.connection = \
@@ -749,6 +1006,11 @@ class _ConnectionFairy(object):
                         fairy._connection_record.checkin()
 
                 attempts -= 1
+            except Exception:
+                # return the connection, such as when a ping fails for
+                # a reason other than a disconnect
+                with util.safe_reraise():
+                    fairy._checkin()
 
         pool.logger.info("Reconnection attempts exhausted on checkout")
         fairy.invalidate()
@@ -765,9 +1027,21 @@ class _ConnectionFairy(object):
 
     _close = _checkin
 
+    def _mark_used(self):
+        if self._connection_record is not None:
+            self._connection_record._reset_needed = True
+
     def _reset(self, pool):
         if pool.dispatch.reset:
             pool.dispatch.reset(self, self._connection_record)
+        if pool._skip_unused_reset and \
+                self._reset_agent is None and \
+                self._connection_record is not None and \
+                not self._connection_record._reset_needed:
+            if self._echo:
+                pool.logger.debug("Connection %s unused, skipping reset",
+                                  self.connection)
+            return
         if pool._reset_on_return is reset_rollback:
             if self._echo:
                 pool.logger.debug("Connection %s rollback-on-return%s",
@@ -788,6 +1062,10 @@ class _ConnectionFairy(object):
                 self._reset_agent.commit()
             else:
                 pool._dialect.do_commit(self)
+        else:
+            return
+        if self._connection_record is not None:
+            self._connection_record._reset_needed = False
 
     @property
     def _logger(self):
@@ -853,9 +1131,11 @@ class _ConnectionFairy(object):
         method.
 
         """
+        self._mark_used()
         return self.connection.cursor(*args, **kwargs)
 
     def __getattr__(self, key):
+        self._mark_used()
         return getattr(self.connection, key)
 
     def detach(self):
@@ -937,6 +1217,10 @@ class SingletonThreadPool(Pool):
                               logging_name=self._orig_logging_name,
                               use_threadlocal=self._use_threadlocal,
                               reset_on_return=self._reset_on_return,
+                              skip_unused_reset=self._skip_unused_reset,
+                              pre_ping=self._pre_ping,
+                              pre_ping_window=self._pre_ping_window,
+                              stats=self._stats is not None,
                               _dispatch=self.dispatch,
                               _dialect=self._dialect)
 
@@ -990,6 +1274,7 @@ class QueuePool(Pool):
     """
 
     def __init__(self, creator, pool_size=5, max_overflow=10, timeout=30,
+                 use_lifo=False, min_size=0, maintenance_interval=None,
                  **kw):
         """
         Construct a QueuePool.
@@ -1022,18 +1307,119 @@ class QueuePool(Pool):
         :param timeout: The number of seconds to wait before giving up
           on returning a connection. Defaults to 30.
 
+        :param use_lifo: use LIFO (last-in-first-out) when retrieving
+          connections instead of FIFO (first-in-first-out). Using LIFO,
+          the most recently returned connection is always the next one
+          checked out, so that under moderate load a few connections
+          stay in use while the remainder sit idle, allowing
+          ``pool_recycle`` or server-side idle timeouts to close them.
+          Defaults to False.
+
+          .. versionadded:: 1.1
+
+        :param min_size: The number of connections the pool opens ahead
+          of their being requested, via :meth:`.QueuePool.prewarm` and
+          the maintenance thread established by ``maintenance_interval``.
+          May not exceed ``pool_size``.  Defaults to 0.
+
+          .. versionadded:: 1.1
+
+        :param maintenance_interval: If set, the number of seconds between
+          runs of a background thread which recycles connections in the
+          pool which have exceeded the ``recycle`` time or have been
+          invalidated, reconnects connections which were discarded, and
+          opens connections until the pool holds ``min_size``
+          connections, so that this work doesn't take place within
+          the checkout of a connection.  The thread ends when the pool
+          is disposed or garbage collected.  Defaults to None, meaning
+          no thread is started.
+
+          .. versionadded:: 1.1
+
         :param \**kw: Other keyword arguments including
           :paramref:`.Pool.recycle`, :paramref:`.Pool.echo`,
           :paramref:`.Pool.reset_on_return` and others are passed to the
           :class:`.Pool` constructor.
 
         """
+        if pool_size and min_size > pool_size:
+            raise exc.ArgumentError(
+                "min_size of %d may not exceed pool_size of %d" %
+                (min_size, pool_size))
         Pool.__init__(self, creator, **kw)
-        self._pool = sqla_queue.Queue(pool_size)
+        self._pool = sqla_queue.Queue(pool_size, use_lifo=use_lifo)
         self._overflow = 0 - pool_size
         self._max_overflow = max_overflow
         self._timeout = timeout
         self._overflow_lock = threading.Lock()
+        self._min_size = min_size
+        self._maintenance_interval = maintenance_interval
+        self._maintenance_stop = None
+        if maintenance_interval:
+            self._start_maintenance()
+
+    def _start_maintenance(self):
+        self._maintenance_stop = stop = threading.Event()
+        thread = threading.Thread(
+            target=_run_maintenance,
+            args=(weakref.ref(self), stop, self._maintenance_interval),
+            name="sqlalchemy pool maintenance")
+        thread.daemon = True
+        thread.start()
+
+    def prewarm(self):
+        """Open new connections until the pool holds ``min_size``
+        connections.
+
+        This is called by :func:`.create_engine` once the :class:`.Engine`
+        is set up, so that the first requests for connections don't
+        incur the time taken to connect.
+
+        .. versionadded:: 1.1
+
+        """
+        while self._overflow + self._pool.maxsize < self._min_size:
+            if not self._inc_overflow():
+                break
+            try:
+                rec = self._create_connection()
+            except Exception:
+                with util.safe_reraise():
+                    self._dec_overflow()
+            self._do_return_conn(rec)
+
+    def _maintain(self):
+        """Refresh the connections in the pool which would otherwise be
+        recycled or reconnected upon checkout, then open connections
+        up to ``min_size``.
+
+        Stale records stay available in the pool while their
+        replacements connect, so that checkouts meanwhile don't open
+        overflow connections; a record that was checked out in the
+        meantime is refreshed by its checkout, and its replacement is
+        closed.
+
+        """
+
+        with self._pool.mutex:
+            stale = [rec for rec in self._pool.queue if rec._is_stale()]
+        for rec in stale:
+            try:
+                new_rec = self._create_connection()
+            except Exception:
+                self.logger.error(
+                    "Exception refreshing connection", exc_info=True)
+                continue
+            with self._pool.mutex:
+                queue = self._pool.queue
+                for idx, pooled in enumerate(queue):
+                    if pooled is rec:
+                        queue[idx] = new_rec
+                        break
+                else:
+                    rec = new_rec
+            rec.close()
+        self.prewarm()
 
     def _do_return_conn(self, conn):
         try:
@@ -1072,13 +1458,18 @@ class QueuePool(Pool):
     def _inc_overflow(self):
         if self._max_overflow == -1:
             self._overflow += 1
-            return True
-        with self._overflow_lock:
-            if self._overflow < self._max_overflow:
-                self._overflow += 1
-                return True
-            else:
-                return False
+            overflow = self._overflow
+        else:
+            with self._overflow_lock:
+                if self._overflow < self._max_overflow:
+                    self._overflow += 1
+                    overflow = self._overflow
+                else:
+                    return False
+        if overflow > 0 and self._stats is not None:
+            # the connection to be made is in excess of pool_size
+            self._stats.incr('overflow_created')
+        return True
 
     def _dec_overflow(self):
         if self._max_overflow == -1:
@@ -1093,14 +1484,23 @@ class QueuePool(Pool):
         return self.__class__(self._creator, pool_size=self._pool.maxsize,
                               max_overflow=self._max_overflow,
                               timeout=self._timeout,
+                              use_lifo=self._pool.use_lifo,
+                              min_size=self._min_size,
+                              maintenance_interval=self._maintenance_interval,
                               recycle=self._recycle, echo=self.echo,
                               logging_name=self._orig_logging_name,
                               use_threadlocal=self._use_threadlocal,
                               reset_on_return=self._reset_on_return,
+                              skip_unused_reset=self._skip_unused_reset,
+                              pre_ping=self._pre_ping,
+                              pre_ping_window=self._pre_ping_window,
+                              stats=self._stats is not None,
                               _dispatch=self.dispatch,
                               _dialect=self._dialect)
 
     def dispose(self):
+        if self._maintenance_stop is not None:
+            self._maintenance_stop.set()
         while True:
             try:
                 conn = self._pool.get(False)
@@ -1119,6 +1519,15 @@ class QueuePool(Pool):
                                  self.overflow(),
                                  self.checkedout())
 
+    def stats(self):
+        stats = super(QueuePool, self).stats()
+        stats.update(
+            pool_size=self.size(),
+            checkedin=self.checkedin(),
+            checkedout=self.checkedout(),
+            overflow=self.overflow())
+        return stats
+
     def size(self):
         return self._pool.maxsize
 
@@ -1132,6 +1541,19 @@ class QueuePool(Pool):
         return self._pool.maxsize - self._pool.qsize() + self._overflow
 
 
+def _run_maintenance(pool_ref, stop, interval):
+    while not stop.wait(interval):
+        pool = pool_ref()
+        if pool is None:
+            return
+        try:
+            pool._maintain()
+        except Exception:
+            pool.logger.error(
+                "Exception during pool maintenance", exc_info=True)
+        del pool
+
+
 class NullPool(Pool):
 
     """A Pool which does not pool connections.
@@ -1167,6 +1589,10 @@ class NullPool(Pool):
                               logging_name=self._orig_logging_name,
                               use_threadlocal=self._use_threadlocal,
                               reset_on_return=self._reset_on_return,
+                              skip_unused_reset=self._skip_unused_reset,
+                              pre_ping=self._pre_ping,
+                              pre_ping_window=self._pre_ping_window,
+                              stats=self._stats is not None,
                               _dispatch=self.dispatch,
                               _dialect=self._dialect)
 
@@ -1207,6 +1633,10 @@ class StaticPool(Pool):
                               recycle=self._recycle,
                               use_threadlocal=self._use_threadlocal,
                               reset_on_return=self._reset_on_return,
+                              skip_unused_reset=self._skip_unused_reset,
+                              pre_ping=self._pre_ping,
+                              pre_ping_window=self._pre_ping_window,
+                              stats=self._stats is not None,
                               echo=self.echo,
                               logging_name=self._orig_logging_name,
                               _dispatch=self.dispatch,
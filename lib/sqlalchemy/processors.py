@@ -113,6 +113,23 @@ def py_fallback():
         else:
             return bool(value)
 
+    def process_rows(rows, processors):
+        num_processors = len(processors)
+        processors = [
+            (idx, processor) for idx, processor in enumerate(processors)
+            if processor is not None]
+        result = []
+        for row in rows:
+            row = list(row)
+            if len(row) != num_processors:
+                raise ValueError(
+                    "row has %d columns; %d processors were given" %
+                    (len(row), num_processors))
+            for idx, processor in processors:
+                row[idx] = processor(row[idx])
+            result.append(tuple(row))
+        return result
+
     DATETIME_RE = re.compile(
         "(\d+)-(\d+)-(\d+) (\d+):(\d+):(\d+)(?:\.(\d+))?")
     TIME_RE = re.compile("(\d+):(\d+):(\d+)(?:\.(\d+))?")
@@ -129,7 +146,7 @@ try:
         DecimalResultProcessor, \
         to_float, to_str, int_to_boolean, \
         str_to_datetime, str_to_time, \
-        str_to_date
+        str_to_date, process_rows
 
     def to_unicode_processor_factory(encoding, errors=None):
         if errors is not None:
@@ -314,6 +314,7 @@ class Generative(object):
     def _generate(self):
         s = self.__class__.__new__(self.__class__)
         s.__dict__ = self.__dict__.copy()
+        util.memoized_property.reset(s, '_memoized_cache_key')
         return s
 
 
@@ -167,6 +167,9 @@ class Compiled(object):
     """
 
     _cached_metadata = None
+    """a tuple of the names and types from ``cursor.description`` along
+    with the :class:`.ResultMetaData` built from them, reused by
+    subsequent executions which produce the same description."""
 
     def __init__(self, dialect, statement, bind=None,
                  schema_translate_map=None,
@@ -359,6 +362,30 @@ class SQLCompiler(Compiled):
     True unless using an unordered TextAsFrom.
     """
 
+    _insertmanyvalues = None
+    """for a single-row INSERT..VALUES, a tuple of the statement text
+    preceding the VALUES clause, the VALUES clause itself, the statement text
+    following it, and the bind names present in the VALUES clause.  Used by
+    the execution context to render executemany() as a series of multi-row
+    INSERT statements.
+    """
+
+    contains_expanding_parameters = False
+    """True if we've encountered bindparam(..., expanding=True).
+
+    These need to be converted before execution into individual
+    bind parameters for each element of the sequence passed.
+
+    """
+
+    _cache_key_bindparams = None
+    """the list of :class:`.BindParameter` objects collected by
+    :meth:`.ClauseElement._generate_cache_key` from the statement that was
+    compiled, in the order encountered.  Set when this compiled object is
+    stored in a compiled cache under a structural key, so that parameter
+    values can be taken from an equivalent statement at execution time.
+    """
+
     def __init__(self, dialect, statement, column_keys=None,
                  inline=False, **kwargs):
         """Construct a new :class:`.SQLCompiler` object.
@@ -486,52 +513,96 @@ class SQLCompiler(Compiled):
     def sql_compiler(self):
         return self
 
-    def construct_params(self, params=None, _group_number=None, _check=True):
+    @util.memoized_property
+    def _extracted_bind_positions(self):
+        """Map each bindparam in ``bind_names`` to the position within
+        ``_cache_key_bindparams`` of the bindparam it originated from.
+
+        Returns None if a collected bindparam was not rendered as a
+        placeholder, meaning its value is embedded in the SQL string.
+
+        """
+        positions = dict(
+            (id(bindparam), idx)
+            for idx, bindparam in enumerate(self._cache_key_bindparams))
+        result = {}
+        for bindparam in self.bind_names:
+            orig = bindparam
+            while orig is not None and id(orig) not in positions:
+                orig = orig._is_clone_of
+            if orig is not None:
+                result[bindparam] = positions[id(orig)]
+
+        rendered = set(result.values())
+        for idx, bindparam in enumerate(self._cache_key_bindparams):
+            # LIMIT / OFFSET values are part of the cache key, so they
+            # may be rendered inline
+            if idx not in rendered and \
+                    not isinstance(bindparam, selectable._OffsetLimitParam):
+                return None
+        return result
+
+    def construct_params(self, params=None, _group_number=None, _check=True,
+                         _extracted_parameters=None):
         """return a dictionary of bind parameter keys and values"""
 
+        if _extracted_parameters:
+            # values come from the bindparams of an equivalent statement
+            # to the one compiled; see _cache_key_bindparams
+            value_params = dict(
+                (bindparam, _extracted_parameters[idx])
+                for bindparam, idx in
+                self._extracted_bind_positions.items()
+            )
+        else:
+            value_params = {}
+
         if params:
             pd = {}
             for bindparam in self.bind_names:
                 name = self.bind_names[bindparam]
-                if bindparam.key in params:
-                    pd[name] = params[bindparam.key]
+                value_param = value_params.get(bindparam, bindparam)
+                if value_param.key in params:
+                    pd[name] = params[value_param.key]
                 elif name in params:
                     pd[name] = params[name]
 
-                elif _check and bindparam.required:
+                elif _check and value_param.required:
                     if _group_number:
                         raise exc.InvalidRequestError(
                             "A value is required for bind parameter %r, "
                             "in parameter group %d" %
-                            (bindparam.key, _group_number))
+                            (value_param.key, _group_number))
                     else:
                         raise exc.InvalidRequestError(
                             "A value is required for bind parameter %r"
-                            % bindparam.key)
+                            % value_param.key)
 
-                elif bindparam.callable:
-                    pd[name] = bindparam.effective_value
+                elif value_param.callable:
+                    pd[name] = value_param.effective_value
                 else:
-                    pd[name] = bindparam.value
+                    pd[name] = value_param.value
             return pd
         else:
             pd = {}
             for bindparam in self.bind_names:
-                if _check and bindparam.required:
+                value_param = value_params.get(bindparam, bindparam)
+                if _check and value_param.required:
                     if _group_number:
                         raise exc.InvalidRequestError(
                             "A value is required for bind parameter %r, "
                             "in parameter group %d" %
-                            (bindparam.key, _group_number))
+                            (value_param.key, _group_number))
                     else:
                         raise exc.InvalidRequestError(
                             "A value is required for bind parameter %r"
-                            % bindparam.key)
+                            % value_param.key)
 
-                if bindparam.callable:
-                    pd[self.bind_names[bindparam]] = bindparam.effective_value
+                if value_param.callable:
+                    pd[self.bind_names[bindparam]] = \
+                        value_param.effective_value
                 else:
-                    pd[self.bind_names[bindparam]] = bindparam.value
+                    pd[self.bind_names[bindparam]] = value_param.value
             return pd
 
     @property
@@ -1001,6 +1072,54 @@ class SQLCompiler(Compiled):
             else:
                 return self._generate_generic_binary(binary, opstring, **kw)
 
+    def visit_in_op_binary(self, binary, operator, **kw):
+        return self._generate_in_binary(binary, " IN ", **kw)
+
+    def visit_notin_op_binary(self, binary, operator, **kw):
+        return self._generate_in_binary(binary, " NOT IN ", **kw)
+
+    def _generate_in_binary(self, binary, opstring, **kw):
+        """render an IN, rendering the values of a list of bound
+        parameters inline if they alone would exceed the dialect's
+        ``max_bind_parameters``."""
+
+        limit = self.dialect.max_bind_parameters
+        if limit is None or kw.get('literal_binds') or \
+                not isinstance(binary.right, elements.Grouping) or \
+                not isinstance(binary.right.element, elements.ClauseList):
+            return self._generate_generic_binary(binary, opstring, **kw)
+
+        clauses = binary.right.element.clauses
+        if len(clauses) <= limit or not all(
+                isinstance(clause, elements.BindParameter) and
+                not clause.expanding and
+                not clause.type._has_bind_expression and
+                self._renders_exact_literal(clause.type) and
+                (clause.value is not None or clause.callable is not None)
+                for clause in clauses):
+            return self._generate_generic_binary(binary, opstring, **kw)
+
+        literal_kw = dict(kw, literal_binds=True)
+        try:
+            right = binary.right._compiler_dispatch(self, **literal_kw)
+        except NotImplementedError:
+            # the type can't be rendered as a literal
+            return self._generate_generic_binary(binary, opstring, **kw)
+        return binary.left._compiler_dispatch(self, **kw) + opstring + right
+
+    _exact_literal_types = (
+        sqltypes.Integer, sqltypes.Numeric, sqltypes.String, sqltypes.Boolean)
+
+    def _renders_exact_literal(self, type_):
+        """return True if values of the given type, rendered inline as
+        literals, compare the same as when sent as bound parameters.
+
+        Types such as binary, date and time types don't qualify, as
+        their literal rendering may be compared as a string.
+
+        """
+        return issubclass(type_._type_affinity, self._exact_literal_types)
+
     def visit_custom_op_binary(self, element, operator, **kw):
         return self._generate_generic_binary(
             element, " " + operator.opstring + " ", **kw)
@@ -1171,10 +1290,15 @@ class SQLCompiler(Compiled):
 
         self.binds[bindparam.key] = self.binds[name] = bindparam
 
-        return self.bindparam_string(name, **kwargs)
+        return self.bindparam_string(
+            name, expanding=bindparam.expanding, **kwargs)
 
     def render_literal_bindparam(self, bindparam, **kw):
         value = bindparam.effective_value
+        if bindparam.expanding:
+            return "(%s)" % ", ".join(
+                self.render_literal_value(elem, bindparam.type)
+                for elem in value)
         return self.render_literal_value(value, bindparam.type)
 
     def render_literal_value(self, value, type_):
@@ -1233,13 +1357,18 @@ class SQLCompiler(Compiled):
         self.anon_map[derived] = anonymous_counter + 1
         return derived + "_" + str(anonymous_counter)
 
-    def bindparam_string(self, name, positional_names=None, **kw):
+    def bindparam_string(self, name, positional_names=None,
+                         expanding=False, **kw):
         if self.positional:
             if positional_names is not None:
                 positional_names.append(name)
             else:
                 self.positiontup.append(name)
-        return self.bindtemplate % {'name': name}
+        if expanding:
+            self.contains_expanding_parameters = True
+            return "([EXPANDING_%s])" % name
+        else:
+            return self.bindtemplate % {'name': name}
 
     def visit_cte(self, cte, asfrom=False, ashint=False,
                   fromhints=None,
@@ -1926,6 +2055,14 @@ class SQLCompiler(Compiled):
         crud_params = crud._setup_crud_params(
             self, insert_stmt, crud.ISINSERT, **kw)
 
+        if toplevel:
+            # bind names rendered so far all belong to the VALUES clause;
+            # note these for "insertmanyvalues" batching
+            if self.positional:
+                values_bind_names = list(self.positiontup)
+            else:
+                values_bind_names = list(self.bind_names.values())
+
         if not crud_params and \
                 not self.dialect.supports_default_values and \
                 not self.dialect.supports_empty_insert:
@@ -1949,6 +2086,7 @@ class SQLCompiler(Compiled):
         supports_default_values = self.dialect.supports_default_values
 
         text = "INSERT "
+        values_pos = None
 
         if insert_stmt._prefixes:
             text += self._generate_prefixes(insert_stmt,
@@ -1992,8 +2130,10 @@ class SQLCompiler(Compiled):
                 )
             )
         else:
-            text += " VALUES (%s)" % \
-                ', '.join([c[1] for c in crud_params])
+            values_clause = "(%s)" % ', '.join([c[1] for c in crud_params])
+            text += " VALUES "
+            values_pos = len(text)
+            text += values_clause
 
         if insert_stmt._post_values_clause is not None:
             post_values_clause = self.process(
@@ -2006,6 +2146,12 @@ class SQLCompiler(Compiled):
 
         if self.ctes and toplevel:
             text = self._render_cte_clause() + text
+        elif toplevel and crud_params and values_pos is not None:
+            self._insertmanyvalues = (
+                text[:values_pos], values_clause,
+                text[values_pos + len(values_clause):],
+                values_bind_names
+            )
 
         self.stack.pop(-1)
 
@@ -2014,6 +2160,42 @@ class SQLCompiler(Compiled):
         else:
             return text
 
+    @util.memoized_property
+    def _insertmanyvalues_row_template(self):
+        """Produce a ``str.format()`` template for one row of a multi-row
+        VALUES clause, where each bind parameter name is suffixed with
+        the row number.
+
+        Positional paramstyles repeat the VALUES clause unchanged, so
+        ``None`` is returned for those.
+
+        """
+        values_clause, bind_names = self._insertmanyvalues[1], \
+            self._insertmanyvalues[3]
+        if self.positional:
+            return None
+        elif not bind_names:
+            return values_clause.replace("{", "{{").replace("}", "}}")
+
+        tokens = dict(
+            (self.bindtemplate % {'name': name}, name)
+            for name in bind_names
+        )
+        # longest tokens first, and don't match ":foo" within ":foobar"
+        pattern = re.compile(
+            r"(%s)(?![\w\$])" % "|".join(
+                re.escape(tok)
+                for tok in sorted(tokens, key=len, reverse=True))
+        )
+        template = []
+        for idx, part in enumerate(pattern.split(values_clause)):
+            if idx % 2:
+                template.append(
+                    self.bindtemplate % {'name': tokens[part] + "__{0}"})
+            else:
+                template.append(part.replace("{", "{{").replace("}", "}}"))
+        return "".join(template)
+
     def update_limit_clause(self, update_stmt):
         """Provide a hook for MySQL to add LIMIT to the UPDATE"""
         return None
@@ -111,7 +111,7 @@ def _get_crud_params(compiler, stmt, **kw):
 
     if stmt_parameters is not None:
         _get_stmt_parameters_params(
-            compiler,
+            compiler, stmt,
             parameters, stmt_parameters, _column_as_key, values, kw)
 
     check_columns = {}
@@ -152,12 +152,15 @@ def _get_crud_params(compiler, stmt, **kw):
 
 def _create_bind_param(
         compiler, col, value, process=True,
-        required=False, name=None, **kw):
+        required=False, name=None, origin=None, **kw):
     if name is None:
         name = col.key
     bindparam = elements.BindParameter(
         name, value, type_=col.type, required=required)
     bindparam._is_crud = True
+    if origin is not None:
+        # a value from stmt.parameters; see ValuesBase._literal_bindparam
+        bindparam._is_clone_of = origin
     if process:
         bindparam = bindparam._compiler_dispatch(compiler, **kw)
     return bindparam
@@ -316,6 +319,8 @@ def _append_param_parameter(
             name=_col_bind_name(c)
             if not stmt._has_multi_parameters
             else "%s_0" % _col_bind_name(c),
+            origin=stmt._literal_bindparam(0, col_key, value)
+            if value is not REQUIRED else None,
             **kw
         )
     else:
@@ -552,7 +557,8 @@ def _get_multitable_params(
                 if elements._is_literal(value):
                     value = _create_bind_param(
                         compiler, c, value, required=value is REQUIRED,
-                        name=_col_bind_name(c))
+                        name=_col_bind_name(c),
+                        origin=stmt._literal_bindparam(0, c, value))
                 else:
                     compiler.postfetch.append(c)
                     value = compiler.process(value.self_group(), **kw)
@@ -592,7 +598,8 @@ def _extend_values_for_multiparams(compiler, stmt, values, kw):
                 c,
                 (_create_bind_param(
                     compiler, c, row[c.key],
-                    name="%s_%d" % (c.key, i + 1)
+                    name="%s_%d" % (c.key, i + 1),
+                    origin=stmt._literal_bindparam(i + 1, c.key, row[c.key])
                 ) if elements._is_literal(row[c.key])
                     else compiler.process(
                         row[c.key].self_group(), **kw))
@@ -607,7 +614,8 @@ def _extend_values_for_multiparams(compiler, stmt, values, kw):
 
 
 def _get_stmt_parameters_params(
-        compiler, parameters, stmt_parameters, _column_as_key, values, kw):
+        compiler, stmt, parameters, stmt_parameters, _column_as_key,
+        values, kw):
     for k, v in stmt_parameters.items():
         colkey = _column_as_key(k)
         if colkey is not None:
@@ -617,9 +625,9 @@ def _get_stmt_parameters_params(
             # add it to values() in an "as-is" state,
             # coercing right side to bound param
             if elements._is_literal(v):
-                v = compiler.process(
-                    elements.BindParameter(None, v, type_=k.type),
-                    **kw)
+                bindparam = elements.BindParameter(None, v, type_=k.type)
+                bindparam._is_clone_of = stmt._literal_bindparam(0, k, v)
+                v = compiler.process(bindparam, **kw)
             else:
                 v = compiler.process(v.self_group(), **kw)
 
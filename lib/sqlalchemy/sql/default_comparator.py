@@ -126,6 +126,10 @@ def _in_impl(expr, op, seq_or_selectable, negate_op, **kw):
     elif isinstance(seq_or_selectable, (Selectable, TextClause)):
         return _boolean_compare(expr, op, seq_or_selectable,
                                 negate=negate_op, **kw)
+    elif isinstance(seq_or_selectable, BindParameter) and \
+            seq_or_selectable.expanding:
+        return _boolean_compare(expr, op, seq_or_selectable,
+                                negate=negate_op)
     elif isinstance(seq_or_selectable, ClauseElement):
         raise exc.InvalidRequestError(
             'in_() accepts'
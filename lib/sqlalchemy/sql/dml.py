@@ -12,7 +12,9 @@ Provide :class:`.Insert`, :class:`.Update` and :class:`.Delete`.
 from .base import Executable, _generative, _from_objects, DialectKWArgs, \
     ColumnCollection
 from .elements import ClauseElement, _literal_as_text, Null, and_, _clone, \
-    _column_as_key
+    _column_as_key, _NoCacheKey, _element_cache_key, _elements_cache_key, \
+    _value_cache_key, _is_literal, _clause_element_as_expr, BindParameter
+from . import type_api
 from .selectable import _interpret_as_from, _interpret_as_select, \
     HasPrefixes, HasCTE
 from .. import util
@@ -65,6 +67,29 @@ class UpdateBase(
         else:
             return process_single(parameters), False
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        if self._hints:
+            raise _NoCacheKey()
+
+        return (
+            self.__class__,
+            _element_cache_key(self.table, anon_map, bindparams),
+            self._returning is not None and _elements_cache_key(
+                self._returning, anon_map, bindparams),
+            tuple(
+                (_element_cache_key(prefix, anon_map, bindparams), dialect)
+                for prefix, dialect in self._prefixes),
+            tuple(
+                (key, _value_cache_key(value, anon_map, bindparams))
+                for key, value in sorted(self.dialect_kwargs.items()))
+        ) + self._gen_dml_cache_key(anon_map, bindparams)
+
+    def _gen_dml_cache_key(self, anon_map, bindparams):
+        return ()
+
+    def _result_column_elements(self):
+        return self._returning or ()
+
     def params(self, *arg, **kw):
         """Set the parameters for the statement.
 
@@ -203,6 +228,77 @@ class ValuesBase(UpdateBase):
         if prefixes:
             self._setup_prefixes(prefixes)
 
+    def _gen_dml_cache_key(self, anon_map, bindparams):
+        def value_key(index, key, value):
+            if _is_literal(value):
+                # plain values are rendered as bound parameters of the
+                # column's type; collect them like any other bindparam
+                bindparams.append(self._literal_bindparam(index, key, value))
+                return BindParameter
+            else:
+                return _value_cache_key(value, anon_map, bindparams)
+
+        def parameters_key(index, parameters):
+            return tuple(
+                (_value_cache_key(key, anon_map, bindparams),
+                 value_key(index, key, value))
+                for key, value in parameters.items())
+
+        if self.parameters is None:
+            parameters = None
+        elif self._has_multi_parameters:
+            parameters = tuple(
+                parameters_key(index, p)
+                for index, p in enumerate(self.parameters))
+        else:
+            parameters = parameters_key(0, self.parameters)
+
+        return_defaults = self._return_defaults
+        if return_defaults and return_defaults is not True:
+            return_defaults = _elements_cache_key(
+                return_defaults, anon_map, bindparams)
+
+        return (
+            parameters,
+            self._has_multi_parameters,
+            self._preserve_parameter_order,
+            self._parameter_ordering is not None and tuple(
+                _value_cache_key(key, anon_map, bindparams)
+                for key in self._parameter_ordering),
+            self.inline,
+            return_defaults,
+            _element_cache_key(
+                self._post_values_clause, anon_map, bindparams)
+        )
+
+    def _literal_bindparam(self, index, key, value):
+        """Return a :class:`.BindParameter` standing for a plain value
+        present in :attr:`.parameters`.
+
+        The bound parameters which the compiler creates for such values
+        refer to this object as the one they're cloned from, so that the
+        values of a statement with the same cache key may be applied to
+        the :class:`.Compiled` object.
+
+        """
+        col = _clause_element_as_expr(key)
+        if isinstance(col, util.string_types):
+            lookup = (index, col)
+        elif getattr(col, 'table', None) is self.table:
+            lookup = (index, col.key)
+        else:
+            lookup = (index, col)
+
+        memo = self.__dict__.get('_literal_bindparams')
+        if memo is None:
+            memo = self._literal_bindparams = {}
+
+        bindparam = memo.get(lookup)
+        if bindparam is None or bindparam.value is not value:
+            bindparam = memo[lookup] = BindParameter(
+                None, value, type_=type_api.NULLTYPE)
+        return bindparam
+
     @_generative
     def values(self, *args, **kwargs):
         """specify a fixed VALUES clause for an INSERT statement, or the SET
@@ -345,6 +441,8 @@ class ValuesBase(UpdateBase):
         else:
             v = {}
 
+        self._literal_bindparams = None
+
         if self.parameters is None:
             self.parameters, self._has_multi_parameters = \
                 self._process_colparams(v)
@@ -594,6 +692,18 @@ class Insert(ValuesBase):
         if self.select is not None:
             self.select = _clone(self.select)
 
+    def _gen_dml_cache_key(self, anon_map, bindparams):
+        key = super(Insert, self)._gen_dml_cache_key(anon_map, bindparams)
+        if self.select is None:
+            return key
+        return key + (
+            _element_cache_key(self.select, anon_map, bindparams),
+            tuple(
+                _value_cache_key(name, anon_map, bindparams)
+                for name in self.select_names),
+            self.include_insert_from_select_defaults
+        )
+
 
 class Update(ValuesBase):
     """Represent an Update construct.
@@ -753,6 +863,12 @@ class Update(ValuesBase):
         self._whereclause = clone(self._whereclause, **kw)
         self.parameters = self.parameters.copy()
 
+    def _gen_dml_cache_key(self, anon_map, bindparams):
+        return super(Update, self)._gen_dml_cache_key(
+            anon_map, bindparams) + (
+            _element_cache_key(self._whereclause, anon_map, bindparams),
+        )
+
     @_generative
     def where(self, whereclause):
         """return a new update() construct with the given expression added to
@@ -848,3 +964,8 @@ class Delete(UpdateBase):
     def _copy_internals(self, clone=_clone, **kw):
         # TODO: coverage
         self._whereclause = clone(self._whereclause, **kw)
+
+    def _gen_dml_cache_key(self, anon_map, bindparams):
+        return (
+            _element_cache_key(self._whereclause, anon_map, bindparams),
+        )
@@ -30,6 +30,11 @@ def _clone(element, **kw):
     return element._clone()
 
 
+class _NoCacheKey(Exception):
+    """Raised within :meth:`.ClauseElement._gen_cache_key` when an
+    element does not support structural caching."""
+
+
 def collate(expression, collation):
     """Return the clause ``expression COLLATE collation``.
 
@@ -182,6 +187,7 @@ class ClauseElement(Visitable):
         c = self.__class__.__new__(self.__class__)
         c.__dict__ = self.__dict__.copy()
         ClauseElement._cloned_set._reset(c)
+        ClauseElement._memoized_cache_key._reset(c)
         ColumnElement.comparator._reset(c)
 
         # this is a marker that helps to "equate" clauses to each other
@@ -314,6 +320,66 @@ class ClauseElement(Visitable):
         """
         return self is other
 
+    def _generate_cache_key(self):
+        """Return a structural cache key for this :class:`.ClauseElement`.
+
+        The return value is a tuple ``(key, bindparams)``.  ``key`` is
+        a hashable structure which is equal for two statements that
+        compile to the same SQL string, regardless of the values present
+        in their bound parameters.  ``bindparams`` is the list of
+        :class:`.BindParameter` objects present in the statement, in the
+        order in which they were encountered; two statements that produce
+        the same ``key`` produce their ``bindparams`` in corresponding
+        order, so that the values of one may be applied to a
+        :class:`.Compiled` object generated from the other.
+
+        Returns ``None`` if this element, or any element within it, does
+        not support structural caching.
+
+        """
+        bindparams = []
+        try:
+            key = self._gen_cache_key({}, bindparams)
+        except _NoCacheKey:
+            return None
+        return key, bindparams
+
+    @util.memoized_property
+    def _memoized_cache_key(self):
+        """The value of :meth:`._generate_cache_key`, memoized.
+
+        Used for caches passed using the ``compiled_cache`` execution
+        option, which have always relied on a statement not being
+        modified in place once executed.  Reset when the element is
+        copied.
+
+        """
+        return self._generate_cache_key()
+
+    def _gen_cache_key(self, anon_map, bindparams):
+        """Return the structural cache key of this element.
+
+        Subclasses which can be cached structurally override this method,
+        adding any :class:`.BindParameter` objects they contain to the
+        ``bindparams`` list; ``anon_map`` is used to establish stable
+        identifiers for anonymous names and for elements that appear
+        more than once.  The base implementation raises, indicating that
+        the element doesn't support caching.
+
+        """
+        raise _NoCacheKey()
+
+    def _result_column_elements(self):
+        """Return the elements which this statement delivers as
+        columns in a result set, in order, which may include the
+        elements of labels.
+
+        Used to target the columns of a statement that's equivalent to
+        the one from which a :class:`.Compiled` object was produced.
+
+        """
+        return ()
+
     def _copy_internals(self, clone=_clone, **kw):
         """Reassign internal elements to be clones of themselves.
 
@@ -859,6 +925,7 @@ class BindParameter(ColumnElement):
                  unique=False, required=NO_ARG,
                  quote=None, callable_=None,
                  isoutparam=False,
+                 expanding=False,
                  _compared_to_operator=None,
                  _compared_to_type=None):
         """Produce a "bound expression".
@@ -1043,6 +1110,30 @@ class BindParameter(ColumnElement):
           "OUT" parameter.  This applies to backends such as Oracle which
           support OUT parameters.
 
+        :param expanding:
+          if True, this parameter will be treated as an "expanding" parameter
+          at execution time; the parameter value is expected to be a sequence,
+          rather than a scalar value, and the string SQL statement will
+          be transformed on a per-execution basis to accommodate the sequence
+          with a variable number of parameter slots passed to the DBAPI.
+          This is to allow statement caching to be used in conjunction with
+          an IN clause::
+
+            stmt = select([users_table]).\\
+                where(users_table.c.id.in_(bindparam('ids', expanding=True)))
+
+            connection.execute(stmt, ids=[1, 2, 3])
+
+          As the statement string is the same for any number of values,
+          a single :class:`.Compiled` object serves sequences of any
+          length.  Each element of the sequence is processed by the
+          bind processor of the parameter's type.
+
+          .. note:: The "expanding" feature does not support "executemany"-
+             style parameter sets, nor does it support empty sequences.
+
+          .. versionadded:: 1.1
+
         .. seealso::
 
             :ref:`coretutorial_bind_param`
@@ -1084,6 +1175,7 @@ class BindParameter(ColumnElement):
         self.callable = callable_
         self.isoutparam = isoutparam
         self.required = required
+        self.expanding = expanding
         if type_ is None:
             if _compared_to_type is not None:
                 self.type = \
@@ -1136,6 +1228,26 @@ class BindParameter(ColumnElement):
             self.key = _anonymous_label(
                 '%%(%d %s)s' % (id(self), self._orig_key or 'param'))
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        idself = id(self)
+        if idself in anon_map:
+            return (anon_map[idself], self.__class__)
+        anon_map[idself] = len(anon_map)
+
+        # the value is not part of the key; the parameter itself is
+        # collected so that its value can be applied to a Compiled
+        # object generated from an equivalent statement.
+        bindparams.append(self)
+        return (
+            self.__class__,
+            _name_cache_key(self.key, anon_map),
+            _type_cache_key(self.type),
+            self.unique,
+            self.required,
+            self.isoutparam,
+            self.expanding
+        )
+
     def compare(self, other, **kw):
         """Compare this :class:`BindParameter` to the given
         clause."""
@@ -1172,6 +1284,9 @@ class TypeClause(ClauseElement):
     def __init__(self, type):
         self.type = type
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (self.__class__, _type_cache_key(self.type))
+
 
 class TextClause(Executable, ClauseElement):
     """Represent a literal SQL text fragment.
@@ -1607,6 +1722,12 @@ class TextClause(Executable, ClauseElement):
     def get_children(self, **kwargs):
         return list(self._bindparams.values())
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (self.__class__, self.text) + tuple(
+            (name, self._bindparams[name]._gen_cache_key(
+                anon_map, bindparams))
+            for name in sorted(self._bindparams))
+
     def compare(self, other):
         return isinstance(other, TextClause) and other.text == self.text
 
@@ -1634,6 +1755,9 @@ class Null(ColumnElement):
     def compare(self, other):
         return isinstance(other, Null)
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (self.__class__, )
+
 
 class False_(ColumnElement):
     """Represent the ``false`` keyword, or equivalent, in a SQL statement.
@@ -1693,6 +1817,9 @@ class False_(ColumnElement):
     def compare(self, other):
         return isinstance(other, False_)
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (self.__class__, )
+
 
 class True_(ColumnElement):
     """Represent the ``true`` keyword, or equivalent, in a SQL statement.
@@ -1759,6 +1886,9 @@ class True_(ColumnElement):
     def compare(self, other):
         return isinstance(other, True_)
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (self.__class__, )
+
 
 class ClauseList(ClauseElement):
     """Describe a list of clauses, separated by an operator.
@@ -1807,6 +1937,10 @@ class ClauseList(ClauseElement):
     def get_children(self, **kwargs):
         return self.clauses
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (self.__class__, self.operator, self.group) + \
+            _elements_cache_key(self.clauses, anon_map, bindparams)
+
     @property
     def _from_objects(self):
         return list(itertools.chain(*[c._from_objects for c in self.clauses]))
@@ -1998,6 +2132,10 @@ class Tuple(ClauseList, ColumnElement):
 
         super(Tuple, self).__init__(*clauses, **kw)
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return ClauseList._gen_cache_key(self, anon_map, bindparams) + \
+            (_type_cache_key(self.type), )
+
     @property
     def _select_iterable(self):
         return (self, )
@@ -2211,6 +2349,18 @@ class Case(ColumnElement):
         if self.else_ is not None:
             yield self.else_
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            _element_cache_key(self.value, anon_map, bindparams),
+            tuple(
+                (x._gen_cache_key(anon_map, bindparams),
+                 y._gen_cache_key(anon_map, bindparams))
+                for x, y in self.whens),
+            _element_cache_key(self.else_, anon_map, bindparams),
+            _type_cache_key(self.type)
+        )
+
     @property
     def _from_objects(self):
         return list(itertools.chain(*[x._from_objects for x in
@@ -2332,6 +2482,13 @@ class Cast(ColumnElement):
     def get_children(self, **kwargs):
         return self.clause, self.typeclause
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            self.clause._gen_cache_key(anon_map, bindparams),
+            _type_cache_key(self.type)
+        )
+
     @property
     def _from_objects(self):
         return self.clause._from_objects
@@ -2426,6 +2583,13 @@ class TypeCoerce(ColumnElement):
     def get_children(self, **kwargs):
         return self.clause,
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            self.clause._gen_cache_key(anon_map, bindparams),
+            _type_cache_key(self.type)
+        )
+
     @property
     def _from_objects(self):
         return self.clause._from_objects
@@ -2463,6 +2627,13 @@ class Extract(ColumnElement):
     def get_children(self, **kwargs):
         return self.expr,
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            self.field,
+            self.expr._gen_cache_key(anon_map, bindparams)
+        )
+
     @property
     def _from_objects(self):
         return self.expr._from_objects
@@ -2488,6 +2659,12 @@ class _label_reference(ColumnElement):
     def _copy_internals(self, clone=_clone, **kw):
         self.element = clone(self.element, **kw)
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            self.element._gen_cache_key(anon_map, bindparams)
+        )
+
     @property
     def _from_objects(self):
         return ()
@@ -2503,6 +2680,9 @@ class _textual_label_reference(ColumnElement):
     def _text_clause(self):
         return TextClause._create_text(self.element)
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (self.__class__, self.element)
+
 
 class UnaryExpression(ColumnElement):
     """Define a 'unary' expression.
@@ -2751,6 +2931,17 @@ class UnaryExpression(ColumnElement):
     def get_children(self, **kwargs):
         return self.element,
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            self.element._gen_cache_key(anon_map, bindparams),
+            self.operator,
+            self.modifier,
+            self.negate,
+            self.wraps_column_expression,
+            _type_cache_key(self.type)
+        )
+
     def compare(self, other, **kw):
         """Compare this :class:`UnaryExpression` against the given
         :class:`.ClauseElement`."""
@@ -2950,6 +3141,19 @@ class BinaryExpression(ColumnElement):
     def get_children(self, **kwargs):
         return self.left, self.right
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            self.left._gen_cache_key(anon_map, bindparams),
+            self.right._gen_cache_key(anon_map, bindparams),
+            self.operator,
+            self.negate,
+            tuple(
+                (key, _value_cache_key(value, anon_map, bindparams))
+                for key, value in sorted(self.modifiers.items())),
+            _type_cache_key(self.type)
+        )
+
     def compare(self, other, **kw):
         """Compare this :class:`BinaryExpression` against the
         given :class:`BinaryExpression`."""
@@ -3006,6 +3210,11 @@ class Slice(ColumnElement):
         assert against is operator.getitem
         return self
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (self.__class__, ) + tuple(
+            _value_cache_key(value, anon_map, bindparams)
+            for value in (self.start, self.stop, self.step))
+
 
 class IndexExpression(BinaryExpression):
     """Represent the class of expressions that are like an "index" operation.
@@ -3057,6 +3266,12 @@ class Grouping(ColumnElement):
         return isinstance(other, Grouping) and \
             self.element.compare(other.element)
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            self.element._gen_cache_key(anon_map, bindparams)
+        )
+
 
 RANGE_UNBOUNDED = util.symbol("RANGE_UNBOUNDED")
 RANGE_CURRENT = util.symbol("RANGE_CURRENT")
@@ -3240,6 +3455,24 @@ class Over(ColumnElement):
                 (self.element, self.partition_by, self.order_by)
                 if c is not None]
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            self.element._gen_cache_key(anon_map, bindparams),
+            _element_cache_key(self.partition_by, anon_map, bindparams),
+            _element_cache_key(self.order_by, anon_map, bindparams),
+            self._range_cache_key(self.range_, anon_map, bindparams),
+            self._range_cache_key(self.rows, anon_map, bindparams)
+        )
+
+    def _range_cache_key(self, range_, anon_map, bindparams):
+        if range_ is None:
+            return None
+        return tuple(
+            value if value is RANGE_UNBOUNDED or value is RANGE_CURRENT
+            else value._gen_cache_key(anon_map, bindparams)
+            for value in range_)
+
     def _copy_internals(self, clone=_clone, **kw):
         self.element = clone(self.element, **kw)
         if self.partition_by is not None:
@@ -3341,6 +3574,13 @@ class WithinGroup(ColumnElement):
                 (self.func, self.order_by)
                 if c is not None]
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            self.element._gen_cache_key(anon_map, bindparams),
+            _element_cache_key(self.order_by, anon_map, bindparams)
+        )
+
     def _copy_internals(self, clone=_clone, **kw):
         self.element = clone(self.element, **kw)
         if self.order_by is not None:
@@ -3456,6 +3696,13 @@ class FunctionFilter(ColumnElement):
                 (self.func, self.criterion)
                 if c is not None]
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            self.func._gen_cache_key(anon_map, bindparams),
+            _element_cache_key(self.criterion, anon_map, bindparams)
+        )
+
     def _copy_internals(self, clone=_clone, **kw):
         self.func = clone(self.func, **kw)
         if self.criterion is not None:
@@ -3570,6 +3817,14 @@ class Label(ColumnElement):
     def _from_objects(self):
         return self.element._from_objects
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            _name_cache_key(self.name, anon_map),
+            self._element._gen_cache_key(anon_map, bindparams),
+            _type_cache_key(self._type)
+        )
+
     def _make_proxy(self, selectable, name=None, **kw):
         e = self.element._make_proxy(selectable,
                                      name=name if name else self.name)
@@ -3831,6 +4086,16 @@ class ColumnClause(Immutable, ColumnElement):
             selectable._columns[c.key] = c
         return c
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            _name_cache_key(self.name, anon_map),
+            _name_cache_key(self.key, anon_map),
+            _element_cache_key(self.table, anon_map, bindparams),
+            _type_cache_key(self.type),
+            self.is_literal
+        )
+
 
 class _IdentifiedClause(Executable, ClauseElement):
 
@@ -3841,6 +4106,9 @@ class _IdentifiedClause(Executable, ClauseElement):
     def __init__(self, ident):
         self.ident = ident
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (self.__class__, self.ident)
+
 
 class SavepointClause(_IdentifiedClause):
     __visit_name__ = 'savepoint'
@@ -4088,6 +4356,63 @@ def _string_or_unprintable(element):
             return "unprintable element %r" % element
 
 
+_anon_label_ident = re.compile(r'%\((\d+) ')
+
+
+def _name_cache_key(name, anon_map):
+    """return a cache key for a name, replacing the object identifiers
+    embedded in anonymous labels with identifiers that are stable
+    for the structure of the statement."""
+
+    if isinstance(name, _anonymous_label):
+        name = _anon_label_ident.sub(
+            lambda m: '%%(%d ' % anon_map.setdefault(
+                m.group(1), len(anon_map)),
+            name)
+    elif isinstance(name, quoted_name):
+        return (name.__class__, util.text_type(name), name.quote)
+    return name
+
+
+def _element_cache_key(element, anon_map, bindparams):
+    """return the cache key for an optional element."""
+
+    if element is None:
+        return None
+    return element._gen_cache_key(anon_map, bindparams)
+
+
+def _elements_cache_key(elements, anon_map, bindparams):
+    """return the cache key for a sequence of elements."""
+
+    return tuple(
+        element._gen_cache_key(anon_map, bindparams)
+        for element in elements)
+
+
+def _type_cache_key(type_):
+    if type_ is None:
+        return None
+    return type_._static_cache_key
+
+
+def _value_cache_key(value, anon_map, bindparams):
+    """return the cache key for a value that may be either a SQL
+    expression or a plain Python value which the compiler renders
+    into the statement."""
+
+    if hasattr(value, '__clause_element__'):
+        value = value.__clause_element__()
+    if isinstance(value, ClauseElement):
+        return value._gen_cache_key(anon_map, bindparams)
+    try:
+        hash(value)
+    except TypeError:
+        raise _NoCacheKey()
+    else:
+        return (value.__class__, value)
+
+
 def _expand_cloned(elements):
     """expand the given set of ClauseElements to be the set of all 'cloned'
     predecessors.
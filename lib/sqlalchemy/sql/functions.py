@@ -12,7 +12,8 @@ from . import sqltypes, schema
 from .base import Executable, ColumnCollection
 from .elements import ClauseList, Cast, Extract, _literal_as_binds, \
     literal_column, _type_from_args, ColumnElement, _clone,\
-    Over, BindParameter, FunctionFilter, Grouping, WithinGroup
+    Over, BindParameter, FunctionFilter, Grouping, WithinGroup, \
+    _type_cache_key
 from .selectable import FromClause, Select, Alias
 from . import util as sqlutil
 from . import operators
@@ -178,6 +179,15 @@ class FunctionElement(Executable, ColumnElement, FromClause):
         self._reset_exported()
         FunctionElement.clauses._reset(self)
 
+    def _gen_from_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            getattr(self, 'name', None),
+            tuple(self.packagenames),
+            self.clause_expr._gen_cache_key(anon_map, bindparams),
+            _type_cache_key(self.type)
+        )
+
     def within_group_type(self, within_group):
         """For types that define their return type as based on the criteria
         within a WITHIN GROUP (ORDER BY) expression, called by the
@@ -562,6 +572,9 @@ class next_value(GenericFunction):
         self._bind = kw.get('bind', None)
         self.sequence = seq
 
+    def _gen_from_cache_key(self, anon_map, bindparams):
+        return (self.__class__, self.sequence)
+
     @property
     def _from_objects(self):
         return []
@@ -615,6 +615,11 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
         """
         return _get_table_key(self.name, self.schema)
 
+    def _gen_from_cache_key(self, anon_map, bindparams):
+        # a Table is a schema-level object that's keyed on identity;
+        # the columns are included as they may be added to after the fact
+        return (self._deannotate(), tuple(self.columns))
+
     def __repr__(self):
         return "Table(%s)" % ', '.join(
             [repr(self.name)] + [repr(self.metadata)] +
@@ -1256,6 +1261,14 @@ class Column(SchemaItem, ColumnClause):
     def append_foreign_key(self, fk):
         fk._set_parent_with_dispatch(self)
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        # a Column attached to a Table is keyed on identity along
+        # with its parent; a Column proxied onto an alias or subquery
+        # is keyed structurally like any other ColumnClause
+        if isinstance(self.table, Table):
+            return (self._deannotate(), )
+        return ColumnClause._gen_cache_key(self, anon_map, bindparams)
+
     def __repr__(self):
         kwarg = []
         if self.key != self.name:
@@ -11,12 +11,14 @@ SQL tables and derived rowsets.
 """
 
 from .elements import ClauseElement, TextClause, ClauseList, \
-    and_, Grouping, UnaryExpression, literal_column, BindParameter
+    and_, Grouping, UnaryExpression, literal_column, BindParameter, Label
 from .elements import _clone, \
     _literal_as_text, _interpret_as_column_or_from, _expand_cloned,\
     _select_iterables, _anonymous_label, _clause_element_as_expr,\
     _cloned_intersection, _cloned_difference, True_, \
-    _literal_as_label_reference, _literal_and_labels_as_label_reference
+    _literal_as_label_reference, _literal_and_labels_as_label_reference, \
+    _NoCacheKey, _name_cache_key, _element_cache_key, \
+    _elements_cache_key, _value_cache_key
 from .base import Immutable, Executable, _generative, \
     ColumnCollection, ColumnSet, _from_objects, Generative
 from . import type_api
@@ -63,6 +65,12 @@ class _OffsetLimitParam(BindParameter):
     def _limit_offset_value(self):
         return self.effective_value
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        # some backends render LIMIT / OFFSET values inline, so the value
+        # is part of the key
+        return BindParameter._gen_cache_key(self, anon_map, bindparams) + \
+            (self.effective_value, )
+
 
 def _offset_or_limit_clause(element, name=None, type_=None):
     """Convert the given value to an "offset or limit" clause.
@@ -664,6 +672,7 @@ class FromClause(Selectable):
         """delete memoized collections when a FromClause is cloned."""
 
         self._memoized_property.expire_instance(self)
+        ClauseElement._memoized_cache_key._reset(self)
 
     @_memoized_property
     def columns(self):
@@ -759,6 +768,19 @@ class FromClause(Selectable):
         else:
             return None
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        # a FROM clause is typically referred to many times within a
+        # statement, e.g. by each of its columns; establish its key once
+        # and refer to it positionally thereafter.
+        idself = id(self)
+        if idself in anon_map:
+            return (anon_map[idself], self.__class__)
+        anon_map[idself] = len(anon_map)
+        return self._gen_from_cache_key(anon_map, bindparams)
+
+    def _gen_from_cache_key(self, anon_map, bindparams):
+        raise _NoCacheKey()
+
 
 class Join(FromClause):
     """represent a ``JOIN`` construct between two :class:`.FromClause`
@@ -920,6 +942,16 @@ class Join(FromClause):
     def get_children(self, **kwargs):
         return self.left, self.right, self.onclause
 
+    def _gen_from_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            self.left._gen_cache_key(anon_map, bindparams),
+            self.right._gen_cache_key(anon_map, bindparams),
+            self.onclause._gen_cache_key(anon_map, bindparams),
+            self.isouter,
+            self.full
+        )
+
     def _match_primaries(self, left, right):
         if isinstance(left, Join):
             left_right = left.right
@@ -1298,6 +1330,13 @@ class Alias(FromClause):
                 yield c
         yield self.element
 
+    def _gen_from_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            _name_cache_key(self.name, anon_map),
+            self.element._gen_cache_key(anon_map, bindparams)
+        )
+
     @property
     def _from_objects(self):
         return [self]
@@ -1359,6 +1398,13 @@ class TableSample(Alias):
         else:
             return functions.func.system(self.sampling)
 
+    def _gen_from_cache_key(self, anon_map, bindparams):
+        return super(TableSample, self)._gen_from_cache_key(
+            anon_map, bindparams) + (
+            _value_cache_key(self.sampling, anon_map, bindparams),
+            _value_cache_key(self.seed, anon_map, bindparams)
+        )
+
 
 class CTE(Generative, HasSuffixes, Alias):
     """Represent a Common Table Expression.
@@ -1393,6 +1439,17 @@ class CTE(Generative, HasSuffixes, Alias):
             clone(elem, **kw) for elem in self._restates
         ])
 
+    def _gen_from_cache_key(self, anon_map, bindparams):
+        if self._restates:
+            raise _NoCacheKey()
+        return super(CTE, self)._gen_from_cache_key(anon_map, bindparams) + (
+            self.recursive,
+            _element_cache_key(self._cte_alias, anon_map, bindparams),
+            tuple(
+                (elem._gen_cache_key(anon_map, bindparams), dialect)
+                for elem, dialect in self._suffixes)
+        )
+
     @util.dependencies("sqlalchemy.sql.dml")
     def _populate_column_collection(self, dml):
         if isinstance(self.element, dml.UpdateBase):
@@ -1626,6 +1683,12 @@ class FromGrouping(FromClause):
     def _copy_internals(self, clone=_clone, **kw):
         self.element = clone(self.element, **kw)
 
+    def _gen_from_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            self.element._gen_cache_key(anon_map, bindparams)
+        )
+
     @property
     def _from_objects(self):
         return self.element._from_objects
@@ -1720,6 +1783,10 @@ class TableClause(Immutable, FromClause):
         self._columns[c.key] = c
         c.table = self
 
+    def _gen_from_cache_key(self, anon_map, bindparams):
+        return (self.__class__, _name_cache_key(self.name, anon_map)) + \
+            _elements_cache_key(self.columns, anon_map, bindparams)
+
     def get_children(self, column_collections=True, **kwargs):
         if column_collections:
             return [c for c in self.c]
@@ -1832,6 +1899,17 @@ class ForUpdateArg(ClauseElement):
         if self.of is not None:
             self.of = [clone(col, **kw) for col in self.of]
 
+    def _gen_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            self.nowait,
+            self.read,
+            self.skip_locked,
+            self.key_share,
+            _elements_cache_key(self.of, anon_map, bindparams)
+            if self.of is not None else None
+        )
+
     def __init__(
             self, nowait=False, read=False, of=None,
             skip_locked=False, key_share=False):
@@ -2200,6 +2278,16 @@ class GenerativeSelect(SelectBase):
         if self._offset_clause is not None:
             self._offset_clause = clone(self._offset_clause, **kw)
 
+    def _generative_cache_key(self, anon_map, bindparams):
+        return (
+            self._order_by_clause._gen_cache_key(anon_map, bindparams),
+            self._group_by_clause._gen_cache_key(anon_map, bindparams),
+            _element_cache_key(self._limit_clause, anon_map, bindparams),
+            _element_cache_key(self._offset_clause, anon_map, bindparams),
+            _element_cache_key(self._for_update_arg, anon_map, bindparams),
+            self.use_labels
+        )
+
 
 class CompoundSelect(GenerativeSelect):
     """Forms the basis of ``UNION``, ``UNION ALL``, and other
@@ -2441,6 +2529,16 @@ class CompoundSelect(GenerativeSelect):
             + [self._order_by_clause, self._group_by_clause] \
             + list(self.selects)
 
+    def _gen_from_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            self.keyword,
+            _elements_cache_key(self.selects, anon_map, bindparams)
+        ) + self._generative_cache_key(anon_map, bindparams)
+
+    def _result_column_elements(self):
+        return self.selects[0]._result_column_elements()
+
     def bind(self):
         if self._bind:
             return self._bind
@@ -3007,6 +3105,59 @@ class Select(HasPrefixes, HasSuffixes, GenerativeSelect):
                     self._order_by_clause, self._group_by_clause)
              if x is not None]
 
+    def _result_column_elements(self):
+        for column in self.inner_columns:
+            yield column
+            if isinstance(column, Label):
+                yield column.element
+
+    def _gen_from_cache_key(self, anon_map, bindparams):
+        if self._hints:
+            raise _NoCacheKey()
+
+        if isinstance(self._distinct, bool):
+            distinct = self._distinct
+        else:
+            distinct = _elements_cache_key(
+                self._distinct, anon_map, bindparams)
+
+        return (
+            self.__class__,
+            _elements_cache_key(self._raw_columns, anon_map, bindparams),
+            _elements_cache_key(self._froms, anon_map, bindparams),
+            _element_cache_key(self._whereclause, anon_map, bindparams),
+            _element_cache_key(self._having, anon_map, bindparams),
+            distinct,
+            tuple(
+                (elem._gen_cache_key(anon_map, bindparams), dialect)
+                for elem, dialect in self._prefixes),
+            tuple(
+                (elem._gen_cache_key(anon_map, bindparams), dialect)
+                for elem, dialect in self._suffixes),
+            self._statement_hints,
+            self._auto_correlate,
+            self._correlate_cache_key(self._correlate, anon_map),
+            self._correlate_cache_key(self._correlate_except, anon_map)
+        ) + self._generative_cache_key(anon_map, bindparams)
+
+    def _correlate_cache_key(self, froms, anon_map):
+        # the correlate collections are unordered and are consulted
+        # only for membership; key them as a set, against a copy of
+        # the anon map so that their ordering doesn't leak into the
+        # remainder of the key.
+        if froms is None:
+            return None
+        elif not froms:
+            return ()
+        correlate_anon_map = dict(anon_map)
+        correlate_bindparams = []
+        key = frozenset(
+            f._gen_cache_key(correlate_anon_map, correlate_bindparams)
+            for f in froms)
+        if correlate_bindparams:
+            raise _NoCacheKey()
+        return key
+
     @_generative
     def column(self, column):
         """return a new select() construct with the given column expression
@@ -3690,6 +3841,17 @@ class TextAsFrom(SelectBase):
         self._reset_exported()
         self.element = clone(self.element, **kw)
 
+    def _gen_from_cache_key(self, anon_map, bindparams):
+        return (
+            self.__class__,
+            self.element._gen_cache_key(anon_map, bindparams),
+            _elements_cache_key(self.column_args, anon_map, bindparams),
+            self.positional
+        )
+
+    def _result_column_elements(self):
+        return self.column_args
+
     def _scalar_type(self):
         return self.column_args[0].type
 
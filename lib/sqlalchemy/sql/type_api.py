@@ -409,6 +409,26 @@ class TypeEngine(Visitable):
         """
         return Variant(self, {dialect_name: to_instance(type_)})
 
+    @util.memoized_property
+    def _static_cache_key(self):
+        """Return a hashable value representing the configuration of this
+        type, used as part of the structural cache key of a statement.
+
+        The key is formed from the public attributes of the type; a type
+        whose state can't be hashed is keyed on its identity.
+
+        """
+        try:
+            key = (self.__class__, ) + tuple(
+                (name, _static_cache_key_value(value))
+                for name, value in sorted(self.__dict__.items())
+                if not name.startswith('_'))
+            hash(key)
+        except TypeError:
+            return (self.__class__, self)
+        else:
+            return key
+
     @util.memoized_property
     def _type_affinity(self):
         """Return a rudimental 'affinity' value expressing the general class
@@ -649,6 +669,11 @@ class UserDefinedType(util.with_metaclass(VisitableCheckKWArg, TypeEngine)):
 
         return self
 
+    @property
+    def _static_cache_key(self):
+        # user defined types may carry any kind of state; key on identity
+        return (self.__class__, self)
+
 
 class TypeDecorator(SchemaEventTarget, TypeEngine):
     """Allows the creation of types which add additional functionality
@@ -1136,6 +1161,12 @@ class TypeDecorator(SchemaEventTarget, TypeEngine):
         """
         return self
 
+    @property
+    def _static_cache_key(self):
+        # a TypeDecorator may carry any kind of state that affects
+        # processing of values; key on identity
+        return (self.__class__, self)
+
     def copy(self, **kw):
         """Produce a copy of this :class:`.TypeDecorator` instance.
 
@@ -1239,6 +1270,15 @@ def _reconstitute_comparator(expression):
     return expression.comparator
 
 
+def _static_cache_key_value(value):
+    if isinstance(value, TypeEngine):
+        return value._static_cache_key
+    elif isinstance(value, list):
+        return tuple(_static_cache_key_value(elem) for elem in value)
+    else:
+        return value
+
+
 def to_instance(typeobj, *arg, **kw):
     if typeobj is None:
         return NULLTYPE
@@ -85,15 +85,18 @@ class CompiledSQL(SQLMatchRule):
 
         context = execute_observed.context
         compare_dialect = self._compile_dialect(execute_observed)
-        if isinstance(context.compiled.statement, _DDLCompiles):
+        statement = context.invoked_statement
+        if statement is None:
+            statement = context.compiled.statement
+        if isinstance(statement, _DDLCompiles):
             compiled = \
-                context.compiled.statement.compile(
+                statement.compile(
                     dialect=compare_dialect,
                     schema_translate_map=context.
                     execution_options.get('schema_translate_map'))
         else:
             compiled = (
-                context.compiled.statement.compile(
+                statement.compile(
                     dialect=compare_dialect,
                     column_keys=context.compiled.column_keys,
                     inline=context.compiled.inline,
@@ -503,6 +503,13 @@ class SuiteRequirements(Requirements):
 
         return self.json_type
 
+    @property
+    def json_deferred(self):
+        """target dialect accepts the ``json_deferred`` flag, returning
+        JSON values as :class:`.DeferredJSON` objects."""
+
+        return exclusions.closed()
+
     @property
     def precision_numerics_general(self):
         """target backend has general support for moderately high-precision
@@ -1,11 +1,12 @@
 # coding: utf-8
 
-from .. import fixtures, config
+from .. import fixtures, config, engines
 from ..assertions import eq_
 from ..config import requirements
 from sqlalchemy import Integer, Unicode, UnicodeText, select
 from sqlalchemy import Date, DateTime, Time, MetaData, String, \
     Text, Numeric, Float, literal, Boolean, cast, null, JSON, and_
+from sqlalchemy.types import DeferredJSON
 from ..schema import Table, Column
 from ... import testing
 import decimal
@@ -651,6 +652,36 @@ class JSONTest(_LiteralRoundTripFixture, fixtures.TablesTest):
 
         eq_(row, (data_element, ))
 
+    @testing.requires.json_deferred
+    def test_round_trip_deferred(self):
+        data_table = self.tables.data_table
+        eng = engines.testing_engine(options={"json_deferred": True})
+
+        try:
+            with eng.connect() as conn:
+                conn.execute(
+                    data_table.insert(),
+                    {'name': 'row1', 'data': self.data5}
+                )
+                data = conn.scalar(select([data_table.c.data]))
+                assert isinstance(data, DeferredJSON)
+                eq_(data, self.data5)
+
+                # passed back to the database as is
+                conn.execute(
+                    data_table.insert(),
+                    {'name': 'row2', 'data': data}
+                )
+                eq_(
+                    conn.scalar(
+                        select([data_table.c.data]).
+                        where(data_table.c.name == 'row2')
+                    ).value,
+                    self.data5
+                )
+        finally:
+            eng.dispose()
+
     def test_round_trip_none_as_sql_null(self):
         col = self.tables.data_table.c['nulldata']
 
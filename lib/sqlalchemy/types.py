@@ -17,7 +17,7 @@ __all__ = ['TypeEngine', 'TypeDecorator', 'UserDefinedType',
            'SmallInteger', 'BigInteger', 'Numeric', 'Float', 'DateTime',
            'Date', 'Time', 'LargeBinary', 'Binary', 'Boolean', 'Unicode',
            'Concatenable', 'UnicodeText', 'PickleType', 'Interval', 'Enum',
-           'Indexable', 'ARRAY', 'JSON']
+           'Indexable', 'ARRAY', 'JSON', 'DeferredJSON', 'BinaryStream']
 
 from .sql.type_api import (
     adapt_type,
@@ -36,6 +36,7 @@ from .sql.sqltypes import (
     BigInteger,
     Binary,
     _Binary,
+    BinaryStream,
     Boolean,
     CHAR,
     CLOB,
@@ -44,6 +45,7 @@ from .sql.sqltypes import (
     DATETIME,
     DECIMAL,
     Date,
+    DeferredJSON,
     DateTime,
     Enum,
     FLOAT,
@@ -862,6 +862,14 @@ class LRUCache(dict):
     """Dictionary with 'squishy' removal of least
     recently used items.
 
+    Entries are linked in order of use, so that lookups, insertions
+    and removals are constant time.  Once the cache holds ``capacity``
+    entries, each insertion of a new key removes the single least
+    recently used entry; the linked list is maintained under a mutex, so
+    that concurrent use can't grow the cache past ``capacity``.  The
+    ``threshold`` argument is accepted for backwards compatibility and
+    has no effect.
+
     Note that either get() or [] should be used here, but
     generally its not safe to do an "in" check first as the dictionary
     can change subsequent to that call.
@@ -871,61 +879,101 @@ class LRUCache(dict):
     def __init__(self, capacity=100, threshold=.5):
         self.capacity = capacity
         self.threshold = threshold
-        self._counter = 0
         self._mutex = threading.Lock()
 
-    def _inc_counter(self):
-        self._counter += 1
-        return self._counter
+        # each entry is a list [prev, next, key, value], linked into
+        # a circular list anchored by self._root; the least recently
+        # used entry follows the root.
+        self._root = root = []
+        root[:] = [root, root, None, None]
+
+    def _link_last(self, item):
+        root = self._root
+        last = root[0]
+        item[0] = last
+        item[1] = root
+        last[1] = root[0] = item
+
+    def _unlink(self, item):
+        prev, next_ = item[0], item[1]
+        prev[1] = next_
+        next_[0] = prev
 
     def get(self, key, default=None):
-        item = dict.get(self, key, default)
-        if item is not default:
-            item[2] = self._inc_counter()
-            return item[1]
-        else:
-            return default
+        with self._mutex:
+            item = dict.get(self, key)
+            if item is None:
+                return default
+            self._unlink(item)
+            self._link_last(item)
+            return item[3]
 
     def __getitem__(self, key):
-        item = dict.__getitem__(self, key)
-        item[2] = self._inc_counter()
-        return item[1]
+        with self._mutex:
+            item = dict.__getitem__(self, key)
+            self._unlink(item)
+            self._link_last(item)
+            return item[3]
 
     def values(self):
-        return [i[1] for i in dict.values(self)]
+        return [i[3] for i in dict.values(self)]
+
+    def items(self):
+        return [(i[2], i[3]) for i in dict.values(self)]
 
     def setdefault(self, key, value):
-        if key in self:
-            return self[key]
-        else:
-            self[key] = value
+        with self._mutex:
+            item = dict.get(self, key)
+            if item is not None:
+                return item[3]
+            self._set(key, value)
             return value
 
+    def update(self, *arg, **kw):
+        for key, value in dict(*arg, **kw).items():
+            self[key] = value
+
     def __setitem__(self, key, value):
+        with self._mutex:
+            self._set(key, value)
+
+    def _set(self, key, value):
         item = dict.get(self, key)
         if item is None:
-            item = [key, value, self._inc_counter()]
+            item = [None, None, key, value]
             dict.__setitem__(self, key, item)
         else:
-            item[1] = value
+            item[3] = value
+            self._unlink(item)
+        self._link_last(item)
         self._manage_size()
 
+    def __delitem__(self, key):
+        with self._mutex:
+            self._unlink(dict.pop(self, key))
+
+    def pop(self, key, *default):
+        with self._mutex:
+            if key not in self and default:
+                return default[0]
+            item = dict.pop(self, key)
+            self._unlink(item)
+            return item[3]
+
+    def clear(self):
+        with self._mutex:
+            dict.clear(self)
+            root = self._root
+            root[:] = [root, root, None, None]
+
     def _manage_size(self):
-        if not self._mutex.acquire(False):
-            return
-        try:
-            while len(self) > self.capacity + self.capacity * self.threshold:
-                by_counter = sorted(dict.values(self),
-                                    key=operator.itemgetter(2),
-                                    reverse=True)
-                for item in by_counter[self.capacity:]:
-                    try:
-                        del self[item[0]]
-                    except KeyError:
-                        # deleted elsewhere; skip
-                        continue
-        finally:
-            self._mutex.release()
+        # called with the mutex held, after each insertion; this removes
+        # a single entry unless capacity has been reduced
+        root = self._root
+        while len(self) > self.capacity:
+            item = root[1]
+            self._unlink(item)
+            dict.__delitem__(self, item[2])
 
 
 _lw_tuples = LRUCache(100)
@@ -341,6 +341,24 @@ class MemUsageTest(EnsureZeroed):
         finally:
             metadata.drop_all()
 
+    def test_statement_cache_bounded(self):
+        engine = engines.testing_engine(
+            options={"use_reaper": False, "statement_cache_size": 10})
+        counter = itertools.count(1)
+
+        @profile_memory()
+        def go():
+            # six statements of a new structure each time; the cache
+            # evicts an entry for each once it reaches its capacity
+            for i in range(6):
+                engine.scalar(select([sa.literal(1)]).limit(next(counter)))
+                assert engine.get_statement_cache_stats()["size"] <= 10
+        go()
+
+        stats = engine.get_statement_cache_stats()
+        eq_(stats["capacity"], 10)
+        eq_(stats["misses"], next(counter) - 1)
+
     @testing.crashes('mysql+cymysql', 'blocking')
     def test_unicode_warnings(self):
         metadata = MetaData(self.engine)
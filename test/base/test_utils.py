@@ -1,5 +1,6 @@
 import copy
 import sys
+import threading
 
 from sqlalchemy import util, sql, exc, testing
 from sqlalchemy.testing import assert_raises, assert_raises_message, fixtures
@@ -651,17 +652,17 @@ class LRUTest(fixtures.TestBase):
             def __str__(self):
                 return "item id %d" % self.id
 
-        l = util.LRUCache(10, threshold=.2)
+        l = util.LRUCache(10)
 
         for id in range(1, 20):
             l[id] = item(id)
+            assert len(l) <= 10
 
-        # first couple of items should be gone
-        assert 1 not in l
-        assert 2 not in l
+        # all but the ten most recent items should be gone
+        for id_ in range(1, 10):
+            assert id_ not in l
 
-        # next batch over the threshold of 10 should be present
-        for id_ in range(11, 20):
+        for id_ in range(10, 20):
             assert id_ in l
 
         l[12]
@@ -672,10 +673,10 @@ class LRUTest(fixtures.TestBase):
         l[26] = item(26)
         l[27] = item(27)
 
-        assert 11 not in l
-        assert 13 not in l
+        for id_ in (10, 11, 13, 14, 16):
+            assert id_ not in l
 
-        for id_ in (25, 24, 23, 14, 12, 19, 18, 17, 16, 15):
+        for id_ in (27, 26, 25, 24, 23, 12, 19, 18, 17, 15):
             assert id_ in l
 
         i1 = l[25]
@@ -684,6 +685,67 @@ class LRUTest(fixtures.TestBase):
         assert 25 in l
         assert l[25] is i2
 
+    def test_get_marks_used(self):
+        l = util.LRUCache(2)
+        l['a'] = 1
+        l['b'] = 2
+        eq_(l.get('a'), 1)
+        l['c'] = 3
+        eq_(sorted(l.keys()), ['a', 'c'])
+        eq_(l.get('b'), None)
+        eq_(l.get('b', 5), 5)
+
+    def test_dict_api(self):
+        l = util.LRUCache(10)
+        l.update({'a': 1}, b=2)
+        eq_(l.setdefault('a', 5), 1)
+        eq_(l.setdefault('c', 3), 3)
+        eq_(sorted(l.items()), [('a', 1), ('b', 2), ('c', 3)])
+        eq_(sorted(l.values()), [1, 2, 3])
+
+        del l['a']
+        eq_(l.pop('b'), 2)
+        eq_(l.pop('b', None), None)
+        assert_raises(KeyError, l.pop, 'b')
+        eq_(sorted(l.items()), [('c', 3)])
+
+        l.clear()
+        eq_(len(l), 0)
+        l['d'] = 4
+        eq_(l.items(), [('d', 4)])
+
+    def test_removed_entries_unlinked(self):
+        l = util.LRUCache(3)
+        for id_ in range(3):
+            l[id_] = id_
+        del l[0]
+        l.pop(1)
+        for id_ in range(3, 6):
+            l[id_] = id_
+        eq_(sorted(l.keys()), [3, 4, 5])
+
+    def test_capacity_concurrent(self):
+        l = util.LRUCache(50)
+        sizes = []
+
+        def go(offset):
+            for id_ in range(offset, offset + 2000):
+                l[id_] = id_
+                l.get(id_ - 5)
+                sizes.append(len(l))
+
+        threads = [
+            threading.Thread(target=go, args=(i * 10000, ))
+            for i in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert max(sizes) <= 50
+        eq_(len(l), 50)
+
 
 class ImmutableSubclass(str):
     pass
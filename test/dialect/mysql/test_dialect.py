@@ -1,11 +1,15 @@
 # coding: utf-8
 
-from sqlalchemy.testing import eq_
+from sqlalchemy.testing import eq_, assert_raises_message
 from sqlalchemy import *
+from sqlalchemy import exc
+from sqlalchemy.engine import result as _result
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.testing import fixtures
 from sqlalchemy import testing
 from sqlalchemy.testing import engines
+from sqlalchemy.testing.mock import Mock
+from sqlalchemy.testing.util import gc_collect
 import datetime
 
 
@@ -187,3 +191,106 @@ class ExecutionTest(fixtures.TestBase):
         d = testing.db.scalar(func.sysdate())
         assert isinstance(d, datetime.datetime)
 
+
+class ServerSideCursorMockTest(fixtures.TestBase):
+    """Test server side cursor selection against a mock DBAPI."""
+
+    def _engine(self, **kw):
+        dbapi = Mock(
+            paramstyle='format', Error=type('Error', (Exception, ), {}))
+        self.cursors = []
+
+        def cursor(*arg):
+            cursor = Mock(
+                description=[('x', None, None, None, None, None, None)],
+                rowcount=-1)
+            rows = [(1, ), (2, )]
+
+            def fetchmany(size):
+                if cursor.connection is None:
+                    raise dbapi.Error("cursor closed")
+                batch = rows[0:size]
+                rows[0:size] = []
+                return batch
+            cursor.fetchmany.side_effect = fetchmany
+            cursor.fetchall.side_effect = lambda: fetchmany(len(rows))
+
+            def close():
+                # the driver reads and discards the remaining rows
+                rows[:] = []
+                cursor.connection = None
+            cursor.close.side_effect = close
+            self.cursors.append((arg, cursor))
+            return cursor
+
+        def connect(*arg, **kw):
+            conn = Mock()
+            conn.cursor.side_effect = cursor
+            return conn
+        dbapi.connect.side_effect = connect
+
+        return create_engine(
+            'mysql+pymysql://', module=dbapi, _initialize=False, **kw)
+
+    def test_stream_results(self):
+        engine = self._engine()
+        with engine.connect() as conn:
+            conn.execute(text("select 1"))
+            result = conn.execution_options(stream_results=True).\
+                execute(text("select 1"))
+            assert isinstance(result, _result.BufferedRowResultProxy)
+            eq_(
+                [arg for arg, cursor in self.cursors],
+                [(), (engine.dialect.dbapi.cursors.SSCursor, )]
+            )
+            eq_(result.fetchall(), [(1, ), (2, )])
+
+    def test_server_side_cursors(self):
+        engine = self._engine(server_side_cursors=True)
+        with engine.connect() as conn:
+            conn.execute(text("select 1")).close()
+            conn.execute(text("update foo set bar=1"))
+            conn.execution_options(stream_results=False).\
+                execute(text("select 1"))
+            eq_(
+                [arg for arg, cursor in self.cursors],
+                [(engine.dialect.dbapi.cursors.SSCursor, ), (), ()]
+            )
+
+    def test_pending_cursor(self):
+        engine = self._engine(server_side_cursors=True)
+        with engine.connect() as conn:
+            result = conn.execute(text("select 1"))
+            eq_(result.fetchone(), (1, ))
+            for stmt in (text("select 1"), "select 1"):
+                assert_raises_message(
+                    exc.InvalidRequestError,
+                    "Can't execute a statement on this connection while "
+                    "the rows of a server side cursor are pending",
+                    conn.execute, stmt
+                )
+
+            # the streamed result is intact, and the rejected statements
+            # didn't roll back the connection
+            assert not result.cursor.close.called
+            eq_(conn.connection.connection.rollback.mock_calls, [])
+            eq_(result.fetchall(), [(2, )])
+            conn.execute(text("select 1")).close()
+
+    def test_pending_cursor_released(self):
+        engine = self._engine(server_side_cursors=True)
+        with engine.connect() as conn:
+            conn.execute(text("select 1"))
+            del self.cursors[:]
+            gc_collect()
+            conn.execute(text("select 1"))
+
+    def test_pending_cursor_rollback(self):
+        engine = self._engine(server_side_cursors=True)
+        with engine.connect() as conn:
+            trans = conn.begin()
+            result = conn.execute(text("select 1"))
+            eq_(result.fetchone(), (1, ))
+            trans.rollback()
+            assert result.cursor.close.called
+            conn.execute(text("select 1"))
@@ -1,8 +1,9 @@
 # coding: utf-8
 
-from sqlalchemy.testing import eq_, is_
+from sqlalchemy.testing import eq_, is_, assert_raises_message
 from sqlalchemy import *
-from sqlalchemy.testing import fixtures
+from sqlalchemy import exc
+from sqlalchemy.testing import fixtures, engines
 from sqlalchemy import testing
 
 
@@ -212,3 +213,86 @@ class AnyAllTest(fixtures.TablesTest):
             testing.db.execute(stmt).scalar(), True
         )
 
+
+class ServerSideCursorsTest(fixtures.TestBase):
+    __only_on__ = ('mysql+mysqldb', 'mysql+pymysql')
+    __backend__ = True
+
+    def _fixture(self, server_side_cursors):
+        self.engine = engines.testing_engine(
+            options={'server_side_cursors': server_side_cursors}
+        )
+        return self.engine
+
+    def tearDown(self):
+        engines.testing_reaper.close_all()
+        self.engine.dispose()
+
+    def _is_server_side(self, result):
+        return isinstance(result.cursor, self.engine.dialect._sscursor)
+
+    def test_global_string(self):
+        engine = self._fixture(True)
+        result = engine.execute('select 1')
+        assert self._is_server_side(result)
+
+    def test_global_expr(self):
+        engine = self._fixture(True)
+        result = engine.execute(select([1]))
+        assert self._is_server_side(result)
+
+    def test_global_off_explicit(self):
+        engine = self._fixture(False)
+        result = engine.execute(text('select 1'))
+        assert not self._is_server_side(result)
+
+    def test_stmt_option(self):
+        engine = self._fixture(False)
+        s = select([1]).execution_options(stream_results=True)
+        result = engine.execute(s)
+        assert self._is_server_side(result)
+
+    def test_stmt_option_disabled(self):
+        engine = self._fixture(True)
+        s = select([1]).execution_options(stream_results=False)
+        result = engine.execute(s)
+        assert not self._is_server_side(result)
+
+    def test_roundtrip(self):
+        engine = self._fixture(False)
+        with engine.connect() as conn:
+            result = conn.execution_options(stream_results=True).execute(
+                select([literal_column("1").label('x')]).union_all(
+                    select([literal_column("2")])))
+            assert self._is_server_side(result)
+            eq_(result.fetchall(), [(1, ), (2, )])
+
+            # the cursor is released once rows are exhausted
+            eq_(conn.scalar(select([3])), 3)
+
+    def test_pending_cursor(self):
+        engine = self._fixture(True)
+        with engine.connect() as conn:
+            result = conn.execute(
+                select([literal_column("1")]).union_all(
+                    select([literal_column("2")])))
+            eq_(result.fetchone(), (1, ))
+            assert_raises_message(
+                exc.StatementError,
+                "Can't execute a statement on this connection while the "
+                "rows of a server side cursor are pending",
+                conn.execute, select([3])
+            )
+            result.close()
+            eq_(conn.scalar(select([3])), 3)
+
+    def test_pending_cursor_rollback(self):
+        engine = self._fixture(True)
+        with engine.connect() as conn:
+            trans = conn.begin()
+            result = conn.execute(
+                select([literal_column("1")]).union_all(
+                    select([literal_column("2")])))
+            eq_(result.fetchone(), (1, ))
+            trans.rollback()
+            eq_(conn.scalar(select([3])), 3)
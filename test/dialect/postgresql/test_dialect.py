@@ -8,18 +8,241 @@ from sqlalchemy import testing
 import datetime
 from sqlalchemy import (
     Table, Column, select, MetaData, text, Integer, String, Sequence, Numeric,
-    DateTime, BigInteger, func, extract, SmallInteger)
+    DateTime, BigInteger, func, extract, SmallInteger, bindparam)
 from sqlalchemy import exc, schema
 from sqlalchemy.dialects.postgresql import base as postgresql
+from sqlalchemy.dialects.postgresql import psycopg2 as psycopg2_dialect
 import logging
 import logging.handlers
-from sqlalchemy.testing.mock import Mock
+from sqlalchemy.testing.mock import Mock, patch, call
 from sqlalchemy.engine import engine_from_config
 from sqlalchemy.engine import url
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import expect_deprecated
 
 
+class ExecutemanyModeTest(fixtures.TestBase):
+
+    def _fixture(self, **kw):
+        dialect = psycopg2_dialect.dialect(**kw)
+        extras = Mock()
+        dialect._psycopg2_extras = Mock(return_value=extras)
+
+        t = Table(
+            't', MetaData(),
+            Column('id', Integer, primary_key=True), Column('data', String))
+        return dialect, extras, t
+
+    def _context(self, compiled, isinsert):
+        return Mock(compiled=compiled, isinsert=isinsert)
+
+    def test_default_mode(self):
+        dialect, extras, t = self._fixture()
+        cursor = Mock()
+        compiled = t.insert().compile(dialect=dialect)
+
+        dialect.do_executemany(
+            cursor, str(compiled), [{"id": 1}, {"id": 2}],
+            self._context(compiled, True))
+        eq_(
+            cursor.mock_calls,
+            [call.executemany(str(compiled), [{"id": 1}, {"id": 2}])])
+        eq_(extras.mock_calls, [])
+
+    def test_batch_mode(self):
+        dialect, extras, t = self._fixture(
+            executemany_mode='batch', executemany_batch_page_size=50)
+        cursor = Mock()
+        compiled = t.insert().compile(dialect=dialect)
+        params = [{"id": 1, "data": "d1"}, {"id": 2, "data": "d2"}]
+
+        dialect.do_executemany(
+            cursor, str(compiled), params, self._context(compiled, True))
+        eq_(
+            extras.mock_calls,
+            [call.execute_batch(
+                cursor,
+                "INSERT INTO t (id, data) VALUES (%(id)s, %(data)s)",
+                params, page_size=50)]
+        )
+
+    def test_values_mode(self):
+        dialect, extras, t = self._fixture(
+            executemany_mode='values', executemany_values_page_size=500)
+        cursor = Mock()
+        compiled = t.insert().compile(dialect=dialect)
+        params = [{"id": 1, "data": "d1"}, {"id": 2, "data": "d2"}]
+
+        dialect.do_executemany(
+            cursor, str(compiled), params, self._context(compiled, True))
+        eq_(
+            extras.mock_calls,
+            [call.execute_values(
+                cursor,
+                "INSERT INTO t (id, data) VALUES %s",
+                params, template="(%(id)s, %(data)s)", page_size=500)]
+        )
+
+    def test_values_mode_update_uses_batch(self):
+        dialect, extras, t = self._fixture(executemany_mode='values')
+        cursor = Mock()
+        compiled = t.update().where(t.c.id == 5).compile(dialect=dialect)
+        params = [{"data": "d1"}, {"data": "d2"}]
+
+        dialect.do_executemany(
+            cursor, str(compiled), params, self._context(compiled, False))
+        eq_(
+            extras.mock_calls,
+            [call.execute_batch(cursor, str(compiled), params)]
+        )
+
+    def test_values_mode_binds_outside_values(self):
+        dialect, extras, t = self._fixture(executemany_mode='values')
+        cursor = Mock()
+        compiled = t.insert().returning(
+            t.c.id + 5).compile(dialect=dialect)
+        params = [{"id": 1, "data": "d1"}, {"id": 2, "data": "d2"}]
+
+        dialect.do_executemany(
+            cursor, str(compiled), params, self._context(compiled, True))
+        eq_(
+            extras.mock_calls,
+            [call.execute_batch(cursor, str(compiled), params)]
+        )
+
+    def test_values_mode_altered_statement(self):
+        dialect, extras, t = self._fixture(executemany_mode='values')
+        cursor = Mock()
+        compiled = t.insert().compile(dialect=dialect)
+        params = [{"id": 1, "data": "d1"}, {"id": 2, "data": "d2"}]
+
+        dialect.do_executemany(
+            cursor, "INSERT INTO t (id, data) SELECT 1, 2", params,
+            self._context(compiled, True))
+        eq_(
+            extras.mock_calls,
+            [call.execute_batch(
+                cursor, "INSERT INTO t (id, data) SELECT 1, 2", params)]
+        )
+
+    def test_invalid_mode(self):
+        assert_raises_message(
+            exc.ArgumentError,
+            "Invalid value for 'executemany_mode'",
+            psycopg2_dialect.dialect, executemany_mode='bogus'
+        )
+
+    def test_old_psycopg2_version(self):
+        assert_raises_message(
+            exc.ArgumentError,
+            "executemany_mode requires psycopg2 version 2.7 or greater",
+            psycopg2_dialect.dialect, executemany_mode='batch',
+            dbapi=Mock(__version__='2.6.2 (dt dec pq3 ext lo64)')
+        )
+
+    def test_multi_rowcount_disabled(self):
+        for mode, expected in [
+                (None, True), ('batch', False), ('values', False)]:
+            dialect = psycopg2_dialect.dialect(executemany_mode=mode)
+            dialect.psycopg2_version = (2, 7, 1)
+            with patch.object(
+                    psycopg2_dialect.PGDialect, "initialize"), \
+                    patch.object(dialect, "_hstore_oids"):
+                dialect.initialize(Mock())
+            eq_(dialect.supports_sane_multi_rowcount, expected)
+
+
+class ExecutemanyModeRoundTripTest(fixtures.TablesTest):
+    __only_on__ = 'postgresql+psycopg2'
+    __backend__ = True
+
+    run_deletes = 'each'
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            'data', metadata,
+            Column('id', Integer, primary_key=True),
+            Column('x', String),
+            Column('y', String),
+            Column('z', Integer, server_default="5")
+        )
+
+    def _engine(self, mode):
+        eng = engines.testing_engine(options={
+            "executemany_mode": mode,
+            "executemany_values_page_size": 2,
+            "executemany_batch_page_size": 2})
+        extras = eng.dialect._psycopg2_extras()
+        canary = Mock(
+            execute_values=Mock(side_effect=extras.execute_values),
+            execute_batch=Mock(side_effect=extras.execute_batch))
+        eng.dialect._psycopg2_extras = Mock(return_value=canary)
+        return eng, canary
+
+    def test_insert_values(self):
+        eng, canary = self._engine('values')
+        data = self.tables.data
+        with eng.connect() as conn:
+            conn.execute(
+                data.insert(),
+                [{"id": i, "x": "x%d" % i, "y": "y%d" % i}
+                 for i in range(1, 6)])
+            eq_(
+                conn.execute(
+                    select([data]).order_by(data.c.id)).fetchall(),
+                [(i, "x%d" % i, "y%d" % i, 5) for i in range(1, 6)]
+            )
+        eq_(len(canary.execute_values.mock_calls), 1)
+        eq_(len(canary.execute_batch.mock_calls), 0)
+
+    def test_update_batch(self):
+        eng, canary = self._engine('values')
+        data = self.tables.data
+        with eng.connect() as conn:
+            conn.execute(
+                data.insert(),
+                [{"id": i, "x": "x%d" % i, "y": "y%d" % i}
+                 for i in range(1, 6)])
+            conn.execute(
+                data.update().where(data.c.id == bindparam('xid')).
+                values(x=bindparam('xval')),
+                [{"xid": i, "xval": "q%d" % i} for i in range(1, 6)])
+            eq_(
+                conn.execute(
+                    select([data.c.x]).order_by(data.c.id)).fetchall(),
+                [("q%d" % i, ) for i in range(1, 6)]
+            )
+        eq_(len(canary.execute_batch.mock_calls), 1)
+
+    def test_orm_flush(self):
+        from sqlalchemy.orm import Session, mapper, clear_mappers
+
+        class Data(object):
+            pass
+
+        data = self.tables.data
+        mapper(Data, data)
+        eng, canary = self._engine('values')
+        try:
+            sess = Session(eng)
+            for i in range(1, 6):
+                d = Data()
+                d.id, d.x, d.y = i, "x%d" % i, "y%d" % i
+                sess.add(d)
+            sess.flush()
+            eq_(len(canary.execute_values.mock_calls), 1)
+
+            for d in sess.query(Data):
+                d.x = "q%d" % d.id
+            sess.flush()
+            eq_(len(canary.execute_batch.mock_calls), 1)
+            sess.commit()
+            sess.close()
+        finally:
+            clear_mappers()
+
+
 class MiscTest(fixtures.TestBase, AssertsExecutionResults, AssertsCompiledSQL):
 
     __only_on__ = 'postgresql'
@@ -1824,6 +1824,43 @@ class BufferedColumnTest(fixtures.TestBase, AssertsCompiledSQL):
                             order_by(binary_table.c.id)).fetchall()
         eq_(result, [(i, stream) for i in range(1, 11)])
 
+    def test_fetch_as_stream(self):
+        stmt = select([
+            binary_table.c.id,
+            type_coerce(binary_table.c.data, LargeBinary(as_stream=True))
+        ]).order_by(binary_table.c.id)
+        for i, (id_, data) in enumerate(testing.db.execute(stmt), 1):
+            eq_(id_, i)
+            eq_(data.read(5000), stream[0:5000])
+            eq_(data.read(), stream[5000:])
+
+
+class LOBStreamTest(fixtures.TestBase):
+
+    def _lob_fixture(self, data):
+        lob = Mock()
+        lob.read.side_effect = \
+            lambda offset=1, amount=None: data[offset - 1:][:amount]
+        return lob
+
+    def test_read_chunks(self):
+        lob = self._lob_fixture(b("some binary data"))
+        stream = cx_oracle._OracleBinary(as_stream=True).result_processor(
+            cx_oracle.dialect(), None)(lob)
+        eq_(stream.read(4), b("some"))
+        eq_(stream.read(8), b(" binary "))
+        eq_(stream.read(), b("data"))
+        eq_(stream.read(), b(""))
+        eq_(
+            [call[1] for call in lob.read.mock_calls],
+            [(1, 4), (5, 8), (13, ), (17, )]
+        )
+
+    def test_none(self):
+        proc = cx_oracle._OracleBinary(as_stream=True).result_processor(
+            cx_oracle.dialect(), None)
+        eq_(proc(None), None)
+
 class UnsupportedIndexReflectTest(fixtures.TestBase):
     __only_on__ = 'oracle'
     __backend__ = True
@@ -7,7 +7,7 @@ from sqlalchemy.testing.util import picklers
 from sqlalchemy.interfaces import ConnectionProxy
 from sqlalchemy import MetaData, Integer, String, INT, VARCHAR, func, \
     bindparam, select, event, TypeDecorator, create_engine, Sequence
-from sqlalchemy.sql import column, literal
+from sqlalchemy.sql import column, literal, text, compiler
 from sqlalchemy.testing.schema import Table, Column
 import sqlalchemy as tsa
 from sqlalchemy import testing
@@ -808,6 +808,179 @@ class CompiledCacheTest(fixtures.TestBase):
         eq_(compile_mock.call_count, 1)
         eq_(len(cache), 1)
 
+    def test_equivalent_statements_share_compiled(self):
+        conn = testing.db.connect()
+        conn.execute(
+            users.insert(),
+            [{"user_id": 1, "user_name": "u1"},
+             {"user_id": 2, "user_name": "u2"}])
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+
+        for user_id, user_name in [(1, "u1"), (2, "u2"), (1, "u1")]:
+            stmt = select([users.c.user_name]).\
+                where(users.c.user_id == user_id)
+            eq_(cached_conn.scalar(stmt), user_name)
+        eq_(len(cache), 1)
+
+    def test_equivalent_statements_distinct_structure(self):
+        conn = testing.db.connect()
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+
+        cached_conn.execute(select([users.c.user_id]))
+        cached_conn.execute(select([users.c.user_name]))
+        cached_conn.execute(
+            select([users.c.user_id]).where(users.c.user_id == 5))
+        cached_conn.execute(
+            select([users.c.user_id]).where(users.c.user_id > 5))
+        eq_(len(cache), 4)
+
+    def test_equivalent_statements_row_targeting(self):
+        conn = testing.db.connect()
+        conn.execute(
+            users.insert(),
+            {"user_id": 1, "user_name": "u1", "extra_data": "e1"})
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+
+        for i in range(2):
+            expr = func.lower(users.c.user_name)
+            label = (users.c.user_id + 5).label(None)
+            row = cached_conn.execute(
+                select([users.c.user_name, expr, label])).first()
+            eq_(row[users.c.user_name], "u1")
+            eq_(row[expr], "u1")
+            eq_(row[label], 6)
+        eq_(len(cache), 1)
+
+    def test_equivalent_statements_anonymous_aliases(self):
+        conn = testing.db.connect()
+        conn.execute(
+            users.insert(),
+            {"user_id": 1, "user_name": "u1", "extra_data": "e1"})
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+
+        for i in range(2):
+            u1, u2 = users.alias(), users.alias()
+            row = cached_conn.execute(
+                select([u1.c.user_id, u2.c.user_name])).first()
+            eq_(row[u1.c.user_id], 1)
+            eq_(row[u2.c.user_name], "u1")
+        eq_(len(cache), 1)
+
+    def test_inline_values_not_shared(self):
+        conn = testing.db.connect()
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+
+        for user_id in (1, 2):
+            cached_conn.execute(
+                users.insert().values(user_id=user_id, user_name="u"))
+        eq_(
+            conn.execute(
+                select([users.c.user_id]).order_by(users.c.user_id)
+            ).fetchall(),
+            [(1, ), (2, )]
+        )
+
+    def test_dml_values_share_compiled(self):
+        conn = testing.db.connect()
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+
+        for user_id in range(1, 6):
+            cached_conn.execute(
+                users.insert().values(
+                    user_id=user_id, user_name="u%d" % user_id))
+            cached_conn.execute(
+                users.update().where(users.c.user_id == user_id).
+                values(extra_data="e%d" % user_id))
+        eq_(len(cache), 2)
+        eq_(
+            conn.execute(
+                select([users]).order_by(users.c.user_id)
+            ).fetchall(),
+            [(i, "u%d" % i, "e%d" % i) for i in range(1, 6)]
+        )
+
+    def test_cache_key_memoized(self):
+        conn = testing.db.connect()
+        cached_conn = conn.execution_options(compiled_cache={})
+
+        stmt = select([users.c.user_id]).where(users.c.user_id == 5)
+        with patch.object(
+            stmt, "_generate_cache_key",
+                Mock(side_effect=stmt._generate_cache_key)) as key_mock:
+            cached_conn.execute(stmt)
+            cached_conn.execute(stmt)
+        eq_(key_mock.call_count, 1)
+
+    def test_result_metadata_reused(self):
+        conn = testing.db.connect()
+        conn.execute(
+            users.insert(),
+            {"user_id": 1, "user_name": "u1", "extra_data": "e1"})
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+
+        stmt = select([users.c.user_id, users.c.user_name])
+        r1 = cached_conn.execute(stmt)
+        r2 = cached_conn.execute(stmt)
+        is_(r1._metadata, r2._metadata)
+        eq_(r2.fetchall(), [(1, "u1")])
+
+        # an equivalent statement adapts the same metadata
+        r3 = cached_conn.execute(
+            select([users.c.user_id, users.c.user_name]))
+        is_(r3.context.compiled, r1.context.compiled)
+        is_(r3._metadata._processors, r1._metadata._processors)
+        eq_(r3.first()[users.c.user_name], "u1")
+
+    def test_adapted_result_metadata_reused(self):
+        conn = testing.db.connect()
+        conn.execute(
+            users.insert(),
+            {"user_id": 1, "user_name": "u1", "extra_data": "e1"})
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+
+        exprs = [func.lower(users.c.user_name) for i in range(2)]
+        s1, s2 = [select([users.c.user_id, expr]) for expr in exprs]
+        r1 = cached_conn.execute(s1)
+        r2 = cached_conn.execute(s2)
+        r3 = cached_conn.execute(s2)
+        is_not_(r2._metadata, r1._metadata)
+        is_(r3._metadata, r2._metadata)
+        eq_(r3.first()[exprs[1]], "u1")
+
+        # selecting only table columns requires no adaptation
+        r4 = cached_conn.execute(select([users.c.user_id]))
+        r5 = cached_conn.execute(select([users.c.user_id]))
+        is_(r5._metadata, r4._metadata)
+
+    @testing.provide_metadata
+    def test_result_metadata_description_changed(self):
+        t = Table('t', self.metadata, Column('a', Integer))
+        t.create(testing.db)
+
+        conn = testing.db.connect()
+        conn.execute(t.insert(), {"a": 1})
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+
+        stmt = text("select * from t")
+        r1 = cached_conn.execute(stmt)
+        eq_(r1.keys(), ["a"])
+        r1.close()
+
+        conn.execute("ALTER TABLE t ADD COLUMN b INTEGER")
+        r2 = cached_conn.execute(stmt)
+        is_(r2.context.compiled, r1.context.compiled)
+        eq_(r2.keys(), ["a", "b"])
+        eq_(r2.first()["b"], None)
+
     @testing.requires.schemas
     @testing.provide_metadata
     def test_schema_translate_in_key(self):
@@ -843,6 +1016,118 @@ class CompiledCacheTest(fixtures.TestBase):
             eq_(conn.scalar(stmt), 1)
 
 
+class StatementCacheTest(fixtures.TestBase):
+    __backend__ = True
+
+    def _stats(self, eng):
+        return eng.get_statement_cache_stats()
+
+    def test_default_size(self):
+        eng = testing_engine()
+        eq_(
+            self._stats(eng),
+            {"hits": 0, "misses": 0, "evictions": 0,
+             "size": 0, "capacity": 500}
+        )
+
+    def test_hits_misses(self):
+        eng = testing_engine(options={"statement_cache_size": 10})
+        for value in (1, 2, 3):
+            eq_(eng.scalar(select([literal(value)])), value)
+        eng.scalar(select([literal(1).label('foo')]))
+
+        stats = self._stats(eng)
+        eq_(stats["hits"], 2)
+        eq_(stats["misses"], 2)
+        eq_(stats["size"], 2)
+        eq_(stats["evictions"], 0)
+
+    def test_evictions(self):
+        eng = testing_engine(options={"statement_cache_size": 2})
+        for i in range(5):
+            eng.execute(select([literal(1)]).limit(i + 1))
+
+        stats = self._stats(eng)
+        eq_(stats["misses"], 5)
+        eq_(stats["size"], 2)
+        eq_(stats["evictions"], 3)
+
+    def test_reset_stats(self):
+        eng = testing_engine(options={"statement_cache_size": 10})
+        for value in (1, 2):
+            eng.scalar(select([literal(value)]))
+        eng.reset_statement_cache_stats()
+
+        eq_(
+            self._stats(eng),
+            {"hits": 0, "misses": 0, "evictions": 0,
+             "size": 1, "capacity": 10}
+        )
+        eng.scalar(select([literal(3)]))
+        eq_(self._stats(eng)["hits"], 1)
+
+    def test_unusable_entry_is_miss(self):
+        eng = testing_engine(options={"statement_cache_size": 10})
+
+        # a compiled form with its parameter values rendered inline
+        # can't be used for other statements of the same structure
+        with patch.object(
+                compiler.SQLCompiler, "_extracted_bind_positions", None):
+            for value in (1, 2):
+                eq_(eng.scalar(select([literal(value)])), value)
+
+        stats = self._stats(eng)
+        eq_(stats["hits"], 0)
+        eq_(stats["misses"], 2)
+
+    def test_in_place_mutation(self):
+        eng = testing_engine(options={"statement_cache_size": 10})
+        stmt = select([column('x')]).select_from(
+            text("(SELECT 2 AS x UNION ALL SELECT 1 AS x) AS t"))
+        eq_(sorted(eng.execute(stmt).fetchall()), [(1, ), (2, )])
+
+        stmt.append_order_by(column('x'))
+        eq_(eng.execute(stmt).fetchall(), [(1, ), (2, )])
+
+        stmt.append_order_by(column('x').desc())
+        stmt.append_order_by(None)
+        stmt.append_order_by(column('x').desc())
+        eq_(eng.execute(stmt).fetchall(), [(2, ), (1, )])
+
+    def test_shared_by_option_engine(self):
+        eng = testing_engine(options={"statement_cache_size": 10})
+        eng.scalar(select([literal(1)]))
+        eng.execution_options(foo="bar").scalar(select([literal(2)]))
+        eq_(self._stats(eng)["hits"], 1)
+
+    def test_disabled(self):
+        eng = testing_engine(options={"statement_cache_size": 0})
+        eq_(self._stats(eng), None)
+
+        stmt = select([literal(1)])
+        with patch.object(
+                stmt, "compile", Mock(side_effect=stmt.compile)) \
+                as compile_mock:
+            eng.execute(stmt)
+            eng.execute(stmt)
+        eq_(compile_mock.call_count, 2)
+
+    def test_disabled_per_connection(self):
+        eng = testing_engine(options={"statement_cache_size": 10})
+        with eng.connect() as conn:
+            conn = conn.execution_options(compiled_cache=None)
+            conn.scalar(select([literal(1)]))
+        eq_(self._stats(eng)["size"], 0)
+
+    def test_uncacheable_statement(self):
+        eng = testing_engine(options={"statement_cache_size": 10})
+        subq = select([literal(1).label('x')]).alias('a')
+        stmt = select([subq.c.x]).with_hint(subq, "foo")
+        eq_(eng.scalar(stmt), 1)
+        eq_(eng.scalar(stmt), 1)
+        eq_(self._stats(eng)["size"], 0)
+
+
 class MockStrategyTest(fixtures.TestBase):
 
     def _engine_fixture(self):
@@ -1083,6 +1368,98 @@ class ExecutionOptionsTest(fixtures.TestBase):
         )
 
 
+class CursorArraysizeTest(fixtures.TablesTest):
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('t', metadata, Column('x', Integer, primary_key=True))
+
+    @classmethod
+    def insert_data(cls):
+        testing.db.execute(
+            cls.tables.t.insert(), [{"x": i} for i in range(1, 11)])
+
+    def _arraysizes(self, eng):
+        canary = []
+
+        @event.listens_for(eng, "before_cursor_execute")
+        def go(conn, cursor, statement, parameters, context, executemany):
+            canary.append(cursor.arraysize)
+        return canary
+
+    def test_dialect_default(self):
+        eng = testing_engine()
+        canary = self._arraysizes(eng)
+        with eng.connect() as conn:
+            conn.execute(select([1]))
+            eq_(
+                canary,
+                [eng.dialect.arraysize or conn.connection.cursor().arraysize]
+            )
+
+    def test_engine_arraysize(self):
+        eng = testing_engine(options={"arraysize": 7})
+        canary = self._arraysizes(eng)
+        eng.execute(select([1]))
+        eq_(canary, [7])
+
+    def test_execution_option(self):
+        eng = testing_engine(options={"arraysize": 7})
+        canary = self._arraysizes(eng)
+        with eng.connect() as conn:
+            conn.execute(select([1]))
+            conn.execution_options(arraysize=3).execute(select([1]))
+            conn.execute(select([1]).execution_options(arraysize=4))
+        eq_(canary, [7, 3, 4])
+
+    def test_prefetch_rows(self):
+        eng = testing_engine(options={"prefetch_rows": 5})
+        eng.dialect._prefetch_rows_attribute = "arraysize"
+        canary = self._arraysizes(eng)
+        with eng.connect() as conn:
+            conn.execute(select([1]))
+            conn.execution_options(prefetch_rows=2).execute(select([1]))
+        eq_(canary, [5, 2])
+
+    def test_prefetch_rows_not_supported(self):
+        eng = testing_engine(options={"prefetch_rows": 5})
+        eng.dialect._prefetch_rows_attribute = None
+        eq_(eng.execute(select([1])).scalar(), 1)
+
+    def test_no_cursor_options(self):
+        eng = testing_engine()
+        eng.dialect.arraysize = None
+        with patch.object(
+                eng.dialect.execution_ctx_cls,
+                "_set_cursor_options") as set_options:
+            with eng.connect() as conn:
+                conn.execute(select([1]))
+                eq_(set_options.call_count, 0)
+
+                conn.execution_options(arraysize=3).execute(select([1]))
+                eq_(set_options.call_count, 1)
+
+    def _test_fetchmany(self, **options):
+        t = self.tables.t
+        with testing.db.connect() as conn:
+            result = conn.execution_options(arraysize=3, **options).\
+                execute(t.select().order_by(t.c.x))
+            eq_([len(rows) for rows in result.partitions()], [3, 3, 3, 1])
+
+    def test_fetchmany(self):
+        self._test_fetchmany()
+
+    def test_fetchmany_buffered(self):
+        self._test_fetchmany(spool_threshold=100000)
+
+    def test_fetchmany_no_arraysize(self):
+        t = self.tables.t
+        with testing.db.connect() as conn:
+            result = conn.execution_options(spool_threshold=100000).\
+                execute(t.select())
+            eq_(len(result.fetchmany()), 10)
+
+
 class EngineEventsTest(fixtures.TestBase):
     __requires__ = 'ad_hoc_engines',
     __backend__ = True
@@ -4,7 +4,8 @@ from sqlalchemy import pool, select, event
 import sqlalchemy as tsa
 from sqlalchemy import testing
 from sqlalchemy.testing.util import gc_collect, lazy_gc
-from sqlalchemy.testing import eq_, assert_raises, is_not_, is_
+from sqlalchemy.testing import eq_, assert_raises, is_not_, is_, \
+    assert_raises_message
 from sqlalchemy.testing.engines import testing_engine
 from sqlalchemy.testing import fixtures
 import random
@@ -1767,6 +1768,196 @@ class QueuePoolTest(PoolTestBase):
         assert p2._reset_on_return is pool.reset_none
         assert p2._use_threadlocal is False
         assert p2._max_overflow == 0
+        assert p2._pool.use_lifo is False
+
+    def test_recreate_lifo(self):
+        p = self._queuepool_fixture(use_lifo=True)
+        p2 = p.recreate()
+        assert p2._pool.use_lifo is True
+
+    def _test_checkout_order(self, use_lifo):
+        p = self._queuepool_fixture(pool_size=3, max_overflow=0,
+                                    use_lifo=use_lifo)
+        conns = [p.connect() for i in range(3)]
+        dbapi_conns = [c.connection for c in conns]
+        for c in conns:
+            c.close()
+
+        c1 = p.connect()
+        c2 = p.connect()
+        return dbapi_conns, [c1.connection, c2.connection]
+
+    def test_fifo(self):
+        dbapi_conns, checked_out = self._test_checkout_order(False)
+        is_(checked_out[0], dbapi_conns[0])
+        is_(checked_out[1], dbapi_conns[1])
+
+    def test_lifo(self):
+        dbapi_conns, checked_out = self._test_checkout_order(True)
+        is_(checked_out[0], dbapi_conns[2])
+        is_(checked_out[1], dbapi_conns[1])
+
+    def test_lifo_steady_load(self):
+        p = self._queuepool_fixture(pool_size=3, max_overflow=0,
+                                    use_lifo=True)
+        conns = [p.connect() for i in range(3)]
+        dbapi_conns = [c.connection for c in conns]
+        for c in conns:
+            c.close()
+
+        # a load of one connection at a time keeps reusing the same
+        # connection, leaving the others idle
+        for i in range(10):
+            c = p.connect()
+            is_(c.connection, dbapi_conns[2])
+            c.close()
+
+    def test_recreate_min_size(self):
+        p = self._queuepool_fixture(pool_size=3, min_size=2)
+        p2 = p.recreate()
+        eq_(p2._min_size, 2)
+        eq_(p2._maintenance_interval, None)
+
+    def test_min_size_exceeds_pool_size(self):
+        assert_raises_message(
+            tsa.exc.ArgumentError,
+            "min_size of 4 may not exceed pool_size of 3",
+            self._queuepool_fixture, pool_size=3, min_size=4
+        )
+
+    def test_prewarm(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, max_overflow=0, min_size=2)
+        eq_(dbapi.connect.call_count, 0)
+
+        p.prewarm()
+        eq_(dbapi.connect.call_count, 2)
+        eq_(p.checkedin(), 2)
+
+        p.prewarm()
+        eq_(dbapi.connect.call_count, 2)
+
+        c1 = p.connect()
+        p.prewarm()
+        eq_(dbapi.connect.call_count, 2)
+        c1.close()
+
+    def test_prewarm_error(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, max_overflow=0, min_size=2)
+        dbapi.shutdown(True)
+        assert_raises(Exception, p.prewarm)
+        eq_(p.overflow(), -3)
+
+        dbapi.shutdown(False)
+        p.prewarm()
+        eq_(p.checkedin(), 2)
+
+    def test_maintain_recycles(self):
+        with patch("sqlalchemy.pool.time.time") as mock:
+            mock.return_value = 10000
+            dbapi, p = self._queuepool_dbapi_fixture(
+                pool_size=3, max_overflow=0, min_size=2, recycle=30)
+            p.prewarm()
+            c1 = p.connect()
+            old = c1.connection
+            c1.close()
+
+            mock.return_value = 10035
+            p._maintain()
+            eq_(dbapi.connect.call_count, 4)
+            eq_(old.close.call_count, 1)
+
+            c1 = p.connect()
+            is_not_(c1.connection, old)
+            eq_(dbapi.connect.call_count, 4)
+            c1.close()
+
+    def test_maintain_checkout_during_refresh(self):
+        with patch("sqlalchemy.pool.time.time") as mock:
+            mock.return_value = 10000
+            dbapi, p = self._queuepool_dbapi_fixture(
+                pool_size=2, max_overflow=5, recycle=30)
+            c1, c2 = p.connect(), p.connect()
+            c1.close()
+            c2.close()
+
+            mock.return_value = 10035
+            checked_out = []
+            create_connection = p._create_connection
+
+            def checkout_then_create():
+                # stale records remain in the pool for checkouts
+                checked_out.append(p.connect())
+                return create_connection()
+
+            with patch.object(
+                    p, "_create_connection", checkout_then_create):
+                p._maintain()
+            eq_(p.overflow(), 0)
+            eq_(p.checkedout(), 2)
+            for conn in checked_out:
+                conn.close()
+            eq_(p.checkedin(), 2)
+
+    def test_maintain_reconnects_and_fills(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, max_overflow=0, min_size=2)
+        c1 = p.connect()
+        c1.invalidate()
+        eq_(dbapi.connect.call_count, 1)
+
+        p._maintain()
+        eq_(dbapi.connect.call_count, 3)
+        eq_(p.checkedin(), 2)
+        assert all(
+            rec.connection is not None for rec in p._pool.queue)
+
+    def test_maintain_error(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, max_overflow=0, min_size=1)
+        c1 = p.connect()
+        c1.invalidate()
+
+        # the error is logged, and the record is returned to the pool
+        dbapi.shutdown(True)
+        p._maintain()
+        eq_(p.checkedin(), 1)
+
+        dbapi.shutdown(False)
+        c1 = p.connect()
+        assert c1.connection is not None
+        c1.close()
+
+    @testing.requires.threading_with_mock
+    def test_maintenance_thread(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, max_overflow=0, min_size=2,
+            maintenance_interval=.01)
+        for i in range(200):
+            if p.checkedin() == 2:
+                break
+            time.sleep(.01)
+        eq_(p.checkedin(), 2)
+
+        p.dispose()
+        assert p._maintenance_stop.is_set()
+
+    def test_engine_prewarm(self):
+        dbapi = MockDBAPI()
+        e = tsa.create_engine(
+            "postgresql://", module=dbapi, pool_min_size=2,
+            _initialize=False)
+        eq_(dbapi.connect.call_count, 2)
+        eq_(e.pool.checkedin(), 2)
+
+    def test_engine_prewarm_error(self):
+        dbapi = MockDBAPI()
+        dbapi.shutdown(True)
+        e = tsa.create_engine(
+            "postgresql://", module=dbapi, pool_min_size=2,
+            _initialize=False)
+        eq_(e.pool.checkedin(), 0)
 
     def test_reconnect(self):
         """tests reconnect operations at the pool level.  SA's
@@ -1916,6 +2107,408 @@ class ResetOnReturnTest(PoolTestBase):
         assert not dbapi.connect().rollback.called
         assert dbapi.connect().commit.called
 
+    def test_skip_unused_reset(self):
+        dbapi, p = self._fixture(pool_size=1, skip_unused_reset=True)
+
+        # a new connection is always reset
+        c1 = p.connect()
+        c1.close()
+        eq_(dbapi.connect().rollback.call_count, 1)
+
+        c1 = p.connect()
+        c1.close()
+        eq_(dbapi.connect().rollback.call_count, 1)
+
+        c1 = p.connect()
+        c1.cursor()
+        c1.close()
+        eq_(dbapi.connect().rollback.call_count, 2)
+
+        c1 = p.connect()
+        c1.close()
+        eq_(dbapi.connect().rollback.call_count, 2)
+
+        c1 = p.connect()
+        c1.some_dbapi_method()
+        c1.close()
+        eq_(dbapi.connect().rollback.call_count, 3)
+
+    def test_skip_unused_reset_commit(self):
+        dbapi, p = self._fixture(
+            pool_size=1, reset_on_return='commit', skip_unused_reset=True)
+
+        c1 = p.connect()
+        c1.close()
+        c1 = p.connect()
+        c1.close()
+        eq_(dbapi.connect().commit.call_count, 1)
+
+    def test_skip_unused_reset_agent(self):
+        dbapi, p = self._fixture(pool_size=1, skip_unused_reset=True)
+
+        c1 = p.connect()
+        c1.close()
+
+        c1 = p.connect()
+        c1._reset_agent = agent = Mock()
+        c1.close()
+        eq_(agent.rollback.call_count, 1)
+
+    def test_skip_unused_reset_checkout_event(self):
+        dbapi, p = self._fixture(pool_size=1, skip_unused_reset=True)
+
+        c1 = p.connect()
+        c1.close()
+
+        event.listen(p, "checkout", Mock())
+        c1 = p.connect()
+        c1.close()
+        eq_(dbapi.connect().rollback.call_count, 2)
+
+    def test_skip_unused_reset_reconnect(self):
+        dbapi, p = self._fixture(pool_size=1, skip_unused_reset=True)
+
+        c1 = p.connect()
+        c1.close()
+
+        c1 = p.connect()
+        c1.invalidate()
+
+        c1 = p.connect()
+        c1.close()
+        eq_(dbapi.connect().rollback.call_count, 2)
+
+    def test_unused_reset_by_default(self):
+        dbapi, p = self._fixture(pool_size=1)
+
+        c1 = p.connect()
+        c1.close()
+        c1 = p.connect()
+        c1.close()
+        eq_(dbapi.connect().rollback.call_count, 2)
+
+    def test_skip_unused_reset_engine(self):
+        dbapi = MockDBAPI()
+        dbapi.connect = Mock(return_value=Mock(
+            cursor=Mock(return_value=Mock(description=None))))
+        e = tsa.create_engine(
+            "postgresql://", module=dbapi, pool_size=1,
+            pool_skip_unused_reset=True, _initialize=False)
+        conn = e.connect()
+        dbapi_conn = conn.connection.connection
+        conn.close()
+        dbapi_conn.rollback.reset_mock()
+
+        e.connect().close()
+        eq_(dbapi_conn.rollback.call_count, 0)
+
+        e.execute("select 1")
+        eq_(dbapi_conn.rollback.call_count, 1)
+
+        with e.begin():
+            pass
+        eq_(dbapi_conn.commit.call_count, 1)
+        eq_(dbapi_conn.rollback.call_count, 2)
+
+        e.connect().close()
+        eq_(dbapi_conn.rollback.call_count, 2)
+
+
+class PoolStatsTest(PoolTestBase):
+
+    def test_counts(self):
+        p = self._queuepool_fixture(
+            stats=True, pool_size=1, max_overflow=1)
+        c1 = p.connect()
+        c2 = p.connect()
+        c2.invalidate()
+        c1.close()
+
+        # the invalidated record reconnects
+        c1 = p.connect()
+
+        stats = p.stats()
+        eq_(
+            dict((k, stats[k]) for k in (
+                'checkouts', 'checkins', 'connects', 'invalidations',
+                'overflow_created', 'timeouts', 'pool_size', 'checkedin',
+                'checkedout', 'overflow')),
+            {
+                'checkouts': 3, 'checkins': 2, 'connects': 3,
+                'invalidations': 1, 'overflow_created': 1, 'timeouts': 0,
+                'pool_size': 1, 'checkedin': 0, 'checkedout': 1,
+                'overflow': 0}
+        )
+        c1.close()
+
+    def test_overflow_created_concurrent(self):
+        p = self._queuepool_fixture(
+            stats=True, pool_size=2, max_overflow=3)
+        conns = []
+
+        def go():
+            conns.append(p.connect())
+
+        threads = [threading.Thread(target=go) for i in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = p.stats()
+        eq_(stats['connects'], 5)
+        eq_(stats['overflow_created'], 3)
+
+    def test_timeout(self):
+        p = self._queuepool_fixture(
+            stats=True, pool_size=1, max_overflow=0, timeout=.1)
+        c1 = p.connect()
+
+        with patch("sqlalchemy.pool.time.time") as mock:
+            # checkout start, timed out
+            mock.side_effect = [100, 100.2]
+            assert_raises(tsa.exc.TimeoutError, p.connect)
+
+        stats = p.stats()
+        eq_(stats['timeouts'], 1)
+        eq_(stats['checkouts'], 1)
+        wait = stats['checkout_wait']
+        eq_(wait['count'], 2)
+        eq_(dict(wait['buckets'])[.1], 1)
+        eq_(dict(wait['buckets'])[.25], 2)
+        c1.close()
+
+    def test_histograms(self):
+        p = self._queuepool_fixture(
+            stats=True, pool_size=1, max_overflow=0)
+
+        with patch("sqlalchemy.pool.time.time") as mock:
+            # checkout start, connection start, connected,
+            # checked out, checked in
+            mock.side_effect = [100, 100, 100.003, 100.004, 100.9]
+            p.connect().close()
+
+            # checkout start, checked out, checked in
+            mock.side_effect = [101, 101.0005, 140]
+            p.connect().close()
+
+        stats = p.stats()
+        eq_(stats['connect_time']['count'], 1)
+        eq_(
+            dict(stats['connect_time']['buckets'])[.005], 1)
+        eq_(
+            dict(stats['connect_time']['buckets'])[.0025], 0)
+
+        wait = stats['checkout_wait']
+        eq_(wait['count'], 2)
+        eq_(dict(wait['buckets'])[.001], 1)
+        eq_(dict(wait['buckets'])[.005], 2)
+        assert abs(wait['sum'] - .0045) < .00001
+
+        hold = stats['hold_time']
+        eq_(hold['count'], 2)
+        eq_(dict(hold['buckets'])[1], 1)
+        # beyond the last bucket
+        eq_(hold['buckets'][-1], (30, 1))
+
+    def test_reset(self):
+        p = self._queuepool_fixture(
+            stats=True, pool_size=1, max_overflow=0)
+        c1 = p.connect()
+        p.reset_stats()
+        c1.close()
+
+        stats = p.stats()
+        eq_(stats['checkouts'], 0)
+        eq_(stats['checkins'], 1)
+        eq_(stats['hold_time']['count'], 1)
+        eq_(stats['checkout_wait']['count'], 0)
+
+    def test_other_pool(self):
+        dbapi = MockDBAPI()
+        p = pool.NullPool(
+            creator=lambda: dbapi.connect('foo.db'), stats=True)
+        p.connect().close()
+        p.connect().close()
+        stats = p.stats()
+        eq_(
+            (stats['checkouts'], stats['checkins'], stats['connects']),
+            (2, 2, 2)
+        )
+
+    def test_not_collected_by_default(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0)
+
+        with patch("sqlalchemy.pool.time.time") as mock:
+            mock.return_value = 100
+            c1 = p.connect()
+            c1.invalidate()
+            c1.close()
+            p.connect().close()
+            p.reset_stats()
+
+        # connecting records the time for pool recycling only
+        eq_(mock.call_count, 2)
+        eq_(
+            p.stats(),
+            {'pool_size': 1, 'checkedin': 1, 'checkedout': 0,
+             'overflow': 0})
+
+    def test_recreate(self):
+        p = self._queuepool_fixture(stats=True, pool_size=1)
+        p2 = p.recreate()
+        p2.connect().close()
+        eq_(p2.stats()['checkouts'], 1)
+
+    def test_create_engine(self):
+        dbapi = MockDBAPI()
+        e = tsa.create_engine(
+            'postgresql://', module=dbapi, _initialize=False,
+            pool_stats=True)
+        e.pool.connect().close()
+        eq_(e.pool.stats()['checkouts'], 1)
+
+        e = tsa.create_engine(
+            'postgresql://', module=dbapi, _initialize=False)
+        e.pool.connect().close()
+        eq_(e.pool.stats().get('checkouts'), None)
+
+
+class PrePingTest(PoolTestBase):
+
+    def _pool_fixture(self, ping_results=None, **kw):
+        dbapi, p = self._queuepool_dbapi_fixture(pre_ping=True, **kw)
+        p._dialect = Mock(
+            do_ping=Mock(side_effect=ping_results or
+                         (lambda conn: True)))
+        return dbapi, p
+
+    def test_ping_each_checkout(self):
+        dbapi, p = self._pool_fixture(pool_size=1, max_overflow=0)
+        c1 = p.connect()
+        dbapi_con = c1.connection
+        c1.close()
+        c1 = p.connect()
+        is_(c1.connection, dbapi_con)
+        c1.close()
+
+        eq_(
+            p._dialect.do_ping.mock_calls,
+            [call(dbapi_con), call(dbapi_con)]
+        )
+
+    def test_no_ping_without_flag(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=1)
+        p._dialect = Mock()
+        p.connect().close()
+        p.connect().close()
+        eq_(p._dialect.do_ping.mock_calls, [])
+
+    def test_failed_ping_invalidates_pool(self):
+        dbapi, p = self._pool_fixture(
+            [True, True, False, True, True],
+            pool_size=2, max_overflow=0)
+        c1 = p.connect()
+        c2 = p.connect()
+        rec1, rec2 = c1._connection_record, c2._connection_record
+        old1, old2 = c1.connection, c2.connection
+        c1.close()
+        c2.close()
+
+        # the failed ping reconnects this connection, and marks
+        # the other connection as stale
+        c1 = p.connect()
+        assert c1.connection is not old1
+        assert c1.connection is not old2
+        eq_(p._dialect.do_close.mock_calls, [call(old1)])
+        eq_(p._dialect.do_ping.mock_calls[2:4],
+            [call(old1), call(c1.connection)])
+
+        c2 = p.connect()
+        assert c2.connection is not old2
+        eq_(p._dialect.do_close.mock_calls, [call(old1), call(old2)])
+        eq_(set([rec1, rec2]),
+            set([c1._connection_record, c2._connection_record]))
+        eq_(len(dbapi.connect.mock_calls), 4)
+        c1.close()
+        c2.close()
+
+    def test_ping_error_raised(self):
+        dbapi, p = self._pool_fixture(
+            [True, Exception("unrelated error"), True],
+            pool_size=1, max_overflow=0)
+        c1 = p.connect()
+        dbapi_con = c1.connection
+        c1.close()
+
+        assert_raises_message(
+            Exception, "unrelated error",
+            p.connect
+        )
+        c1 = p.connect()
+        is_(c1.connection, dbapi_con)
+        c1.close()
+
+    def test_ping_window(self):
+        dbapi, p = self._pool_fixture(
+            pool_size=1, max_overflow=0, pre_ping_window=10)
+
+        with patch("sqlalchemy.pool.time.time") as mock:
+            mock.return_value = 1000
+            c1 = p.connect()
+            c1.close()
+
+            # returned to the pool within the window
+            mock.return_value = 1005
+            c1 = p.connect()
+            eq_(p._dialect.do_ping.mock_calls, [])
+            c1.close()
+
+            mock.return_value = 1015
+            c1 = p.connect()
+            eq_(p._dialect.do_ping.mock_calls, [call(c1.connection)])
+            c1.close()
+
+    def test_ping_window_skip_unused_reset(self):
+        dbapi, p = self._pool_fixture(
+            pool_size=1, max_overflow=0, pre_ping_window=10,
+            skip_unused_reset=True)
+
+        with patch("sqlalchemy.pool.time.time") as mock:
+            # a new connection is always reset
+            mock.return_value = 1000
+            c1 = p.connect()
+            c1.close()
+            eq_(p._dialect.do_rollback.call_count, 1)
+
+            # no ping within the window; the connection is unused
+            mock.return_value = 1005
+            c1 = p.connect()
+            c1.close()
+            eq_(p._dialect.do_ping.call_count, 0)
+            eq_(p._dialect.do_rollback.call_count, 1)
+
+            # the ping uses the connection, so it's reset
+            mock.return_value = 1020
+            c1 = p.connect()
+            c1.close()
+            eq_(p._dialect.do_ping.call_count, 1)
+            eq_(p._dialect.do_rollback.call_count, 2)
+
+    def test_ping_requires_dialect(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pre_ping=True)
+        assert_raises_message(
+            NotImplementedError,
+            "The ping feature requires that a dialect is passed",
+            p.connect
+        )
+
+    def test_recreate(self):
+        dbapi, p = self._pool_fixture(pre_ping_window=5)
+        p2 = p.recreate()
+        eq_(p2._pre_ping, True)
+        eq_(p2._pre_ping_window, 5)
+
 
 class SingletonThreadPoolTest(PoolTestBase):
 
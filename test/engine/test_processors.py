@@ -1,3 +1,5 @@
+import datetime
+import decimal
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import assert_raises_message, eq_
 
@@ -146,6 +148,100 @@ class CDateProcessorTest(_DateProcessorTest):
         cls.module = cprocessors
 
 
+class _ProcessRowsTest(fixtures.TestBase):
+    def test_no_processors(self):
+        eq_(
+            self.module.process_rows([(1, "a"), [2, "b"]], [None, None]),
+            [(1, "a"), (2, "b")]
+        )
+
+    def test_no_rows(self):
+        eq_(self.module.process_rows([], [self.module.to_float]), [])
+
+    def test_processors(self):
+        eq_(
+            self.module.process_rows(
+                [
+                    (1, "2012-10-15", "x", 0, None),
+                    (2, "2013-01-01", "y", 5, "z")
+                ],
+                [
+                    self.module.to_float, self.module.str_to_date,
+                    lambda value: value.upper(), self.module.int_to_boolean,
+                    None
+                ]
+            ),
+            [
+                (1.0, datetime.date(2012, 10, 15), "X", False, None),
+                (2.0, datetime.date(2013, 1, 1), "Y", True, "z")
+            ]
+        )
+
+    def test_processor_none_value(self):
+        eq_(
+            self.module.process_rows(
+                [(None, None)],
+                [self.module.str_to_datetime, self.module.to_str]),
+            [(None, None)]
+        )
+
+    def test_processor_error(self):
+        assert_raises_message(
+            ValueError,
+            "Couldn't parse date string: '5:a'",
+            self.module.process_rows,
+            [("2012-10-15", ), ("5:a", )], [self.module.str_to_date]
+        )
+
+    def test_python_processor_error(self):
+        def process(value):
+            raise KeyError(value)
+
+        assert_raises_message(
+            KeyError,
+            "5",
+            self.module.process_rows, [(5, )], [process]
+        )
+
+    def test_column_count_mismatch(self):
+        assert_raises_message(
+            ValueError,
+            "row has 3 columns; 2 processors were given",
+            self.module.process_rows, [(1, 2, 3)], [None, None]
+        )
+
+
+class PyProcessRowsTest(_ProcessRowsTest):
+    @classmethod
+    def setup_class(cls):
+        from sqlalchemy import processors
+        cls.module = type(
+            "util", (object,),
+            dict(
+                (k, staticmethod(v))
+                for k, v in list(processors.py_fallback().items())
+            )
+        )
+
+
+class CProcessRowsTest(_ProcessRowsTest):
+    __requires__ = ('cextensions',)
+
+    @classmethod
+    def setup_class(cls):
+        from sqlalchemy import cprocessors
+        cls.module = cprocessors
+
+    def test_decimal_processor(self):
+        from sqlalchemy import cprocessors
+        process = cprocessors.DecimalResultProcessor(
+            decimal.Decimal, "%.2f").process
+        eq_(
+            cprocessors.process_rows([(1.5, ), (None, )], [process]),
+            [(decimal.Decimal("1.50"), ), (None, )]
+        )
+
+
 class _DistillArgsTest(fixtures.TestBase):
     def test_distill_none(self):
         eq_(
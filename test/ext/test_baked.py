@@ -295,7 +295,10 @@ class LikeQueryTest(BakedTest):
             u1 = bq(sess).get(7)
             eq_(u1.name, 'jack')
             sess.close()
-        eq_(len(bq._bakery), 4)
+
+        # the new get clause is baked into a new query; its compiled
+        # form is equivalent to that of the previous one and is shared
+        eq_(len(bq._bakery), 3)
 
 
 class ResultTest(BakedTest):
@@ -2034,6 +2034,18 @@ class FilterTest(QueryTest, AssertsCompiledSQL):
         assert [User(id=8), User(id=9)] == \
             create_session().query(User).filter(User.name.endswith('ed')).all()
 
+    def test_in_exceeding_max_bind_parameters(self):
+        User = self.classes.User
+
+        sess = create_session()
+        with mock.patch.object(
+                testing.db.dialect, "max_bind_parameters", 5):
+            eq_(
+                sess.query(User).filter(
+                    User.id.in_(range(1, 10))).order_by(User.id).all(),
+                [User(id=7), User(id=8), User(id=9)]
+            )
+
     def test_contains(self):
         """test comparing a collection to an object instance."""
 
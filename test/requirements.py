@@ -563,6 +563,10 @@ class DefaultRequirements(SuiteRequirements):
     def json_array_indexes(self):
         return self.json_type + fails_if("+pg8000")
 
+    @property
+    def json_deferred(self):
+        return self.json_type
+
     @property
     def datetime_literals(self):
         """target dialect supports rendering of a date, time, or datetime as a
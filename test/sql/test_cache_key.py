@@ -0,0 +1,220 @@
+from sqlalchemy import select, func, bindparam, text, cast, case, \
+    Integer, String, MetaData, and_, literal_column
+from sqlalchemy.sql import table, column
+from sqlalchemy import testing
+from sqlalchemy.testing import fixtures, eq_, is_, ne_
+from sqlalchemy.testing.schema import Table, Column
+
+metadata = MetaData()
+
+table1 = table('mytable',
+               column('myid', Integer),
+               column('name', String),
+               column('description', String),
+               )
+
+table2 = Table('othertable', metadata,
+               Column('otherid', Integer, primary_key=True),
+               Column('othername', String(30)),
+               )
+
+
+class CacheKeyTest(fixtures.TestBase):
+
+    def _assert_same(self, fn):
+        k1, k2 = fn()._generate_cache_key(), fn()._generate_cache_key()
+        eq_(k1[0], k2[0])
+        eq_(hash(k1[0]), hash(k2[0]))
+        return k1, k2
+
+    def _assert_different(self, *stmts):
+        keys = [stmt._generate_cache_key()[0] for stmt in stmts]
+        eq_(len(set(keys)), len(keys))
+
+    def test_select_equivalent(self):
+        self._assert_same(
+            lambda: select([table1.c.myid, table1.c.name]).
+            where(table1.c.myid == 5).order_by(table1.c.name)
+        )
+
+    def test_table_equivalent(self):
+        self._assert_same(
+            lambda: select([table2]).where(
+                and_(table2.c.otherid == 5, table2.c.othername != 'x'))
+        )
+
+    def test_anonymous_equivalent(self):
+        def go():
+            a = table1.alias()
+            expr = func.count(a.c.myid)
+            return select([expr, (a.c.myid + 5).label(None)]).\
+                select_from(a).group_by(a.c.name).as_scalar()
+        self._assert_same(go)
+
+    def test_misc_equivalent(self):
+        self._assert_same(
+            lambda: select([
+                cast(table1.c.myid, String),
+                case([(table1.c.myid > 5, 'x')], else_='y'),
+                func.row_number().over(order_by=table1.c.name),
+                text("foo = :bar").bindparams(bar=5),
+            ]).limit(10)
+        )
+
+    def test_expanding_equivalent(self):
+        counter = iter(range(1, 10))
+
+        def go():
+            values = list(range(next(counter)))
+            return select([table1.c.myid]).where(
+                table1.c.myid.in_(
+                    bindparam('ids', value=values, expanding=True)))
+        k1, k2 = self._assert_same(go)
+        eq_([b.value for b in k1[1]], [[0]])
+        eq_([b.value for b in k2[1]], [[0, 1]])
+
+    def test_dml_equivalent(self):
+        self._assert_same(
+            lambda: table2.update().where(table2.c.otherid == 7).
+            values(othername=bindparam('name'))
+        )
+        self._assert_same(
+            lambda: table2.insert().values(othername='x')
+        )
+        self._assert_same(
+            lambda: table2.delete().where(table2.c.otherid.in_([1, 2]))
+        )
+
+    def test_bound_values_extracted(self):
+        k1, k2 = (
+            select([table1]).where(table1.c.myid == value).
+            _generate_cache_key()
+            for value in (5, 10)
+        )
+        eq_(k1[0], k2[0])
+        eq_([b.value for b in k1[1]], [5])
+        eq_([b.value for b in k2[1]], [10])
+
+    def test_dml_literal_values_extracted(self):
+        k1, k2 = (
+            table2.update().values(othername=value, otherid=5).
+            _generate_cache_key()
+            for value in ('x', 'y')
+        )
+        eq_(k1[0], k2[0])
+        eq_([b.value for b in k1[1]], ['x', 5])
+        eq_([b.value for b in k2[1]], ['y', 5])
+
+    def test_dml_multi_values_extracted(self):
+        k1, k2 = (
+            table2.insert().values(
+                [{"othername": value}, {"othername": value + 'z'}]).
+            _generate_cache_key()
+            for value in ('x', 'y')
+        )
+        eq_(k1[0], k2[0])
+        eq_([b.value for b in k1[1]], ['x', 'xz'])
+        eq_([b.value for b in k2[1]], ['y', 'yz'])
+
+    def test_memoized_key_reset_on_copy(self):
+        stmt = select([table1.c.myid]).where(table1.c.myid == 5)
+        key = stmt._memoized_cache_key
+        is_(stmt._memoized_cache_key, key)
+
+        stmt2 = stmt.where(table1.c.name == 'x')
+        ne_(stmt2._memoized_cache_key[0], key[0])
+        is_(stmt._clone()._memoized_cache_key is key, False)
+
+    def test_key_follows_in_place_mutation(self):
+        for mutate in (
+            lambda stmt: stmt.append_column(table1.c.name),
+            lambda stmt: stmt.append_whereclause(table1.c.myid == 5),
+            lambda stmt: stmt.append_having(table1.c.myid == 5),
+            lambda stmt: stmt.append_from(table2),
+            lambda stmt: stmt.append_order_by(table1.c.name),
+            lambda stmt: stmt.append_group_by(table1.c.name),
+            lambda stmt: stmt.append_correlation([table2]),
+        ):
+            stmt = select([table1.c.myid])
+            key = stmt._generate_cache_key()
+            mutate(stmt)
+            ne_(stmt._generate_cache_key()[0], key[0])
+
+    def test_key_follows_nested_mutation(self):
+        sub = select([table1.c.myid, table1.c.name])
+        outer = select([sub.alias().c.myid])
+        key = outer._generate_cache_key()
+        sub.append_whereclause(table1.c.myid > 2)
+        ne_(outer._generate_cache_key()[0], key[0])
+
+    def test_repeated_bindparam_extracted_once(self):
+        b = bindparam('x', 5)
+        key, bindparams = select([table1]).where(
+            table1.c.myid == b).where(table1.c.name == b).\
+            _generate_cache_key()
+        eq_(bindparams, [b])
+
+    def test_structure_distinguished(self):
+        self._assert_different(
+            select([table1.c.myid]),
+            select([table1.c.name]),
+            select([table1.c.myid]).where(table1.c.myid == 5),
+            select([table1.c.myid]).where(table1.c.myid > 5),
+            select([table1.c.myid]).where(table1.c.myid == 'x'),
+            select([table1.c.myid]).where(
+                table1.c.myid.in_(bindparam('x', expanding=True))),
+            select([table1.c.myid]).where(
+                table1.c.myid.in_([5, 6])),
+            select([table1.c.myid.label('foo')]),
+            select([table1.c.myid.label('bar')]),
+            select([cast(table1.c.myid, String(10))]),
+            select([cast(table1.c.myid, String(20))]),
+            select([table1.c.myid]).limit(5),
+            select([table1.c.myid]).limit(10),
+            select([table1.c.myid]).distinct(),
+            select([table2.c.otherid]),
+            select([literal_column('otherid')]),
+            table2.insert(),
+            table2.insert().values(othername='x'),
+            table2.insert().values(otherid=5),
+            table2.insert().values(othername=table1.c.name),
+            table2.update(),
+            table2.delete(),
+        )
+
+    def test_hints_not_cacheable(self):
+        is_(
+            select([table2]).with_hint(table2, 'foo')._generate_cache_key(),
+            None
+        )
+
+    def test_text_not_equivalent_to_other_text(self):
+        ne_(
+            text("select 1")._generate_cache_key()[0],
+            text("select 2")._generate_cache_key()[0]
+        )
+
+
+class InPlaceMutationTest(fixtures.TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('t', metadata,
+              Column('id', Integer, primary_key=True),
+              Column('x', Integer))
+
+    @classmethod
+    def insert_data(cls):
+        cls.tables.t.insert().execute(
+            [{"id": i, "x": i * 10} for i in range(1, 6)])
+
+    def test_nested_mutation(self):
+        t = self.tables.t
+        sub = select([t.c.id, t.c.x])
+        outer = select([sub.alias('a').c.id])
+        eq_(len(testing.db.execute(outer).fetchall()), 5)
+
+        sub.append_whereclause(t.c.id > 2)
+        sub.append_whereclause(t.c.id < 5)
+        eq_(sorted(testing.db.execute(outer).fetchall()), [(3, ), (4, )])
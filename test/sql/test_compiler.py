@@ -1336,6 +1336,56 @@ class SelectTest(fixtures.TestBase, AssertsCompiledSQL):
             dialect=mysql.dialect()
         )
 
+    def test_in_list_exceeding_max_bind_parameters(self):
+        dialect = default.DefaultDialect(max_bind_parameters=3)
+
+        self.assert_compile(
+            select([table1.c.myid]).where(table1.c.myid.in_([1, 2, 3])),
+            "SELECT mytable.myid FROM mytable "
+            "WHERE mytable.myid IN (:myid_1, :myid_2, :myid_3)",
+            dialect=dialect
+        )
+
+        self.assert_compile(
+            select([table1.c.myid]).where(
+                table1.c.myid.notin_([1, 2, 3, 4])).where(
+                table1.c.name == 'n'),
+            "SELECT mytable.myid FROM mytable "
+            "WHERE mytable.myid NOT IN (1, 2, 3, 4) "
+            "AND mytable.name = :name_1",
+            dialect=dialect
+        )
+
+        # a list containing other expressions is left alone
+        self.assert_compile(
+            select([table1.c.myid]).where(
+                table1.c.myid.in_([1, 2, 3, table1.c.myid + 1])),
+            "SELECT mytable.myid FROM mytable WHERE mytable.myid IN "
+            "(:myid_1, :myid_2, :myid_3, mytable.myid + :myid_4)",
+            dialect=dialect
+        )
+
+        # as is a list of values whose literals may not compare the same
+        self.assert_compile(
+            select([table1.c.myid]).where(
+                column('data', types.LargeBinary).in_(
+                    [util.b('a'), util.b('b'), util.b('c'), util.b('d')])),
+            "SELECT mytable.myid FROM mytable WHERE data IN "
+            "(:data_1, :data_2, :data_3, :data_4)",
+            dialect=dialect
+        )
+
+    def test_in_list_exceeding_max_bind_parameters_escaping(self):
+        dialect = mysql.dialect(max_bind_parameters=2)
+
+        self.assert_compile(
+            select([table1.c.myid]).where(
+                table1.c.name.in_(["a'", "b\\", "c"])),
+            "SELECT mytable.myid FROM mytable "
+            "WHERE mytable.name IN ('a''', 'b\\\\', 'c')",
+            dialect=dialect
+        )
+
     @testing.emits_warning('.*empty sequence.*')
     def test_render_binds_as_literal(self):
         """test a compiler that renders binds inline into
@@ -1045,3 +1045,59 @@ class MultirowTest(_InsertTestBase, fixtures.TablesTest, AssertsCompiledSQL):
             "SQL expression is required",
             table.insert().values(values).compile
         )
+
+
+class InsertManyValuesCompileTest(
+        _InsertTestBase, fixtures.TablesTest, AssertsCompiledSQL):
+    __dialect__ = 'default'
+
+    def test_named_row_template(self):
+        table1 = self.tables.mytable
+
+        stmt = table1.insert().values(
+            myid=bindparam('id'), name=bindparam('idname'))
+        compiled = stmt.compile(
+            dialect=default.DefaultDialect(), column_keys=['id', 'idname'])
+
+        eq_(
+            compiled._insertmanyvalues[0:3],
+            ('INSERT INTO mytable (myid, name) VALUES ',
+             '(:id, :idname)', '')
+        )
+        eq_(
+            compiled._insertmanyvalues_row_template.format(2),
+            '(:id__2, :idname__2)'
+        )
+
+    def test_positional_row_template(self):
+        table1 = self.tables.mytable
+
+        compiled = table1.insert().compile(
+            dialect=postgresql.dialect(paramstyle='format'))
+        eq_(
+            compiled._insertmanyvalues[1],
+            '(%s, %s, %s)'
+        )
+        eq_(compiled._insertmanyvalues[3], ['myid', 'name', 'description'])
+        eq_(compiled._insertmanyvalues_row_template, None)
+
+    def test_returning_suffix(self):
+        table1 = self.tables.mytable
+
+        compiled = table1.insert().returning(table1.c.myid).compile(
+            dialect=postgresql.dialect())
+        eq_(compiled._insertmanyvalues[2], ' RETURNING mytable.myid')
+
+    def test_not_for_multirow(self):
+        table1 = self.tables.mytable
+
+        compiled = table1.insert().values(
+            [{'myid': 1}, {'myid': 2}]).compile()
+        eq_(compiled._insertmanyvalues, None)
+
+    def test_not_for_from_select(self):
+        table1 = self.tables.mytable
+
+        compiled = table1.insert().from_select(
+            ['myid'], select([table1.c.myid])).compile()
+        eq_(compiled._insertmanyvalues, None)
@@ -1,9 +1,11 @@
+import contextlib
 from sqlalchemy.testing import eq_, assert_raises_message, is_
+from sqlalchemy.testing.mock import patch
 from sqlalchemy import testing
 from sqlalchemy.testing import fixtures, engines
 from sqlalchemy import (
     exc, sql, String, Integer, MetaData, and_, ForeignKey,
-    VARCHAR, INT, Sequence, func)
+    VARCHAR, INT, Sequence, func, select, event)
 from sqlalchemy.testing.schema import Table, Column
 
 
@@ -443,3 +445,259 @@ class TableInsertTest(fixtures.TablesTest):
             (1, 'data', 5),
             inserted_primary_key=[]
         )
+
+
+@contextlib.contextmanager
+def _dialect_fixture(event_name, record, **kw):
+    """patch the given attributes onto the testing dialect, yielding a
+    connection along with a list of ``record(*args)`` for each
+    ``event_name`` event on it."""
+
+    canary = []
+
+    with patch.multiple(testing.db.dialect, **kw):
+        with testing.db.connect() as conn:
+            @event.listens_for(conn, event_name)
+            def listener(*args):
+                canary.append(record(*args))
+
+            yield conn, canary
+
+
+class InsertManyValuesTest(fixtures.TablesTest):
+    """test executemany() rendered as batches of multi-row INSERT
+    statements."""
+
+    run_deletes = 'each'
+    __requires__ = 'multivalues_inserts',
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            'data', metadata,
+            Column(
+                'id', Integer, primary_key=True,
+                test_needs_autoincrement=True),
+            Column('x', String(50)),
+            Column('y', Integer, default=5)
+        )
+
+    def _fixture(self, **kw):
+        params = {"use_insertmanyvalues": True}
+        params.update(kw)
+
+        def record(
+                conn, cursor, statement, parameters, context, executemany):
+            return statement, executemany
+
+        return _dialect_fixture("before_cursor_execute", record, **params)
+
+    def test_batches(self):
+        data = self.tables.data
+
+        with self._fixture(insertmanyvalues_page_size=3) as (conn, canary):
+            result = conn.execute(
+                data.insert(), [{"x": "d%d" % i} for i in range(7)])
+
+            eq_(len(canary), 3)
+            eq_([executemany for stmt, executemany in canary], [False] * 3)
+            eq_(result.rowcount, 7)
+            eq_(
+                conn.execute(
+                    select([data.c.x, data.c.y]).order_by(data.c.id)
+                ).fetchall(),
+                [("d%d" % i, 5) for i in range(7)]
+            )
+
+    def test_page_size_execution_option(self):
+        data = self.tables.data
+
+        with self._fixture() as (conn, canary):
+            conn.execution_options(insertmanyvalues_page_size=2).execute(
+                data.insert(), [{"x": "d%d" % i} for i in range(5)])
+
+            eq_(len(canary), 3)
+
+    def test_max_bind_parameters(self):
+        data = self.tables.data
+
+        with self._fixture(max_bind_parameters=5) as (conn, canary):
+            result = conn.execute(
+                data.insert(), [{"x": "d%d" % i} for i in range(5)])
+
+            # two parameters per row
+            eq_(len(canary), 3)
+            eq_(result.context.statement_count, 3)
+            eq_(conn.scalar(select([func.count(data.c.id)])), 5)
+
+    def test_single_row_not_batched(self):
+        data = self.tables.data
+
+        with self._fixture(insertmanyvalues_page_size=3) as (conn, canary):
+            conn.execute(data.insert(), {"x": "d1"})
+
+            eq_(len(canary), 1)
+            eq_(conn.scalar(select([data.c.x])), "d1")
+
+    def test_not_enabled(self):
+        data = self.tables.data
+
+        with self._fixture(use_insertmanyvalues=False) as (conn, canary):
+            result = conn.execute(
+                data.insert(), [{"x": "d%d" % i} for i in range(5)])
+
+            eq_([executemany for stmt, executemany in canary], [True])
+            eq_(result.context.statement_count, 1)
+
+    @testing.requires.returning
+    def test_returning(self):
+        data = self.tables.data
+
+        with self._fixture(insertmanyvalues_page_size=3) as (conn, canary):
+            result = conn.execute(
+                data.insert().returning(data.c.x, data.c.y),
+                [{"x": "d%d" % i} for i in range(7)])
+
+            eq_(len(canary), 3)
+            eq_(result.fetchall(), [("d%d" % i, 5) for i in range(7)])
+
+
+class IteratorParametersTest(fixtures.TablesTest):
+    """test an iterator of parameter sets passed to Connection.execute(),
+    consumed in chunks."""
+
+    run_deletes = 'each'
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            'data', metadata,
+            Column('id', Integer, primary_key=True, autoincrement=False),
+            Column('x', String(50)),
+            test_needs_acid=True
+        )
+
+    def _fixture(self, **kw):
+        def record(conn, clauseelement, multiparams, params):
+            return multiparams
+
+        return _dialect_fixture("before_execute", record, **kw)
+
+    def _rows(self, count):
+        return ({"id": i, "x": "d%d" % i} for i in range(count))
+
+    def _assert_data(self, conn, count):
+        data = self.tables.data
+        eq_(
+            conn.execute(select([data.c.x]).order_by(data.c.id)).fetchall(),
+            [("d%d" % i, ) for i in range(count)]
+        )
+
+    def test_chunks(self):
+        data = self.tables.data
+
+        with self._fixture(executemany_chunk_size=3) as (conn, canary):
+            result = conn.execute(data.insert(), self._rows(7))
+
+            eq_([len(multiparams[0]) for multiparams in canary], [3, 3, 1])
+            eq_(result.rowcount, 7)
+            self._assert_data(conn, 7)
+
+    def test_exact_multiple(self):
+        data = self.tables.data
+
+        with self._fixture(executemany_chunk_size=3) as (conn, canary):
+            conn.execute(data.insert(), self._rows(6))
+
+            eq_([len(multiparams[0]) for multiparams in canary], [3, 3])
+            self._assert_data(conn, 6)
+
+    def test_chunk_size_execution_option(self):
+        data = self.tables.data
+
+        with self._fixture(executemany_chunk_size=3) as (conn, canary):
+            conn.execution_options(executemany_chunk_size=2).execute(
+                data.insert(), self._rows(5))
+
+            eq_([len(multiparams[0]) for multiparams in canary], [2, 2, 1])
+            self._assert_data(conn, 5)
+
+    def test_empty_iterator(self):
+        data = self.tables.data
+
+        with self._fixture(executemany_chunk_size=3) as (conn, canary):
+            result = conn.execute(data.insert(), iter([]))
+
+            assert result.closed
+            eq_(result.rowcount, 0)
+            eq_(result.context.statement_count, 0)
+            eq_(canary, [])
+            assert not conn.closed
+            assert not conn.in_transaction()
+            self._assert_data(conn, 0)
+
+    def test_connectionless(self):
+        data = self.tables.data
+
+        with patch.multiple(testing.db.dialect, executemany_chunk_size=2):
+            result = testing.db.execute(data.insert(), self._rows(5))
+
+            eq_(result.rowcount, 5)
+            assert result.connection.closed
+            with testing.db.connect() as conn:
+                self._assert_data(conn, 5)
+
+            result = testing.db.execute(data.insert(), iter([]))
+            assert result.closed
+            eq_(result.rowcount, 0)
+            assert result.connection.closed
+
+    def test_list_not_chunked(self):
+        data = self.tables.data
+
+        with self._fixture(executemany_chunk_size=3) as (conn, canary):
+            conn.execute(data.insert(), list(self._rows(7)))
+
+            eq_(len(canary), 1)
+            self._assert_data(conn, 7)
+
+    def test_update_rowcount(self):
+        data = self.tables.data
+
+        with self._fixture(executemany_chunk_size=2) as (conn, canary):
+            conn.execute(data.insert(), list(self._rows(5)))
+            result = conn.execute(
+                data.update().where(data.c.id == sql.bindparam('pk')),
+                ({"pk": i, "x": "u%d" % i} for i in range(5)))
+
+            eq_(len(canary), 4)
+            if testing.db.dialect.supports_sane_multi_rowcount:
+                eq_(result.rowcount, 5)
+
+    def test_failure_rolls_back(self):
+        data = self.tables.data
+
+        def rows():
+            for row in self._rows(5):
+                yield row
+            yield {"id": 0, "x": "duplicate"}
+
+        with self._fixture(executemany_chunk_size=2) as (conn, canary):
+            assert_raises_message(
+                exc.IntegrityError, "",
+                conn.execute, data.insert(), rows())
+            eq_(len(canary), 3)
+            self._assert_data(conn, 0)
+
+    def test_enclosing_transaction(self):
+        data = self.tables.data
+
+        with self._fixture(executemany_chunk_size=2) as (conn, canary):
+            trans = conn.begin()
+            conn.execute(data.insert(), self._rows(5))
+            assert conn.in_transaction()
+            trans.rollback()
+
+            self._assert_data(conn, 0)
@@ -22,7 +22,7 @@ from sqlalchemy.dialects import mysql, firebird, postgresql, oracle, \
 from sqlalchemy import util
 import datetime
 import collections
-from sqlalchemy import text, literal_column
+from sqlalchemy import text, literal_column, bindparam
 from sqlalchemy import and_, not_, between, or_
 
 
@@ -1786,6 +1786,30 @@ class InTest(fixtures.TestBase, testing.AssertsCompiledSQL):
         self.assert_compile(~self.table1.c.myid.in_([]),
                             "mytable.myid = mytable.myid")
 
+    def test_in_expanding(self):
+        self.assert_compile(
+            self.table1.c.myid.in_(bindparam('ids', expanding=True)),
+            "mytable.myid IN ([EXPANDING_ids])"
+        )
+
+    def test_notin_expanding(self):
+        self.assert_compile(
+            self.table1.c.myid.notin_(bindparam('ids', expanding=True)),
+            "mytable.myid NOT IN ([EXPANDING_ids])"
+        )
+
+    def test_in_expanding_literal_binds(self):
+        self.assert_compile(
+            self.table1.c.myid.in_(
+                bindparam('ids', value=[1, 2, 3], expanding=True)),
+            "mytable.myid IN (1, 2, 3)",
+            literal_binds=True
+        )
+
+    def test_in_expanding_type_from_column(self):
+        expr = self.table1.c.myid.in_(bindparam('ids', expanding=True))
+        is_(expr.right.type._type_affinity, Integer)
+
 
 class MathOperatorTest(fixtures.TestBase, testing.AssertsCompiledSQL):
     __dialect__ = 'default'
@@ -2,11 +2,12 @@ from sqlalchemy.testing import eq_, assert_raises_message, assert_raises, \
     is_, in_, not_in_
 from sqlalchemy import testing
 from sqlalchemy.testing import fixtures, engines
+from sqlalchemy.testing.mock import patch
 from sqlalchemy import (
     exc, sql, func, select, String, Integer, MetaData, and_, ForeignKey,
     union, intersect, except_, union_all, VARCHAR, INT, text,
     bindparam, literal, not_, literal_column, desc, asc,
-    TypeDecorator, or_, cast)
+    TypeDecorator, or_, cast, LargeBinary, util)
 from sqlalchemy.engine import default
 from sqlalchemy.testing.schema import Table, Column
 
@@ -492,6 +493,204 @@ class QueryTest(fixtures.TestBase):
         r = s.execute().fetchall()
         assert len(r) == 1
 
+    def test_expanding_in(self):
+        testing.db.execute(
+            users.insert(),
+            [
+                dict(user_id=7, user_name='jack'),
+                dict(user_id=8, user_name='fred'),
+                dict(user_id=9, user_name=None)
+            ]
+        )
+
+        stmt = select([users.c.user_id]).where(
+            users.c.user_id.in_(bindparam('uids', expanding=True))
+        ).order_by(users.c.user_id)
+
+        cache = {}
+        with testing.db.connect() as conn:
+            conn = conn.execution_options(compiled_cache=cache)
+            for uids, expected in [
+                ([7], [(7, )]),
+                ([8, 7], [(7, ), (8, )]),
+                ([9, 7, 8, 10], [(7, ), (8, ), (9, )]),
+                ([9, 7, 8, 10, 11, 12], [(7, ), (8, ), (9, )]),
+            ]:
+                eq_(conn.execute(stmt, {"uids": uids}).fetchall(), expected)
+
+        # one compiled form serves all lengths
+        eq_(len(cache), 1)
+
+    def test_expanding_in_bind_processing(self):
+        class Lower(TypeDecorator):
+            impl = String
+
+            def process_bind_param(self, value, dialect):
+                return value.lower()
+
+        testing.db.execute(
+            users.insert(),
+            [
+                dict(user_id=7, user_name='jack'),
+                dict(user_id=8, user_name='fred'),
+            ]
+        )
+
+        stmt = select([users.c.user_id]).where(
+            users.c.user_name.in_(
+                bindparam('names', type_=Lower, expanding=True))
+        ).where(users.c.user_id > bindparam('uid')).\
+            order_by(users.c.user_id)
+
+        eq_(
+            testing.db.execute(
+                stmt, {"names": ['JACK', 'Fred'], "uid": 5}).fetchall(),
+            [(7, ), (8, )]
+        )
+
+    def test_expanding_in_max_bind_parameters(self):
+        testing.db.execute(
+            users.insert(),
+            [dict(user_id=i, user_name='n%d' % i) for i in range(1, 11)]
+        )
+
+        stmt = select([users.c.user_id]).where(
+            users.c.user_id.in_(bindparam('uids', expanding=True))
+        ).where(
+            users.c.user_name.in_(bindparam('names', expanding=True))
+        ).order_by(users.c.user_id)
+
+        with patch.object(testing.db.dialect, "max_bind_parameters", 5), \
+                testing.db.connect() as conn:
+            # fits within the limit; both lists are bound
+            result = conn.execute(
+                stmt, {"uids": [1, 2, 3], "names": ["n1", "n3"]})
+            eq_(result.fetchall(), [(1, ), (3, )])
+            eq_(result.context.statement.count("1, 2, 3"), 0)
+
+            # the longest list is rendered inline
+            result = conn.execute(
+                stmt, {"uids": list(range(1, 7)), "names": ["n2", "n5"]})
+            eq_(result.fetchall(), [(2, ), (5, )])
+            eq_(result.context.statement.count("1, 2, 3, 4, 5, 6"), 1)
+            eq_(result.context.statement_count, 1)
+
+    def test_expanding_in_max_bind_parameters_quoting(self):
+        names = ["n'%d" % i for i in range(1, 6)] + ["n\\6"]
+        testing.db.execute(
+            users.insert(),
+            [dict(user_id=i, user_name=name)
+             for i, name in enumerate(names, 1)]
+        )
+
+        stmt = select([users.c.user_id]).where(
+            users.c.user_name.in_(bindparam('names', expanding=True))
+        ).order_by(users.c.user_id)
+
+        with patch.object(testing.db.dialect, "max_bind_parameters", 5), \
+                testing.db.connect() as conn:
+            result = conn.execute(stmt, {"names": names})
+            eq_(result.fetchall(), [(i, ) for i in range(1, 7)])
+            eq_(result.context.statement.count("'n''1'"), 1)
+
+    def test_in_max_bind_parameters(self):
+        testing.db.execute(
+            users.insert(),
+            [dict(user_id=i, user_name='n%d' % i) for i in range(1, 11)]
+        )
+
+        with patch.object(testing.db.dialect, "max_bind_parameters", 5), \
+                testing.db.connect() as conn:
+            conn = conn.execution_options(compiled_cache=None)
+
+            # a list longer than the limit is rendered inline
+            result = conn.execute(
+                select([users.c.user_id]).where(
+                    users.c.user_id.in_(range(1, 8))
+                ).order_by(users.c.user_id))
+            eq_(result.fetchall(), [(i, ) for i in range(1, 8)])
+
+            # lists which exceed the limit only together are sent as
+            # is; the database reports an actual overflow
+            result = conn.execute(
+                select([users.c.user_id]).where(
+                    users.c.user_id.in_(range(1, 5))
+                ).where(
+                    users.c.user_name.in_(['n1', 'n2', 'n3', 'n4'])
+                ).order_by(users.c.user_id))
+            eq_(result.fetchall(), [(i, ) for i in range(1, 5)])
+
+    def test_expanding_in_max_bind_parameters_binary(self):
+        values = [util.b('x%d' % i) for i in range(10)]
+        stmt = select([literal(1)]).where(
+            literal(util.b('x3'), LargeBinary).in_(
+                bindparam('vals', expanding=True)))
+
+        with patch.object(testing.db.dialect, "max_bind_parameters", 5), \
+                testing.db.connect() as conn:
+            conn = conn.execution_options(compiled_cache=None)
+
+            # binary values aren't rendered inline
+            result = conn.execute(stmt, {"vals": values})
+            eq_(result.fetchall(), [(1, )])
+            eq_(len(result.context.parameters[0]), 12)
+
+    def test_expanding_in_empty(self):
+        stmt = select([users.c.user_id]).where(
+            users.c.user_id.in_(bindparam('uids', expanding=True)))
+
+        assert_raises_message(
+            exc.StatementError,
+            "'expanding' parameters can't be used with an empty list",
+            testing.db.execute, stmt, {"uids": []}
+        )
+
+    def test_expanding_in_named_paramstyle(self):
+        testing.db.execute(
+            users.insert(),
+            [
+                dict(user_id=7, user_name='jack'),
+                dict(user_id=8, user_name='fred'),
+                dict(user_id=9, user_name=None)
+            ]
+        )
+
+        with patch.multiple(
+                testing.db.dialect, paramstyle='named', positional=False):
+            with testing.db.connect() as conn:
+                conn = conn.execution_options(compiled_cache=None)
+                stmt = select([users.c.user_id]).where(
+                    users.c.user_id.in_(
+                        bindparam('uids', value=[7, 9], expanding=True,
+                                  unique=True))).order_by(users.c.user_id)
+                eq_(conn.execute(stmt).fetchall(), [(7, ), (9, )])
+
+    def test_expanding_in_numeric_paramstyle(self):
+        with patch.multiple(
+                testing.db.dialect, paramstyle='numeric', positional=True):
+            with testing.db.connect() as conn:
+                conn = conn.execution_options(compiled_cache=None)
+                stmt = select([users.c.user_id]).where(
+                    users.c.user_id.in_(bindparam('uids', expanding=True)))
+                assert_raises_message(
+                    exc.StatementError,
+                    "'expanding' parameters can't be used with the "
+                    "'numeric' paramstyle",
+                    conn.execute, stmt, {"uids": [7]}
+                )
+
+    def test_expanding_in_executemany(self):
+        stmt = users.update().where(
+            users.c.user_id.in_(bindparam('uids', expanding=True))).\
+            values(user_name=bindparam('name'))
+
+        assert_raises_message(
+            exc.StatementError,
+            "'expanding' parameters can't be used with executemany()",
+            testing.db.execute, stmt,
+            [{"uids": [7], "name": "x"}, {"uids": [8], "name": "y"}]
+        )
+
 
 class RequiredBindTest(fixtures.TablesTest):
     run_create_tables = None
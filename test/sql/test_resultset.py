@@ -9,6 +9,8 @@ from sqlalchemy import (
     TypeDecorator, table, column, literal)
 from sqlalchemy.engine import result as _result
 from sqlalchemy.testing.schema import Table, Column
+import array
+import itertools
 import operator
 from sqlalchemy.testing import assertions
 from sqlalchemy import exc as sa_exc
@@ -1632,6 +1634,134 @@ class AlternateResultProxyTest(fixtures.TablesTest):
     def test_basic_buffered_column_result_proxy(self):
         self._test_proxy(_result.BufferedColumnResultProxy)
 
+    def _test_fetch_columns(self, cls):
+        with self._proxy_fixture(cls):
+            with patch.object(_result, "_numpy", lambda: None):
+                r = self.engine.execute(
+                    select([self.table]).order_by(self.table.c.x))
+                cols = r.fetch_columns(4)
+                eq_(list(cols), ['x', 'y'])
+                assert isinstance(cols['x'], array.array)
+                eq_(list(cols['x']), [1, 2, 3, 4])
+                eq_(cols['y'], ["t_%d" % i for i in range(1, 5)])
+                assert isinstance(cols['y'][0], util.text_type)
+
+                cols = r.fetch_columns()
+                eq_(list(cols['x']), list(range(5, 12)))
+
+                cols = r.fetch_columns()
+                eq_(list(cols['x']), [])
+                eq_(cols['y'], [])
+
+                r.close()
+                assert_raises_message(
+                    sa_exc.ResourceClosedError,
+                    "object is closed",
+                    r.fetch_columns
+                )
+
+    def test_fetch_columns_plain(self):
+        self._test_fetch_columns(_result.ResultProxy)
+
+    def test_fetch_columns_buffered_row_result_proxy(self):
+        self._test_fetch_columns(_result.BufferedRowResultProxy)
+
+    def test_fetch_columns_fully_buffered_result_proxy(self):
+        self._test_fetch_columns(_result.FullyBufferedResultProxy)
+
+    def test_fetch_columns_buffered_column_result_proxy(self):
+        self._test_fetch_columns(_result.BufferedColumnResultProxy)
+
+    def _test_block_processing(self, cls, uses_blocks):
+        process_rows = Mock(side_effect=_result._processors.process_rows)
+
+        with self._proxy_fixture(cls):
+            with patch.object(
+                    _result._processors, "process_rows", process_rows):
+                r = self.engine.execute(
+                    select([self.table]).order_by(self.table.c.x))
+                rows = r.fetchmany(4)
+                eq_(rows, [(i, "t_%d" % i) for i in range(1, 5)])
+                eq_(rows[1].y, "t_2")
+                assert isinstance(rows[1]['y'], util.text_type)
+
+                rows = r.fetchall()
+                eq_(rows, [(i, "t_%d" % i) for i in range(5, 12)])
+                eq_(rows[-1][self.table.c.y], "t_11")
+
+        eq_(process_rows.call_count, 2 if uses_blocks else 0)
+
+    @testing.requires.cextensions
+    def test_block_processing_plain(self):
+        self._test_block_processing(_result.ResultProxy, True)
+
+    @testing.requires.cextensions
+    def test_block_processing_buffered_column(self):
+        self._test_block_processing(_result.BufferedColumnResultProxy, True)
+
+    def test_block_processing_python_processors(self):
+        canary, stmt = self._lazy_fixture()
+        process_rows = Mock(side_effect=_result._processors.process_rows)
+
+        for cls in (_result.ResultProxy, _result.BufferedColumnResultProxy):
+            with self._proxy_fixture(cls):
+                with patch.object(
+                        _result._processors, "process_rows", process_rows):
+                    r = self.engine.execute(stmt)
+                    eq_(r.fetchmany(2), [(1, 10, 10), (2, 20, 20)])
+                    eq_(r.fetchall()[-1], (11, 110, 110))
+
+        eq_(process_rows.call_count, 0)
+
+    def test_fetch_columns_nulls(self):
+        table = self.tables.test
+        with patch.object(_result, "_numpy", lambda: None):
+            cols = self.engine.execute(
+                select([
+                    table.c.x,
+                    sql.case([(table.c.x > 1, None)], else_=table.c.x).
+                    label('z')
+                ]).where(table.c.x < 3).order_by(table.c.x)
+            ).fetch_columns()
+        assert isinstance(cols['x'], array.array)
+        eq_(cols['z'], [1, None])
+
+    def _mixed_fixture(self):
+        table = self.tables.test
+        return self.engine.execute(
+            select([
+                sql.case(
+                    [(table.c.x == 2, literal_column('2.5', Integer)),
+                     (table.c.x == 3, literal_column("'3'", Integer))],
+                    else_=table.c.x).label('z')
+            ]).where(table.c.x < 4).order_by(table.c.x)
+        )
+
+    def test_fetch_columns_mixed(self):
+        with patch.object(_result, "_numpy", lambda: None):
+            cols = self._mixed_fixture().fetch_columns()
+        eq_(cols['z'], [1, 2.5, '3'])
+
+    @testing.skip_if(
+        lambda: _result._numpy() is None, "numpy is not installed")
+    def test_fetch_columns_mixed_numpy(self):
+        numpy = _result._numpy()
+        cols = self._mixed_fixture().fetch_columns()
+        eq_(cols['z'].dtype, numpy.dtype(object))
+        eq_(cols['z'].tolist(), [1, 2.5, '3'])
+
+    @testing.skip_if(
+        lambda: _result._numpy() is None, "numpy is not installed")
+    def test_fetch_columns_numpy(self):
+        numpy = _result._numpy()
+        table = self.tables.test
+        cols = self.engine.execute(
+            select([table]).order_by(table.c.x)).fetch_columns()
+        eq_(cols['x'].dtype, numpy.dtype('int64'))
+        eq_(cols['x'].tolist(), list(range(1, 12)))
+        eq_(cols['y'].dtype, numpy.dtype(object))
+        eq_(cols['y'].tolist(), ["t_%d" % i for i in range(1, 12)])
+
     def test_resultprocessor_plain(self):
         self._test_result_processor(_result.ResultProxy, False)
 
@@ -1674,6 +1804,318 @@ class AlternateResultProxyTest(fixtures.TablesTest):
                     r = conn.execute(stmt)
                     eq_(r.scalar(), "HI THERE")
 
+    def _buffer_sizes(self, **options):
+        with self._proxy_fixture(_result.BufferedRowResultProxy):
+            with self.engine.connect() as conn:
+                conn.execute(self.table.insert(), [
+                    {'x': i, 'y': "t_%d" % i} for i in range(15, 200)
+                ])
+                result = conn.execution_options(**options).execute(
+                    self.table.select()
+                )
+                sizes = [len(result._BufferedRowResultProxy__rowbuffer)]
+                while True:
+                    result._BufferedRowResultProxy__rowbuffer.clear()
+                    if result._fetchone_impl() is None:
+                        return sizes
+                    sizes.append(
+                        len(result._BufferedRowResultProxy__rowbuffer) + 1)
+
+    def test_row_buffer_size_option(self):
+        sizes = self._buffer_sizes(row_buffer_size=40)
+        eq_(sizes, [40, 40, 40, 40, 36])
+
+    def test_max_row_buffer_bytes_option(self):
+        with patch.object(_result, "_row_size", lambda row: 100):
+            sizes = self._buffer_sizes(max_row_buffer_bytes=2000)
+        eq_(sizes[0:6], [1, 5, 10, 20, 20, 20])
+
+    def test_row_buffer_latency_option(self):
+        # each fetch appears to take 0.5 seconds
+        with patch.object(
+                util.compat, "time_func",
+                Mock(side_effect=itertools.count(0, .5))):
+            sizes = self._buffer_sizes(row_buffer_latency=2)
+        eq_(sizes[0:6], [1, 2, 4, 8, 16, 32])
+
+    def test_row_buffer_latency_option_max_row_buffer(self):
+        with patch.object(
+                util.compat, "time_func",
+                Mock(side_effect=itertools.count(0, .5))):
+            sizes = self._buffer_sizes(
+                row_buffer_latency=2, max_row_buffer=10)
+        eq_(sizes[0:6], [1, 2, 4, 8, 10, 10])
+
+    def test_row_buffer_latency_option_shrink(self):
+        # each fetch appears to take twice as long as the target
+        with patch.object(
+                util.compat, "time_func",
+                Mock(side_effect=itertools.count(0, .5))):
+            sizes = self._buffer_sizes(row_buffer_latency=.25)
+        eq_(set(sizes), set([1]))
+
+    def test_partitions(self):
+        with self.engine.connect() as conn:
+            table = self.tables.test
+            result = conn.execute(table.select().order_by(table.c.x))
+            eq_(
+                [[row.x for row in partition]
+                 for partition in result.partitions(4)],
+                [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11]]
+            )
+            eq_(result.fetchall(), [])
+
+    def test_spool_threshold(self):
+        table = self.tables.test
+        with patch.object(
+                _result.FullyBufferedResultProxy, "_spool_fetch_size", 2):
+            with self.engine.connect() as conn:
+                r = conn.execution_options(spool_threshold=300).execute(
+                    select([table]).order_by(table.c.x))
+                assert isinstance(r, _result.FullyBufferedResultProxy)
+
+                spool = r._FullyBufferedResultProxy__rowbuffer
+                assert spool._mmap is not None
+                assert 0 < len(spool._memory) < 11
+
+                eq_(
+                    [r.fetchone() for i in range(3)],
+                    [(i, "t_%d" % i) for i in range(1, 4)])
+                eq_(r.fetchmany(5), [(i, "t_%d" % i) for i in range(4, 9)])
+                eq_(r.fetchall(), [(i, "t_%d" % i) for i in range(9, 12)])
+                is_(spool._mmap, None)
+                eq_(r.fetchone(), None)
+
+    def test_spool_threshold_close(self):
+        table = self.tables.test
+        with self.engine.connect() as conn:
+            r = conn.execution_options(spool_threshold=0).execute(
+                select([table]).order_by(table.c.x))
+            spool = r._FullyBufferedResultProxy__rowbuffer
+            eq_(r.fetchone(), (1, "t_1"))
+
+            r.close()
+            is_(spool._file, None)
+            is_(spool._mmap, None)
+
+    def test_lazy_row_processing_plain(self):
+        self._test_lazy_row_processing(_result.ResultProxy)
+
+    def test_lazy_row_processing_buffered_row(self):
+        self._test_lazy_row_processing(_result.BufferedRowResultProxy)
+
+    def test_lazy_row_processing_fully_buffered(self):
+        self._test_lazy_row_processing(_result.FullyBufferedResultProxy)
+
+    def _lazy_fixture(self):
+        canary = Mock(side_effect=lambda value: value * 10)
+
+        class MyType(TypeDecorator):
+            impl = Integer()
+
+            def process_result_value(self, value, dialect):
+                return canary(value)
+
+        stmt = select([
+            self.tables.test.c.x,
+            type_coerce(self.tables.test.c.x, MyType()).label('y'),
+            type_coerce(self.tables.test.c.x, MyType()).label('z')
+        ]).order_by(self.tables.test.c.x)
+        return canary, stmt
+
+    def _test_lazy_row_processing(self, cls):
+        canary, stmt = self._lazy_fixture()
+
+        with self._proxy_fixture(cls):
+            with self.engine.connect() as conn:
+                conn = conn.execution_options(lazy_row_processing=True)
+                rows = conn.execute(stmt).fetchall()
+                eq_(canary.call_count, 0)
+
+                eq_(rows[0].y, 10)
+                eq_(rows[0]['y'], 10)
+                eq_(rows[0][1], 10)
+                eq_(canary.call_count, 1)
+
+                eq_(rows[1][1:], (20, 20))
+                eq_(canary.call_count, 3)
+
+                eq_(list(rows[1]), [2, 20, 20])
+                eq_(rows[2], (3, 30, 30))
+                eq_(rows[2].values(), [3, 30, 30])
+                eq_(canary.call_count, 5)
+
+                row = conn.execute(stmt).first()
+                eq_(row[self.tables.test.c.x], 1)
+                eq_(canary.call_count, 5)
+
+    def test_lazy_row_processing_pickle(self):
+        canary, stmt = self._lazy_fixture()
+        with self.engine.connect() as conn:
+            row = conn.execution_options(lazy_row_processing=True).\
+                execute(stmt).first()
+            eq_(row.y, 10)
+
+            row = util.pickle.loads(util.pickle.dumps(row))
+            eq_(row, (1, 10, 10))
+            eq_(row.z, 10)
+            eq_(canary.call_count, 2)
+
+    def test_lazy_row_processing_fetch_columns(self):
+        canary, stmt = self._lazy_fixture()
+        with self.engine.connect() as conn:
+            cols = conn.execution_options(lazy_row_processing=True).\
+                execute(stmt).fetch_columns()
+            eq_(list(cols['y']), [i * 10 for i in range(1, 12)])
+
+    def test_lazy_row_processing_buffered_column(self):
+        canary, stmt = self._lazy_fixture()
+
+        with self._proxy_fixture(_result.BufferedColumnResultProxy):
+            with self.engine.connect() as conn:
+                row = conn.execution_options(lazy_row_processing=True).\
+                    execute(stmt).first()
+                # rows are always processed up front
+                eq_(canary.call_count, 2)
+                eq_(row, (1, 10, 10))
+
+    def test_compact_rows_plain(self):
+        self._test_compact_rows(_result.ResultProxy)
+
+    def test_compact_rows_buffered_row(self):
+        self._test_compact_rows(_result.BufferedRowResultProxy)
+
+    def test_compact_rows_fully_buffered(self):
+        self._test_compact_rows(_result.FullyBufferedResultProxy)
+
+    def test_compact_rows_buffered_column(self):
+        self._test_compact_rows(_result.BufferedColumnResultProxy)
+
+    def _test_compact_rows(self, cls):
+        canary, stmt = self._lazy_fixture()
+        t = self.tables.test
+
+        with self._proxy_fixture(cls):
+            with self.engine.connect() as conn:
+                conn = conn.execution_options(compact_rows=True)
+                rows = conn.execute(stmt).fetchall()
+                eq_(canary.call_count, 22)
+
+                row = rows[1]
+                eq_(type(row).__bases__, (_result.CompactRow, ))
+                is_(type(row), type(rows[0]))
+                eq_(row, (2, 20, 20))
+                eq_(row[0], 2)
+                eq_(row[-1], 20)
+                eq_(row[1:], (20, 20))
+                eq_(row['y'], 20)
+                eq_(row.z, 20)
+                eq_(row[t.c.x], 2)
+                eq_(row.keys(), ['x', 'y', 'z'])
+                eq_(row.items(), [('x', 2), ('y', 20), ('z', 20)])
+                assert row.has_key('y')
+                assert not row.has_key('q')
+
+                assert_raises(sa_exc.NoSuchColumnError, lambda: row['q'])
+                assert_raises(AttributeError, getattr, row, 'q')
+
+                row = conn.execute(stmt).first()
+                eq_(row, (1, 10, 10))
+                is_(type(row), type(rows[0]))
+
+    def test_metadata_copy(self):
+        with self.engine.connect() as conn:
+            metadata = conn.execution_options(compact_rows=True).\
+                execute(select([self.tables.test]))._metadata
+            copied = metadata._copy()
+            for attr in metadata.__slots__:
+                if attr in ('_adapted', '_without_processors', '_batch'):
+                    is_(getattr(copied, attr), None)
+                else:
+                    is_(getattr(copied, attr), getattr(metadata, attr))
+
+    def test_compact_rows_no_dict(self):
+        with self.engine.connect() as conn:
+            row = conn.execution_options(compact_rows=True).\
+                execute(select([self.tables.test])).first()
+            assert isinstance(row, tuple)
+            assert not hasattr(row, '__dict__')
+
+    def test_compact_rows_textual(self):
+        with self.engine.connect() as conn:
+            conn = conn.execution_options(compact_rows=True)
+            row = conn.execute("select x from test where x=1").first()
+            eq_(row['x'], 1)
+            x = column('x')
+            eq_(row[x], 1)
+            not_in_(x, type(row)._index)
+
+            row2 = conn.execute("select x from test where x=2").first()
+            is_(type(row2), type(row))
+            eq_(row2[x], 2)
+
+            # the cached metadata isn't added to by row lookups
+            for metadata in conn.dialect._textual_result_cache.values():
+                not_in_(x, metadata._keymap)
+
+    def test_compact_rows_ambiguous(self):
+        with self.engine.connect() as conn:
+            row = conn.execution_options(compact_rows=True).execute(select([
+                literal_column('1').label('somecol'),
+                literal_column('1').label('somecol'),
+            ])).first()
+            assert_raises_message(
+                sa_exc.InvalidRequestError,
+                "Ambiguous column name",
+                lambda: row['somecol']
+            )
+
+    def test_compact_rows_pickle(self):
+        canary, stmt = self._lazy_fixture()
+        with self.engine.connect() as conn:
+            rows = conn.execution_options(compact_rows=True).\
+                execute(stmt).fetchall()
+
+        rows = util.pickle.loads(util.pickle.dumps(rows))
+        eq_(rows[0], (1, 10, 10))
+        eq_(rows[1].y, 20)
+        eq_(rows[1]['z'], 20)
+        is_(type(rows[0]), type(rows[1]))
+
+    def test_textual_metadata_cached(self):
+        with patch.object(
+                _result, "ResultMetaData",
+                Mock(side_effect=_result.ResultMetaData)) as md:
+            with self.engine.connect() as conn:
+                eq_(
+                    conn.execute(
+                        "select x, y from test where x=1").first()[0],
+                    1)
+                eq_(
+                    conn.execute(
+                        text("select x, y from test where x=2")).first().x,
+                    2)
+                eq_(
+                    conn.execute(
+                        "select x, y from test where x=3").first()['x'],
+                    3)
+                eq_(md.call_count, 1)
+
+                row = conn.execute("select y, x from test where x=4").first()
+                eq_(row['x'], 4)
+                eq_(md.call_count, 2)
+
+    def test_textual_metadata_keymap_not_shared(self):
+        with self.engine.connect() as conn:
+            x = column('x')
+            r1 = conn.execute("select x, y from test where x=1")
+            eq_(r1.first()[x], 1)
+            in_(x, r1._metadata._keymap)
+
+            r2 = conn.execute("select x, y from test where x=2")
+            not_in_(x, r2._metadata._keymap)
+            eq_(r2.first()[x], 2)
+
     def test_buffered_row_growth(self):
         with self._proxy_fixture(_result.BufferedRowResultProxy):
             with self.engine.connect() as conn:
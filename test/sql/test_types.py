@@ -1,8 +1,9 @@
 # coding: utf-8
-from sqlalchemy.testing import eq_, is_, assert_raises, \
+from sqlalchemy.testing import eq_, is_, in_, assert_raises, \
     assert_raises_message, expect_warnings
 import decimal
 import datetime
+import json
 import os
 from sqlalchemy import (
     Unicode, MetaData, PickleType, Boolean, TypeDecorator, Integer,
@@ -1550,6 +1551,49 @@ class BinaryTest(fixtures.TestBase, AssertsExecutionResults):
         b = LargeBinary()
         eq_(b.bind_processor(default.DefaultDialect()), None)
 
+    def test_as_buffer(self):
+        data = os.urandom(500)
+        binary_table.insert().execute(primary_id=1, data=data)
+        value = testing.db.scalar(
+            select([type_coerce(binary_table.c.data,
+                                LargeBinary(as_buffer=True))]))
+        eq_(bytes(value), data)
+
+    def test_as_stream(self):
+        data = os.urandom(500)
+        binary_table.insert().execute(primary_id=1, data=data)
+        binary_table.insert().execute(primary_id=2, data=None)
+        stream, null = [
+            row[0] for row in testing.db.execute(
+                select([type_coerce(binary_table.c.data,
+                                    LargeBinary(as_stream=True))]).
+                order_by(binary_table.c.primary_id))
+        ]
+        is_(null, None)
+        eq_(stream.read(200), data[0:200])
+        eq_(stream.read(200), data[200:400])
+        eq_(stream.read(), data[400:])
+        eq_(stream.read(), util.b(""))
+
+    def test_stream_reads_buffer(self):
+        stream = types.BinaryStream(memoryview(util.b("some data")))
+        buf = bytearray(4)
+        eq_(stream.readinto(buf), 4)
+        eq_(bytes(buf), util.b("some"))
+        eq_(stream.read(), util.b(" data"))
+
+    def test_as_buffer_as_stream_exclusive(self):
+        assert_raises_message(
+            exc.ArgumentError,
+            "The as_buffer and as_stream flags are mutually exclusive",
+            LargeBinary, as_buffer=True, as_stream=True
+        )
+
+    def test_adapt_flags(self):
+        t1 = LargeBinary(as_stream=True).adapt(dialects.postgresql.BYTEA)
+        is_(t1.as_stream, True)
+        is_(t1.as_buffer, False)
+
     def load_stream(self, name):
         f = os.path.join(os.path.dirname(__file__), "..", name)
         with open(f, mode='rb') as o:
@@ -1569,6 +1613,7 @@ class JSONTest(fixtures.TestBase):
         self.dialect = default.DefaultDialect()
         self.dialect._json_serializer = None
         self.dialect._json_deserializer = None
+        self.dialect._json_deferred = False
 
     def test_bind_serialize_default(self):
         proc = self.test_table.c.test_column.type._cached_bind_processor(
@@ -1630,6 +1675,47 @@ class JSONTest(fixtures.TestBase):
             None
         )
 
+    def test_result_deserialize_deferred(self):
+        self.dialect._json_deferred = True
+        self.dialect._json_deserializer = deserializer = mock.Mock(
+            side_effect=json.loads)
+        proc = self.test_table.c.test_column.type._cached_result_processor(
+            self.dialect, None)
+
+        value = proc('{"A": [1, 2, 3, true, false], "B": null}')
+        assert isinstance(value, types.DeferredJSON)
+        eq_(value.raw, '{"A": [1, 2, 3, true, false], "B": null}')
+        eq_(deserializer.mock_calls, [])
+
+        eq_(value['A'], [1, 2, 3, True, False])
+        eq_(sorted(value.keys()), ['A', 'B'])
+        eq_(len(value), 2)
+        in_('B', value)
+        eq_(value, {"A": [1, 2, 3, True, False], "B": None})
+        eq_(
+            deserializer.mock_calls,
+            [mock.call('{"A": [1, 2, 3, true, false], "B": null}')])
+
+        eq_(proc(None), None)
+
+    def test_deferred_pickle(self):
+        value = types.DeferredJSON('{"A": [1, 2]}')
+        for loads, dumps in picklers():
+            copy = loads(dumps(value))
+            eq_(copy.raw, '{"A": [1, 2]}')
+            eq_(copy, {"A": [1, 2]})
+
+    def test_bind_serialize_deferred(self):
+        self.dialect._json_serializer = serializer = mock.Mock(
+            side_effect=json.dumps)
+        proc = self.test_table.c.test_column.type._cached_bind_processor(
+            self.dialect)
+        eq_(
+            proc(types.DeferredJSON('{"A":  [1, 2, 3]}')),
+            '{"A":  [1, 2, 3]}'
+        )
+        eq_(serializer.mock_calls, [])
+
 
 class ArrayTest(fixtures.TestBase):
 